@@ -0,0 +1,146 @@
+"""Deterministic generator of synthetic test modules for benchmarks.
+
+Generated modules resemble real test suites: test functions with docstrings
+following Docstring Validator schema (some of them intentionally broken),
+helper functions and filler code to control file size.
+"""
+import random
+import subprocess
+from pathlib import Path
+from typing import List, NamedTuple
+
+VALID_DOCSTRING = '''"""Verify {subject} after {action}.
+
+    During field tests it was discovered that {subject} fails after
+    {count} attempts performed within {count} minutes.
+
+    Test steps:
+    1. Perform {action} {count} times
+    2. Verify {subject}
+    3. Revert to initial configuration
+
+    Pass criteria:
+    - {subject} is correct after each attempt
+    - Initial configuration is restored
+
+    Fail criteria:
+    - {subject} is not correct after any attempt
+
+    Reference: BUG{count}, BUG{bug}
+    """'''
+
+# docstrings violating schema in different ways
+INVALID_DOCSTRINGS = [
+    '"""Verify {subject}."""',
+    '''"""Verify {subject} after {action}.
+
+    Test steps:
+    1. Perform {action}
+    3. Verify {subject}
+
+    Pass criteria:
+    - {subject} is correct
+
+    Fail criteria:
+    - {subject} is not correct
+    """''',
+    '''"""Verify {subject} after {action}.
+
+    Test steps:
+    1. Perform {action}
+
+    Pass criteria:
+    {subject} is correct
+    """''',
+    None,
+]
+
+SUBJECTS = ["gateway address", "routing table", "boot sequence", "DNS cache"]
+ACTIONS = ["power reset", "configuration change", "firmware upgrade", "reconnect"]
+
+
+class CorpusConfig(NamedTuple):
+    """Parameters of generated corpus."""
+
+    files: int = 100  # number of generated modules
+    functions: int = 50  # number of test functions per module
+    valid_ratio: float = 0.8  # fraction of test functions with valid docstring
+    filler_lines: int = 5  # lines of code in body of each function
+    seed: int = 0  # seed for random generator
+
+
+def generate_module(rng: random.Random, config: CorpusConfig) -> str:
+    """Generates source of a single test module."""
+    lines = ['"""Synthetic test module generated for benchmarks."""', "import os"]
+    lines.extend(["", "import pytest"])
+    for i in range(config.functions):
+        lines.extend(["", ""])
+        if rng.random() < 0.2:
+            lines.append("@pytest.mark.parametrize('value', [1, 2, 3])")
+        lines.append(f"def test_case_{i}(value=None):")
+
+        template = VALID_DOCSTRING
+        if rng.random() >= config.valid_ratio:
+            template = rng.choice(INVALID_DOCSTRINGS)
+        if template is not None:
+            docstring = template.format(
+                subject=rng.choice(SUBJECTS),
+                action=rng.choice(ACTIONS),
+                count=rng.randint(2, 9),
+                bug=rng.randint(1000, 9999),
+            )
+            lines.append(f"    {docstring}")
+
+        for j in range(config.filler_lines):
+            lines.append(f"    result_{j} = os.path.join('dir_{i}', 'file_{j}')")
+        lines.append("    assert value is None or value > 0")
+
+        if i % 10 == 0:
+            lines.extend(["", "", f"def helper_{i}():", "    return None"])
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(root: Path, config: CorpusConfig) -> List[Path]:
+    """Writes generated modules into `root` directory.
+
+    Returns:
+        Paths of generated modules
+    """
+    rng = random.Random(config.seed)
+    paths = []
+    for i in range(config.files):
+        path = root / f"package_{i % 10}" / f"test_module_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate_module(rng, config))
+        paths.append(path)
+    return paths
+
+
+def generate_git_repo(root: Path, config: CorpusConfig, changed: int) -> List[Path]:
+    """Creates git repository with committed corpus and staged changes.
+
+    First `changed` modules are regenerated with different seed and staged,
+    so staged diff contains modified functions in each of them.
+
+    Returns:
+        Paths of modules with staged changes
+    """
+    paths = generate_corpus(root, config)
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "Initial corpus")
+
+    rng = random.Random(config.seed + 1)
+    staged = paths[:changed]
+    for path in staged:
+        path.write_text(generate_module(rng, config))
+    _git(root, "add", *[str(path.relative_to(root)) for path in staged])
+    return staged
+
+
+def _git(root: Path, *args: str):
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", *args],
+        cwd=root,
+        check=True,
+    )
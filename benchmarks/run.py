@@ -0,0 +1,239 @@
+"""Benchmarks for Docstring Validator pipeline stages.
+
+Each stage is timed separately on a synthetic corpus:
+* discovery - finding and reading files, reading staged git diffs
+* parsing - building symbol index of each module, with `ast` and `tokenize`
+  parsers
+* validation - validating docstrings of test functions
+* reporting - formatting detected errors
+* end to end - complete `analyze_files` run, starting with empty validation
+  memo, and with memo filled by previous runs
+
+Peak memory allocated by python (measured with tracemalloc in a separate run)
+is reported for discovery and end to end stages.
+
+Results are written to JSON file, which can be passed with `--compare` to
+a later run to detect regressions between versions. Example usage:
+
+    % python -m benchmarks.run --files 200 --output before.json
+    % python -m benchmarks.run --files 200 --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import docstring_validator
+from benchmarks.corpus import CorpusConfig, generate_corpus, generate_git_repo
+from docstring_validator import code_parser, diff_util, reporter, schema_plan
+from docstring_validator import docstring_validator as validator_module
+from docstring_validator.docstring_model import Docstring
+
+NAME_PATTERN = r"test_\w+"
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    memory: bool = False,
+    setup: Optional[Callable[[], object]] = None,
+) -> Dict[str, float]:
+    """Times function call `repeat` times.
+
+    Args:
+        func: measured function
+        repeat: number of timed runs
+        memory: measure peak memory in additional run, as tracing slows it down
+        setup: function called before each run, not included in timings
+
+    Returns:
+        Dictionary with timing statistics in seconds and optionally peak memory
+        in bytes.
+    """
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    results = dict(
+        min=min(runs), median=statistics.median(runs), mean=statistics.mean(runs)
+    )
+    if memory:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            func()
+            results["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return results
+
+
+def find_all_func_names(corpus: Path) -> int:
+    """Streams files from corpus searching for test functions."""
+    count = 0
+    for file in diff_util.iter_files([corpus]):
+        count += len(diff_util.find_func_names(file.content, NAME_PATTERN))
+    return count
+
+
+def run_benchmarks(root: Path, config: CorpusConfig, repeat: int) -> Dict[str, dict]:
+    """Generates corpus in `root` and times all pipeline stages."""
+    corpus = root / "corpus"
+    generate_corpus(corpus, config)
+    repo = root / "repo"
+    generate_git_repo(repo, config._replace(files=min(config.files, 20)), changed=5)
+
+    results = {}
+    results["discovery.iter_files"] = measure(
+        lambda: find_all_func_names(corpus), repeat, memory=True
+    )
+    results["discovery.iter_diffs"] = measure(
+        lambda: list(diff_util.iter_diffs(repo)), repeat
+    )
+
+    sources = [(file.path, file.source) for file in diff_util.iter_files([corpus])]
+    results["parsing"] = measure(
+        lambda: [code_parser.parse_source(source, path) for path, source in sources],
+        repeat,
+    )
+    results["parsing.tokenize"] = measure(
+        lambda: [
+            code_parser.parse_source(source, path, "tokenize")
+            for path, source in sources
+        ],
+        repeat,
+    )
+
+    indexes = [code_parser.parse_source(source, path) for path, source in sources]
+    docstrings = [
+        func.docstring
+        for index in indexes
+        for func in index.functions
+        if func.name.startswith("test_")
+    ]
+    results["validation.docstring_model"] = measure(
+        lambda: [Docstring(docstring).validate() for docstring in docstrings], repeat
+    )
+    plan = schema_plan.get_plan()
+    results["validation.plan"] = measure(
+        lambda: [plan.validate(docstring) for docstring in docstrings], repeat
+    )
+
+    errors, symbols = {}, {}
+    for index in indexes:
+        file_errors = {
+            func.name: plan.validate(func.docstring)
+            for func in index.functions
+            if func.name.startswith("test_")
+        }
+        errors[index.path] = {func: e for func, e in file_errors.items() if e}
+        symbols[index.path] = index
+    results["reporting"] = measure(
+        lambda: reporter.report_errors(errors, symbols), repeat
+    )
+
+    # every run starts with empty validation memo, as a new CLI process
+    results["end_to_end.analyze_files"] = measure(
+        lambda: docstring_validator.analyze_files([corpus], NAME_PATTERN),
+        repeat,
+        memory=True,
+        setup=validator_module.reset_memo,
+    )
+    # memo filled by previous runs, as in long-running daemon
+    results["end_to_end.warm_memo"] = measure(
+        lambda: docstring_validator.analyze_files([corpus], NAME_PATTERN), repeat
+    )
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict]) -> List[str]:
+    """Prepares comparison of median timings against baseline results."""
+    lines = [f"{'stage':<30} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for stage, timings in results.items():
+        if stage not in baseline:
+            continue
+        old, new = baseline[stage]["median"], timings["median"]
+        ratio = new / old if old else float("inf")
+        lines.append(f"{stage:<30} {old:>10.4f} {new:>10.4f} {ratio:>7.2f}")
+        if "peak_memory" in timings and "peak_memory" in baseline[stage]:
+            old, new = baseline[stage]["peak_memory"], timings["peak_memory"]
+            ratio = new / old if old else float("inf")
+            name = f"{stage} (MiB)"
+            lines.append(
+                f"{name:<30} {old / 2**20:>10.2f} {new / 2**20:>10.2f} {ratio:>7.2f}"
+            )
+    return lines
+
+
+def get_args(args) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Docstring Validator benchmarks")
+    parser.add_argument("--files", type=int, default=100, help="Number of modules")
+    parser.add_argument(
+        "--functions", type=int, default=50, help="Test functions per module"
+    )
+    parser.add_argument(
+        "--valid-ratio",
+        type=float,
+        default=0.8,
+        help="Fraction of test functions with valid docstring",
+    )
+    parser.add_argument(
+        "--filler-lines", type=int, default=5, help="Lines of code per function"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per stage")
+    parser.add_argument("--output", help="JSON file for benchmark results")
+    parser.add_argument("--compare", help="JSON file with baseline results")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = get_args(sys.argv[1:] if args is None else args)
+    config = CorpusConfig(
+        files=args.files,
+        functions=args.functions,
+        valid_ratio=args.valid_ratio,
+        filler_lines=args.filler_lines,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as root:
+        results = run_benchmarks(Path(root), config, args.repeat)
+
+    output = dict(
+        meta=dict(
+            version=docstring_validator.__version__,
+            python=platform.python_version(),
+            platform=platform.platform(),
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            corpus=config._asdict(),
+            repeat=args.repeat,
+        ),
+        results=results,
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(output, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+        print("\n".join(compare(results, baseline)))
+    else:
+        for stage, timings in results.items():
+            line = f"{stage:<30} {timings['median']:>10.4f} s"
+            if "peak_memory" in timings:
+                line += f" {timings['peak_memory'] / 2**20:>10.2f} MiB peak"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,19 @@
 from docstring_validator.docstring_validator import (  # noqa: F401
     analyze_files,
     analyze_staged,
+    iter_errors,
+    iter_range_errors,
+    iter_staged_errors,
+    summarize_files,
 )
+from docstring_validator.result_store import ResultStore  # noqa: F401
+from docstring_validator.version import __version__  # noqa: F401
+
+
+def __getattr__(name: str):
+    # imported on demand, sharding loads output writers
+    if name == "Shard":
+        from docstring_validator.shard import Shard
+
+        return Shard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
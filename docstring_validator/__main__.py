@@ -0,0 +1,4 @@
+"""Allows running Docstring Validator with `python -m docstring_validator`."""
+from docstring_validator.cli_lib import run_cli
+
+run_cli()
@@ -0,0 +1,174 @@
+"""Asyncio API for analysis of files on slow or network file systems.
+
+File discovery and reads are blocking calls with high latency on network
+file systems, so they are run in thread pool with bounded number of reads in
+flight. Parsing and validation run in a separate thread, so reads of next
+files overlap with analysis of the current one and the event loop is never
+blocked. Results are yielded in the same order as by `iter_errors`.
+"""
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Deque, List, Optional, Union
+
+from docstring_validator import code_parser, diff_util, profiler
+from docstring_validator.cache import ResultCache
+from docstring_validator.discovery import DiscoveryOptions
+from docstring_validator.docstring_validator import (
+    DEFAULT_MEMO_SIZE,
+    AnalysisOptions,
+    FileResult,
+    _analyze_data,
+    _collect_result,
+    _read_path,
+)
+from docstring_validator.result_store import Report, ResultStore
+from docstring_validator.validation_error import ErrorRecord
+
+# Number of files read concurrently
+DEFAULT_CONCURRENCY = 16
+
+
+async def analyze_files_async(
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str] = None,
+    cache_dir: Optional[Union[Path, str]] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    discovery: Optional[DiscoveryOptions] = None,
+    max_errors: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    executor: Optional[Executor] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Report:
+    """Asynchronous counterpart of `analyze_files`.
+
+    >>> from docstring_validator.async_api import analyze_files_async
+    >>> report = await analyze_files_async(["tests"], pattern)
+
+    Args:
+        path: paths to files to be analyzed
+        func_name_filter: pattern for function names
+        cache_dir: location of result cache, None disables cache
+        stats: optional counter updated with analysis statistics
+        memo_size: number of distinct docstrings with memoized validation result
+        discovery: file discovery settings, e.g. include and exclude patterns
+        max_errors: stop analysis after given number of errors, None for no limit
+        concurrency: maximal number of files read at the same time
+        executor: executor for file discovery and reads, by default thread
+            pool with `concurrency` threads is created
+        parser: engine finding functions in files, "ast" or "tokenize"
+
+    Returns:
+        Text report from analysis
+    """
+    records = iter_errors_async(
+        path,
+        func_name_filter,
+        cache_dir,
+        stats,
+        memo_size,
+        discovery,
+        max_errors,
+        concurrency,
+        executor,
+        parser,
+    )
+    store = ResultStore()
+    async for record in records:
+        store.add(record)
+    return store.report()
+
+
+async def iter_errors_async(
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str] = None,
+    cache_dir: Optional[Union[Path, str]] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    discovery: Optional[DiscoveryOptions] = None,
+    max_errors: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    executor: Optional[Executor] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> AsyncIterator[ErrorRecord]:
+    """Asynchronous counterpart of `iter_errors`, see `analyze_files_async`.
+
+    >>> from docstring_validator.async_api import iter_errors_async
+    >>> async for error in iter_errors_async(["tests"], pattern):
+    ...     print(error.path, error.function, error.line, error.code)
+
+    Yields:
+        ErrorRecord for each detected error
+    """
+    options = AnalysisOptions(
+        func_name_filter,
+        Path(cache_dir).resolve() if cache_dir else None,
+        memo_size,
+        profiler.is_enabled(),
+        max_errors,
+        parser,
+    )
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(concurrency, thread_name_prefix="read")
+    # single thread, so analysis of files does not compete for GIL
+    analyzer = ThreadPoolExecutor(1, thread_name_prefix="analysis")
+    try:
+        results = _iter_results(
+            path, discovery, options, stats, concurrency, executor, analyzer
+        )
+        async for result in results:
+            for record in result.iter_records():
+                yield record
+    finally:
+        analyzer.shutdown(wait=False)
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+async def _iter_results(
+    path: List[Union[Path, str]],
+    discovery: Optional[DiscoveryOptions],
+    options: AnalysisOptions,
+    stats: Optional[Counter],
+    concurrency: int,
+    executor: Executor,
+    analyzer: Executor,
+) -> AsyncIterator[FileResult]:
+    loop = asyncio.get_running_loop()
+    files = await loop.run_in_executor(executor, diff_util.find_files, path, discovery)
+
+    reads: Deque[asyncio.Future] = deque()
+    budget = options.max_errors
+    written = 0
+    try:
+        for index, file_ in enumerate(files):
+            while len(reads) < max(concurrency, 1) and index + len(reads) < len(files):
+                next_file = files[index + len(reads)]
+                reads.append(
+                    loop.run_in_executor(executor, _read_path, next_file, options)
+                )
+            data = await reads.popleft()
+
+            result = await loop.run_in_executor(
+                analyzer, _analyze_data, file_, data, options, Counter(files=1)
+            )
+            written += result.stats["cache_writes"]
+            _collect_result(result, options, stats)
+            if budget is not None:
+                if result.count() >= budget:
+                    if stats is not None:
+                        stats["error_limit_reached"] = 1
+                        stats["files_unchecked"] += len(files) - index - 1
+                    yield result.truncate(budget)
+                    break
+                budget -= result.count()
+            yield result
+    finally:
+        for read in reads:
+            read.cancel()
+
+    if options.cache_dir is not None and written:
+        await loop.run_in_executor(executor, ResultCache(options.cache_dir).prune)
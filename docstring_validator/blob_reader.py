@@ -0,0 +1,88 @@
+"""Bulk reader of git objects.
+
+Staged files have to be analyzed in the version stored in git index, not the
+one in working tree, which may contain unstaged changes. Blobs are read by
+a single long-lived `git cat-file --batch` process, so content of any number
+of files costs one subprocess.
+"""
+import subprocess
+from pathlib import Path
+from typing import Optional, Union
+
+
+class BlobReader:
+    """Reads content of git objects through `git cat-file --batch`.
+
+    Process is started on first read and stopped by `close`, reader can be
+    used as a context manager.
+
+    Attributes:
+        repo: path to git repository
+    """
+
+    def __init__(self, repo: Union[Path, str]):
+        self.repo = Path(repo)
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "BlobReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """Reads content of a blob.
+
+        Args:
+            spec: object name understood by git, e.g. ":path" for file stored
+                in index or "HEAD:path" for file from given revision
+
+        Returns:
+            Raw blob content or None if object does not exist or is not a blob.
+
+        Raises:
+            OSError: if git process exits unexpectedly
+        """
+        process = self._start()
+        process.stdin.write(spec.encode() + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header:
+            raise OSError(f"git cat-file exited while reading {spec}")
+        # "<sha> <type> <size>" or "<spec> missing", spec may contain spaces
+        fields = header.rsplit(None, 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+
+        _, object_type, size = fields
+        data = process.stdout.read(int(size) + 1)[:-1]  # content ends with LF
+        return data if object_type == b"blob" else None
+
+    def read_staged(self, path: str, rev: Optional[str] = None) -> Optional[bytes]:
+        """Reads file from git index or from given revision.
+
+        Args:
+            path: file path relative to repository root
+            rev: git revision name or None for index
+        """
+        return self.read(f"{rev or ''}:{path}")
+
+    def close(self):
+        """Stops git process."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        process.stdin.close()
+        process.wait()
+        process.stdout.close()
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._process
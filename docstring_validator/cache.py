@@ -0,0 +1,211 @@
+"""Persistent on-disk cache for per-file analysis results.
+
+Entries are content addressed - key is computed from file content, function
+name pattern and fingerprint of validator version and docstring schema, so
+cached result is reused only when the analysis would give the same output.
+Cache size is capped, least recently used entries are evicted first.
+
+Daemon keeps additional in-memory cache, where entries are identified by
+file modification time and size, so unchanged files are not even read.
+Parsed files from git history are kept in memory keyed by git object name.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from docstring_validator.docstring_model import Docstring
+from docstring_validator.version import __version__
+
+DEFAULT_CACHE_DIR = ".docstring_validator_cache"
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # bytes
+DEFAULT_STAT_CACHE_ENTRIES = 100_000
+DEFAULT_BLOB_CACHE_ENTRIES = 1024
+
+# modification time in nanoseconds and size of a file
+Stamp = Tuple[int, int]
+
+# bump when structure of cached entries changes
+CACHE_FORMAT = 2
+
+
+class ResultCache:
+    """Directory with cached analysis results.
+
+    Attributes:
+        directory: location of cache entries
+        max_size: maximum total size of entries in bytes
+    """
+
+    def __init__(self, directory: Union[Path, str], max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def key(content: bytes, func_name_filter: Optional[str]) -> str:
+        """Computes cache key for file content analyzed with given pattern."""
+        digest = hashlib.sha256(fingerprint().encode())
+        digest.update(f"\0{func_name_filter}\0".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Loads cached entry, returns None if entry is missing or corrupted."""
+        entry = self._entry_path(key)
+        try:
+            data = json.loads(entry.read_text())
+            os.utime(entry)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def put(self, key: str, value: dict):
+        """Stores entry in cache, errors are ignored - cache is best effort."""
+        entry = self._entry_path(key)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            if not self.directory.exists():
+                self._create()
+            entry.parent.mkdir(exist_ok=True)
+            tmp.write_text(json.dumps(value))
+            os.replace(tmp, entry)
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """Evicts least recently used entries exceeding size limit.
+
+        Returns:
+            Number of removed entries.
+        """
+        entries = []
+        for entry in self.directory.glob("*/*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _create(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / ".gitignore").write_text(
+            "# Created by docstring-validator automatically.\n*\n"
+        )
+
+
+@lru_cache(maxsize=None)
+def fingerprint() -> str:
+    """Identifies validator version and schema that produced cached results."""
+    schema = [
+        (
+            chunk_type.__name__,
+            ranges["min"],
+            ranges["max"],
+            [validator.__name__ for validator in chunk_type.validators],
+        )
+        for chunk_type, ranges in Docstring.schema.items()
+    ]
+    validators = [validator.__name__ for validator in Docstring.validators]
+    return f"{__version__}:{CACHE_FORMAT}:{schema}:{validators}"
+
+
+class StatCache:
+    """In-memory cache of analysis results for files on disk.
+
+    Entries are valid as long as modification time and size of the file are
+    unchanged, so cached results are reused without reading the file. Used by
+    long-running daemon, where files are analyzed repeatedly.
+
+    Attributes:
+        max_entries: maximum number of stored results
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_STAT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[Stamp, dict]]" = (
+            OrderedDict()
+        )
+
+    def get(
+        self, path: Path, func_name_filter: Optional[str], stamp: Stamp
+    ) -> Optional[dict]:
+        """Returns result stored for path if file was not modified since."""
+        key = (str(path), func_name_filter)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != stamp:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(
+        self, path: Path, func_name_filter: Optional[str], stamp: Stamp, value: dict
+    ):
+        """Stores result for file with given stamp, evicting oldest entries."""
+        key = (str(path), func_name_filter)
+        self._entries[key] = (stamp, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BlobCache:
+    """In-memory cache of values computed from git blobs, e.g. parsed modules.
+
+    Blob object name identifies its content, so entries never become stale.
+    Used when the same file version is analyzed in many commits.
+
+    Attributes:
+        max_entries: maximum number of stored values
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_BLOB_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, blob: str) -> Optional[Any]:
+        """Returns value stored for blob with given object name."""
+        value = self._entries.get(blob)
+        if value is not None:
+            self._entries.move_to_end(blob)
+        return value
+
+    def put(self, blob: str, value: Any):
+        """Stores value for blob, evicting least recently used entries."""
+        self._entries[blob] = value
+        self._entries.move_to_end(blob)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, blob: str) -> bool:
+        return blob in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_stamp(path: Path) -> Stamp:
+    """Identifies file version by modification time and size."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
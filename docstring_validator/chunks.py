@@ -70,7 +70,12 @@ class Chunk(abc.ABC):
         return object.__new__(cls)
 
     def __init__(self, content: List[str]):
-        self.content = content
+        self.content = self.parse_content(content)
+
+    @staticmethod
+    def parse_content(content: List[str]) -> List[str]:
+        """Converts raw section lines to content checked by validators."""
+        return content
 
     def validate(self) -> List[ValidationError]:
         """Runs validation functions for the chunk.
@@ -93,15 +98,8 @@ class Chunk(abc.ABC):
     @staticmethod
     def _identify_chunk(chunk: List[str]) -> ChunkTypes:
         """Returns chunk type based on header (first line)."""
-        chunk_headers = {
-            "Test steps": ChunkTypes.TEST_STEPS,
-            "Pass criteria": ChunkTypes.PASS_CRITERIA,
-            "Fail criteria": ChunkTypes.FAIL_CRITERIA,
-            "Reference": ChunkTypes.REFERENCE,
-        }
-
         header = chunk[0].split(":")[0]
-        return chunk_headers.get(header, ChunkTypes.DESCRIPTION)
+        return CHUNK_HEADERS.get(header, ChunkTypes.DESCRIPTION)
 
 
 class DescriptionChunk(Chunk):
@@ -148,18 +146,25 @@ class ReferencesChunk(Chunk):
     content_type = ContentTypes.UNORDERED_LIST
     validators = [validators.validate_unordered_list]
 
-    def __init__(self, content: List[str]):
-        self.content = self._parse_reference(content)
-
-    def _parse_reference(self, content: List[str]) -> List[str]:
+    @staticmethod
+    def parse_content(content: List[str]) -> List[str]:
+        """Converts one line reference list to unordered list."""
         if len(content) == 1:
-            header, elements = content[0].split(":")
+            header, _, elements = content[0].partition(":")
             elements = elements.split(",")
             elements = [f"- {el.strip()}" for el in elements]
             content = [header] + elements
         return content
 
 
+# section headers (text before colon in first line) and matching chunk types
+CHUNK_HEADERS = {
+    "Test steps": ChunkTypes.TEST_STEPS,
+    "Pass criteria": ChunkTypes.PASS_CRITERIA,
+    "Fail criteria": ChunkTypes.FAIL_CRITERIA,
+    "Reference": ChunkTypes.REFERENCE,
+}
+
 type_map = {
     ChunkTypes.DESCRIPTION: DescriptionChunk,
     ChunkTypes.TEST_STEPS: StepsChunk,
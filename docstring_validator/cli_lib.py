@@ -1,9 +1,29 @@
 """Library for handling CLI related operations for Docstring Validator."""
 
 import argparse
+import json
 import sys
+from collections import Counter
+from pathlib import Path
+from contextlib import ExitStack
+from typing import Iterator, List, TextIO
 
 import docstring_validator
+from docstring_validator import daemon, diff_util, profiler, shard, watch, writers
+from docstring_validator.cache import DEFAULT_CACHE_DIR
+from docstring_validator.code_parser import DEFAULT_PARSER, PARSERS
+from docstring_validator.discovery import (
+    BACKENDS,
+    DEFAULT_BACKEND,
+    DEFAULT_INCLUDES,
+    DiscoveryOptions,
+)
+from docstring_validator.docstring_validator import DEFAULT_MEMO_SIZE
+from docstring_validator.reporter import report_profile, report_stats, report_summary
+from docstring_validator.validation_error import ErrorRecord
+
+# output formats of --summary, text is printed as table
+SUMMARY_FORMATS = ("text", "jsonl")
 
 
 def get_args(args) -> argparse.Namespace:
@@ -32,18 +52,464 @@ def get_args(args) -> argparse.Namespace:
         action="store_true",
         help="Perform validation on files staged for commit",
     )
+    parser.add_argument(
+        "--range",
+        dest="revision_range",
+        metavar="A..B",
+        help="Validate functions changed by each commit in git revision range, "
+        "reporting errors with commit which introduced them",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="Analyze only files matching glob pattern in searched directories, "
+        "can be repeated (default: *.py)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Skip files and directories matching glob pattern, can be repeated. "
+        "VCS, virtual environment, cache and build directories are always skipped",
+    )
+    parser.add_argument(
+        "--gitignore",
+        action="store_true",
+        help="Skip files and directories ignored in .gitignore files",
+    )
+    parser.add_argument(
+        "--discovery",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Find files in directories by walking them or by listing files "
+        f"tracked by git (default: {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "--untracked",
+        action="store_true",
+        help="With --discovery git, analyze also untracked files which are not ignored",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Number of parallel worker processes, 0 uses all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached results (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached results",
+    )
+    parser.add_argument(
+        "--memo-size",
+        type=_non_negative_int,
+        default=DEFAULT_MEMO_SIZE,
+        help="Number of distinct docstrings with memoized validation result, "
+        f"0 disables memo (default: {DEFAULT_MEMO_SIZE})",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSERS,
+        default=DEFAULT_PARSER,
+        help="Engine finding functions in files, tokenize does not build syntax trees "
+        f"(default: {DEFAULT_PARSER})",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first function with invalid docstring, same as --max-errors 1",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=_positive_int,
+        metavar="N",
+        help="Stop analysis after N errors are found",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(writers.WRITERS),
+        default="text",
+        help="Output format, text is colored when printed to terminal (default: text)",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print only counts of errors per code and of checked and failing "
+        "functions per top-level directory, as table or as JSON with --format jsonl",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="INDEX/COUNT",
+        help="Analyze only INDEX-th of COUNT parts of files balanced by size and "
+        "write partial result for `docstring-validator merge`, e.g. 1/4",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print analysis statistics",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="TRACE_FILE",
+        help="Record time spent in each stage and file, save it as Chrome trace "
+        "JSON and print summary",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=_non_negative_int,
+        default=10,
+        help="Number of slowest files in profile summary (default: 10)",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Watch files for changes, revalidate modified files and print new "
+        "and fixed issues until interrupted",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=watch.DEFAULT_DEBOUNCE,
+        metavar="SECONDS",
+        help="Time without file modifications before revalidation in watch mode "
+        f"(default: {watch.DEFAULT_DEBOUNCE})",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Run analysis in background daemon, starting it if it is not running",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run daemon serving --client requests, keeping analysis results of "
+        "unmodified files in memory",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Unix socket of the daemon (default: per user socket in temp directory)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=daemon.DEFAULT_IDLE_TIMEOUT,
+        metavar="SECONDS",
+        help="Stop daemon after given time without requests "
+        f"(default: {daemon.DEFAULT_IDLE_TIMEOUT})",
+    )
+    parsed = parser.parse_args(args)
+    if parsed.fail_fast:
+        parsed.max_errors = 1
+    if parsed.watch and parsed.staged:
+        parser.error("--watch cannot be used with --staged")
+    if parsed.watch and (parsed.client or parsed.daemon):
+        parser.error("--watch cannot be run in daemon, it would block other clients")
+    if parsed.watch and parsed.format != "text":
+        parser.error("--watch supports only text format")
+    if parsed.revision_range and (parsed.staged or parsed.watch or parsed.shard):
+        parser.error("--range cannot be used with --staged, --watch or --shard")
+    if parsed.revision_range and parsed.revision_range.startswith("-"):
+        parser.error(f"invalid revision range: {parsed.revision_range}")
+    if parsed.untracked and parsed.discovery != "git":
+        parser.error("--untracked can be used only with --discovery git")
+    if parsed.summary and (
+        parsed.staged or parsed.revision_range or parsed.watch or parsed.shard
+    ):
+        parser.error(
+            "--summary cannot be used with --staged, --range, --watch or --shard"
+        )
+    if parsed.summary and parsed.max_errors:
+        parser.error("--summary counts all errors, it cannot be used with --max-errors")
+    if parsed.summary and parsed.format not in SUMMARY_FORMATS:
+        parser.error("--summary supports only text and jsonl formats")
+    if parsed.shard and (parsed.staged or parsed.watch):
+        parser.error("--shard cannot be used with --staged or --watch")
+    if parsed.shard and parsed.format != "text":
+        parser.error("--shard writes partial result, select format when merging")
+    return parsed
+
+
+def get_merge_args(args) -> argparse.Namespace:
+    """Parse arguments of merge subcommand.
+
+    Args:
+        args: list of arguments to parse, without subcommand name
+
+    Returns:
+        Namespace with parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docstring-validator merge",
+        description="Merge partial results of --shard runs into a single report",
+    )
+    parser.add_argument(
+        "partials", help="Partial results of all shards", nargs="+", metavar="FILE"
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(writers.WRITERS),
+        default="text",
+        help="Output format, text is colored when printed to terminal (default: text)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print analysis statistics summed over shards",
+    )
     return parser.parse_args(args)
 
 
+def _shard(value: str) -> shard.Shard:
+    try:
+        return shard.Shard.parse(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected positive integer, got {value}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected non-negative integer, got {value}")
+    return number
+
+
 def run_cli():
     """CLI entry point for docstring-validator."""
-    args = get_args(sys.argv[1:])
+    argv = sys.argv[1:]
+    if argv[:1] == ["merge"]:
+        sys.exit(main(argv))
+    args = get_args(argv)
+    if args.daemon:
+        daemon.serve(args.socket or daemon.get_socket_path(), args.idle_timeout, main)
+        return
+    if args.client:
+        try:
+            socket_path = args.socket or daemon.get_socket_path()
+            connection = daemon.connect(socket_path, idle_timeout=args.idle_timeout)
+            sys.exit(daemon.run_client(connection, argv))
+        except OSError as exc:
+            print(f"Daemon is not available, running locally: {exc}", file=sys.stderr)
+    sys.exit(main(argv))
+
+
+def main(argv: List[str], stdout: TextIO = None, stderr: TextIO = None) -> int:
+    """Runs analysis with CLI arguments, writing report to given streams.
+
+    Args:
+        argv: list of arguments to parse
+        stdout: stream for found issues, defaults to sys.stdout
+        stderr: stream for statistics and profile summary, defaults to sys.stderr
+
+    Returns:
+        Exit code - 1 if any issue was found, 0 otherwise.
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    if argv[:1] == ["merge"]:
+        return _merge(get_merge_args(argv[1:]), stdout, stderr)
+    args = get_args(argv)
+    if not args.profile:
+        return _analyze(args, stdout, stderr)
+
+    # trace is written in every mode, e.g. also for --summary
+    profiler.enable()
+    try:
+        return _analyze(args, stdout, stderr)
+    finally:
+        recorded = profiler.disable()
+        Path(args.profile).write_text(json.dumps(recorded.to_chrome_trace()))
+        print("\n".join(report_profile(recorded, args.profile_top)), file=stderr)
+
+
+def _analyze(args: argparse.Namespace, stdout: TextIO, stderr: TextIO) -> int:
+    """Analyzes files in mode selected by arguments, writing report."""
+    stats = Counter()
+    discovery = DiscoveryOptions(
+        args.include or DEFAULT_INCLUDES,
+        args.exclude,
+        args.gitignore,
+        args.discovery,
+        args.untracked,
+    )
+    if args.watch:
+        return _watch(args, discovery, stats, stdout)
+    if args.summary:
+        return _summary(args, discovery, stats, stdout, stderr)
+    writer = writers.get_writer(args.format, stdout)
     if args.staged:
-        report = docstring_validator.analyze_staged(".", args.name_pattern)
+        records = docstring_validator.iter_staged_errors(
+            ".",
+            args.name_pattern,
+            args.jobs,
+            stats=stats,
+            memo_size=args.memo_size,
+            max_errors=args.max_errors,
+            parser=args.parser,
+        )
+    elif args.revision_range:
+        records = docstring_validator.iter_range_errors(
+            ".",
+            args.revision_range,
+            args.name_pattern,
+            stats=stats,
+            memo_size=args.memo_size,
+            max_errors=args.max_errors,
+            parser=args.parser,
+        )
     else:
-        report = docstring_validator.analyze_files(args.filenames, args.name_pattern)
+        files = None
+        if args.shard:
+            # indexes of partial result refer to files of all shards, the same
+            # discovered paths are analyzed, so records match the indexes
+            files = diff_util.find_files(args.filenames, discovery)
+            writer = shard.PartialWriter(
+                stdout, args.shard, files, args.max_errors, stats
+            )
+        records = docstring_validator.iter_errors(
+            args.filenames,
+            args.name_pattern,
+            args.jobs,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            stats=stats,
+            memo_size=args.memo_size,
+            discovery=discovery,
+            max_errors=args.max_errors,
+            shard=args.shard,
+            parser=args.parser,
+            files=files,
+        )
+
+    found = False
+    writer.start()
+    for record in records:
+        found = True
+        with profiler.span("report", "report"):
+            writer.write(record)
+    writer.finish()
+
+    if stats["error_limit_reached"]:
+        print(
+            f"Stopped after {args.max_errors} error(s), "
+            f"{stats['files_unchecked']} file(s) left unchecked",
+            file=stderr,
+        )
+    if args.verbose:
+        print("\n".join(report_stats(stats)), file=stderr)
+    return int(found)
+
+
+def _merge(args: argparse.Namespace, stdout: TextIO, stderr: TextIO) -> int:
+    """Writes report of partial results, same as of unsharded run."""
+    with ExitStack() as stack:
+        try:
+            partials = [
+                shard.PartialResult(stack.enter_context(open(path)), path)
+                for path in args.partials
+            ]
+            shard.check_complete(partials)
+        except (OSError, ValueError) as exc:
+            print(f"Cannot merge partial results: {exc}", file=stderr)
+            return 2
+
+        max_errors = partials[0].max_errors
+        count = 0
+        unchecked = 0
+        writer = writers.get_writer(args.format, stdout)
+        writer.start()
+        try:
+            # all records are read, to detect incomplete results
+            for index, record in shard.merge(partials):
+                if max_errors is not None and count >= max_errors:
+                    continue
+                count += 1
+                writer.write(record)
+                if count == max_errors:
+                    unchecked = partials[0].files - index - 1
+        except ValueError as exc:
+            print(f"Cannot merge partial results: {exc}", file=stderr)
+            return 2
+        writer.finish()
+
+    stats = sum((partial.stats for partial in partials), Counter())
+    if max_errors is not None and count == max_errors:
+        print(
+            f"Stopped after {max_errors} error(s), "
+            f"{unchecked} file(s) left unchecked",
+            file=stderr,
+        )
+    if args.verbose:
+        print("\n".join(report_stats(stats)), file=stderr)
+    return int(count > 0)
+
+
+def _summary(
+    args: argparse.Namespace,
+    discovery: DiscoveryOptions,
+    stats: Counter,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> int:
+    """Writes counts of analysis results instead of the errors."""
+    summary = docstring_validator.summarize_files(
+        args.filenames,
+        args.name_pattern,
+        args.jobs,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        stats=stats,
+        memo_size=args.memo_size,
+        discovery=discovery,
+        parser=args.parser,
+    )
+    if args.format == "jsonl":
+        print(json.dumps(summary.to_dict()), file=stdout)
+    else:
+        print("\n".join(report_summary(summary)), file=stdout)
+    if args.verbose:
+        print("\n".join(report_stats(stats)), file=stderr)
+    return int(summary.total.failing > 0)
+
+
+def _watch(
+    args: argparse.Namespace,
+    discovery: DiscoveryOptions,
+    stats: Counter,
+    stdout: TextIO,
+) -> int:
+    def analyze(files: List[Path]) -> Iterator[ErrorRecord]:
+        return docstring_validator.iter_errors(
+            files,
+            args.name_pattern,
+            args.jobs,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            stats=stats,
+            memo_size=args.memo_size,
+            discovery=discovery,
+            parser=args.parser,
+        )
 
-    if report:
-        print("Issues found in docstrings by Docstring Validator:\n")
-        print("\n".join(report))
-    sys.exit(bool(report))
+    watcher = watch.Watcher(args.filenames, analyze, discovery)
+    try:
+        watch.watch(watcher, stdout, debounce=args.debounce)
+    except KeyboardInterrupt:
+        pass
+    return int(bool(watcher.errors))
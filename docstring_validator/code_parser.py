@@ -4,15 +4,142 @@ Extracts code information using AST.
 """
 
 import ast
+from collections import abc, deque
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from docstring_validator import profiler
+
+# Engines extracting functions from source code, see `parse_source`
+PARSERS = ("ast", "tokenize")
+DEFAULT_PARSER = "ast"
+
+
+class FunctionInfo(NamedTuple):
+    """Stores location and docstring of a single function definition."""
+
+    name: str  # function name as written in `def` statement
+    qualname: str  # dotted path to the function, as in `__qualname__`
+    kind: str  # "def" or "async def"
+    lineno: int  # line with `def` keyword
+    end_lineno: Optional[int]  # last line of function body
+    docstring: Optional[str]  # cleaned docstring or None if not defined
+
+
+class SymbolIndex(abc.Mapping):
+    """Index of functions defined in python module built with a single parse.
+
+    Index behaves like read-only dictionary mapping function names to
+    FunctionInfo objects. If multiple functions share the same name, the one
+    defined on the outermost nesting level wins, then the first one in the file.
+    All definitions are available in `functions` and `by_qualname`.
+
+    Attributes:
+        path: path of the indexed file
+        functions: all function definitions in order of appearance
+        by_qualname: function definitions keyed by qualified name
+    """
+
+    def __init__(self, path: Optional[Path], functions: List[FunctionInfo]):
+        self.path = path
+        self.functions = functions
+        self.by_qualname = {func.qualname: func for func in reversed(functions)}
+
+        by_name: Dict[str, FunctionInfo] = {}
+        for func in sorted(functions, key=lambda f: f.qualname.count(".")):
+            by_name.setdefault(func.name, func)
+        self._by_name = by_name
+
+    def __getitem__(self, func_name: str) -> FunctionInfo:
+        return self._by_name[func_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_name)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def get_function(self, func_name: str) -> FunctionInfo:
+        """Gets function definition by name.
+
+        Raises:
+            ValueError: if func_name is not defined in indexed file.
+        """
+        try:
+            return self._by_name[func_name]
+        except KeyError:
+            location = self.path.absolute() if self.path else "<source>"
+            raise ValueError(f"Function {func_name} not found in {location}") from None
+
+
+def parse_file(py_file: Union[Path, str], parser: str = DEFAULT_PARSER) -> SymbolIndex:
+    """Reads and parses python file into SymbolIndex.
+
+    Args:
+        py_file: path to python file to be indexed
+        parser: parsing engine, one of `PARSERS`, see `parse_source`
+
+    Returns:
+        Index of all functions defined in the file.
+    """
+    py_file = Path(py_file).resolve()
+    return parse_source(py_file.read_text(), py_file, parser)
+
+
+def parse_source(
+    source: Union[str, bytes],
+    py_file: Optional[Union[Path, str]] = None,
+    parser: str = DEFAULT_PARSER,
+) -> SymbolIndex:
+    """Parses python source code into SymbolIndex.
+
+    `ast` parser builds syntax tree of the whole module. `tokenize` parser
+    finds functions in a single pass over tokens, falling back to `ast` for
+    sources it cannot handle. Results are the same, but `tokenize` does not
+    report syntax errors. It is faster for big generated modules with many
+    short functions and slower for typical code, see benchmarks.
+
+    Args:
+        source: content of python module
+        py_file: optional path of the module, used in error messages
+        parser: one of `PARSERS`
+
+    Returns:
+        Index of all functions defined in the source.
+    """
+    with profiler.span("parse", path=str(py_file)):
+        if parser == "tokenize":
+            from docstring_validator import token_parser
+
+            return token_parser.parse_source(source, py_file)
+        return _parse_source(source, py_file)
+
+
+def _parse_source(
+    source: Union[str, bytes], py_file: Optional[Union[Path, str]]
+) -> SymbolIndex:
+    tree = ast.parse(source)
+    functions = []
+
+    nodes = deque([(tree, "")])
+    while nodes:
+        node, prefix = nodes.popleft()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append(_get_function_info(child, prefix))
+                nodes.append((child, f"{prefix}{child.name}.<locals>."))
+            elif isinstance(child, ast.ClassDef):
+                nodes.append((child, f"{prefix}{child.name}."))
+            else:
+                nodes.append((child, prefix))
+
+    functions.sort(key=lambda func: func.lineno)
+    return SymbolIndex(Path(py_file) if py_file else None, functions)
 
 
 def get_docstring(py_file: Union[Path, str], func_name: str) -> Optional[str]:
     """Gets doctring for requested function.
 
-    This function was not tested with class methods and inner functions.
-
     Args:
         py_file: path to python file with function to be checked
         func_name: name of searched function
@@ -24,8 +151,7 @@ def get_docstring(py_file: Union[Path, str], func_name: str) -> Optional[str]:
     Raises:
         ValueError: if func_name is not found in py_file.
     """
-    func = _get_function(py_file, func_name)
-    return ast.get_docstring(func)
+    return parse_file(py_file).get_function(func_name).docstring
 
 
 def get_func_ranges(
@@ -33,8 +159,6 @@ def get_func_ranges(
 ) -> Tuple[int, Optional[int]]:
     """Gets line numbers for beginning and and of function declaration.
 
-    This function was not tested with class methods and inner functions.
-
     Args:
         py_file: path to python file with function to be checked
         func_name: name of searched function
@@ -45,21 +169,18 @@ def get_func_ranges(
     Raises:
         ValueError: if func_name is not found in py_file.
     """
-    func = _get_function(py_file, func_name)
-    return func.lineno, getattr(func, "end_lineno", None)
-
-
-def _get_function(py_file: Union[Path, str], func_name: str) -> ast.FunctionDef:
-    py_file = Path(py_file).resolve()
-    tree = ast.parse(py_file.read_text())
-    functions = [
-        func
-        for func in ast.walk(tree)
-        if isinstance(func, ast.FunctionDef) and func.name == func_name
-    ]
-
-    if len(functions) == 0:
-        raise ValueError(f"Function {func_name} not found in {py_file.absolute()}")
-        # TODO test for multiple functions with the same name
-
-    return functions[0]
+    func = parse_file(py_file).get_function(func_name)
+    return func.lineno, func.end_lineno
+
+
+def _get_function_info(
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef], prefix: str
+) -> FunctionInfo:
+    return FunctionInfo(
+        name=func.name,
+        qualname=f"{prefix}{func.name}",
+        kind="async def" if isinstance(func, ast.AsyncFunctionDef) else "def",
+        lineno=func.lineno,
+        end_lineno=getattr(func, "end_lineno", None),
+        docstring=ast.get_docstring(func),
+    )
@@ -0,0 +1,310 @@
+"""Long-running daemon serving analysis requests over Unix domain socket.
+
+Pre-commit hook starts new Python process for every commit. In client mode
+the hook only forwards its arguments to the daemon, which keeps imported
+package, validation memo and results of analyzed files warm between
+requests. Results of files on disk are reused while their modification time
+and size are unchanged.
+
+Protocol uses JSON lines. Client sends single request with arguments, working
+directory and git related environment variables. Daemon streams back output
+of the run and finally its exit code:
+
+    -> {"argv": [...], "cwd": "...", "env": {...}, "tty": true}
+    <- {"stream": "out", "text": "..."}
+    <- {"exit": 1}
+
+Requests are handled one at a time. Daemon exits after `idle_timeout`
+seconds without requests.
+
+Socket is created in a directory accessible only by its owner - in
+`$XDG_RUNTIME_DIR` or in a private directory in the temp directory - and
+client connects only to a socket owned by the same user, so another local
+user cannot impersonate the daemon.
+"""
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from stat import S_ISDIR
+from pathlib import Path
+from typing import Callable, List, Optional, TextIO, Union
+
+from docstring_validator import profiler
+from docstring_validator.docstring_validator import (
+    disable_stat_cache,
+    enable_stat_cache,
+)
+from docstring_validator.version import __version__
+
+DEFAULT_IDLE_TIMEOUT = 600.0  # seconds
+# time to wait for automatically started daemon
+START_TIMEOUT = 10.0  # seconds
+
+# variables changing behavior of a run, e.g. pre-commit refs or temporary
+# git index used by `git commit <paths>`
+FORWARDED_ENV = (
+    "PRE_COMMIT_FROM_REF",
+    "PRE_COMMIT_TO_REF",
+    "GIT_DIR",
+    "GIT_INDEX_FILE",
+    "GIT_WORK_TREE",
+)
+
+Handler = Callable[[List[str], TextIO, TextIO], int]
+
+
+class _Stream:
+    """Text stream sending written text to the client."""
+
+    def __init__(self, writer: TextIO, name: str, tty: bool):
+        self.writer = writer
+        self.name = name
+        self.tty = tty
+
+    def isatty(self) -> bool:
+        """Reports if client prints to terminal, e.g. to enable colors."""
+        return self.tty
+
+    def write(self, text: str) -> int:
+        _send(self.writer, dict(stream=self.name, text=text))
+        return len(text)
+
+    def flush(self):
+        self.writer.flush()
+
+
+def get_socket_path() -> Path:
+    """Returns default socket location, separate for each user and version.
+
+    Raises:
+        OSError: if private directory for the socket cannot be created
+    """
+    name = f"docstring-validator-{__version__}.sock"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        with contextlib.suppress(OSError):
+            _check_private_dir(Path(runtime_dir))
+            return Path(runtime_dir) / name
+    directory = Path(tempfile.gettempdir()) / f"docstring-validator-{os.getuid()}"
+    with contextlib.suppress(FileExistsError):
+        directory.mkdir(mode=0o700)
+    _check_private_dir(directory)
+    return directory / name
+
+
+def _check_private_dir(directory: Path):
+    """Checks that directory is owned and accessible only by current user.
+
+    Raises:
+        PermissionError: if directory is a symlink, belongs to another user or
+            is accessible by other users
+    """
+    stat = os.lstat(directory)
+    if not S_ISDIR(stat.st_mode) or stat.st_uid != os.getuid():
+        raise PermissionError(f"{directory} is not a directory owned by current user")
+    if stat.st_mode & 0o077:
+        raise PermissionError(f"{directory} is accessible by other users")
+
+
+def serve(path: Union[Path, str], idle_timeout: float, handler: Handler):
+    """Runs daemon until it is idle for `idle_timeout` seconds.
+
+    Returns immediately if another daemon is already listening on the socket.
+
+    Args:
+        path: location of Unix socket
+        idle_timeout: time without requests after which daemon stops
+        handler: function running analysis with CLI arguments, see
+            `cli_lib.main`
+    """
+    path = Path(path)
+    with contextlib.suppress(OSError):
+        _connect(path).close()
+        return
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()  # left by daemon which was killed
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)  # socket accessible only by the owner
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(umask)
+    server.listen()
+    server.settimeout(idle_timeout)
+
+    enable_stat_cache()
+    try:
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                break
+            with connection:
+                connection.setblocking(True)
+                _handle(connection, handler)
+    finally:
+        server.close()
+        with contextlib.suppress(OSError):
+            path.unlink()
+        disable_stat_cache()
+
+
+def connect(
+    path: Union[Path, str],
+    start: bool = True,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> socket.socket:
+    """Connects to daemon, starting it in background if it is not running.
+
+    Args:
+        path: location of Unix socket
+        start: start daemon if it is not running
+        idle_timeout: idle timeout of started daemon
+
+    Raises:
+        OSError: if daemon is not running and cannot be started
+    """
+    path = Path(path)
+    try:
+        return _connect(path)
+    except OSError:
+        if not start:
+            raise
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "docstring_validator",
+            "--daemon",
+            "--socket",
+            str(path),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while True:
+        try:
+            return _connect(path)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+def run_client(
+    connection: socket.socket,
+    argv: List[str],
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """Sends request to daemon and writes streamed output.
+
+    Args:
+        connection: socket connected to daemon, closed when request is done
+        argv: CLI arguments of the run
+        stdout: stream for report, defaults to sys.stdout
+        stderr: stream for statistics, defaults to sys.stderr
+
+    Returns:
+        Exit code of the run.
+
+    Raises:
+        ConnectionError: if daemon closed connection before sending any output
+    """
+    streams = dict(out=stdout or sys.stdout, err=stderr or sys.stderr)
+    request = dict(
+        argv=argv,
+        cwd=os.getcwd(),
+        env={name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+        tty=streams["out"].isatty(),
+    )
+    received = False
+    with connection, connection.makefile("r", encoding="utf-8") as reader:
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        for line in reader:
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            stream = streams[message["stream"]]
+            stream.write(message["text"])
+            stream.flush()
+            received = True
+
+    if not received:
+        raise ConnectionError("Daemon closed connection without response")
+    print("Daemon closed connection before the run finished", file=streams["err"])
+    return 1
+
+
+def _connect(path: Path) -> socket.socket:
+    """Connects to socket, if it is owned by current user."""
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(path))
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+def _handle(connection: socket.socket, handler: Handler):
+    """Runs single request in working directory and environment of the client."""
+    with connection.makefile("r", encoding="utf-8") as reader:
+        line = reader.readline()
+    if not line:  # connection only checked if daemon is running
+        return
+    request = json.loads(line)
+    writer = connection.makefile("w", encoding="utf-8")
+
+    cwd = os.getcwd()
+    env = {name: os.environ.get(name) for name in FORWARDED_ENV}
+    try:
+        os.chdir(request["cwd"])
+        _set_env({name: request["env"].get(name) for name in FORWARDED_ENV})
+        code = handler(
+            request["argv"],
+            _Stream(writer, "out", request.get("tty", False)),
+            _Stream(writer, "err", False),
+        )
+    except SystemExit as exc:  # e.g. invalid arguments
+        code = exc.code if isinstance(exc.code, int) else 1
+    except Exception:
+        with contextlib.suppress(OSError):
+            _send(writer, dict(stream="err", text=traceback.format_exc()))
+        code = 1
+    finally:
+        os.chdir(cwd)
+        _set_env(env)
+        profiler.disable()
+
+    with contextlib.suppress(OSError):
+        _send(writer, dict(exit=code))
+        writer.close()
+
+
+def _send(writer: TextIO, message: dict):
+    writer.write(json.dumps(message) + "\n")
+    writer.flush()
+
+
+def _set_env(env: dict):
+    for name, value in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
@@ -2,19 +2,36 @@
 
 Iterating over file system or git diff output are supported.
 """
+
+import mmap
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, List, NamedTuple, Optional, Sequence, Union
+from typing import Generator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from docstring_validator import git_cli, profiler
+from docstring_validator.blob_reader import BlobReader
+from docstring_validator.discovery import DiscoveryOptions, discover_files
+from docstring_validator.line_buffer import LineBuffer
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
 
-import git
+# Files bigger than this (in bytes) are searched by prefilter using mmap
+MMAP_MIN_SIZE = 1024 * 1024
+
+_REGEX_SPECIAL_CHARS = set("\\.^$*+?{}[]|()")
 
 
 class FileContent(NamedTuple):
     """Stores file path and content for analysis."""
 
     path: Path  # path of the modified file
-    content: List[str]  # changed lines
+    content: Sequence[str]  # changed lines, usually LineBuffer
+    source: Optional[str] = None  # full file content, if already loaded
+    changed_lines: Optional[List[Tuple[int, int]]] = None  # changed line ranges
+    commit: Optional[str] = None  # commit which changed the file, in range audit
+    blob: Optional[str] = None  # git object name of the analyzed file version
 
 
 def iter_diffs(
@@ -22,68 +39,214 @@ def iter_diffs(
     pattern: Optional[str] = None,
     baseline_rev: Optional[str] = None,
     target_rev: Optional[str] = None,
+    backend: str = "cli",
 ) -> Generator[FileContent, None, None]:
     """Yields git diffs for all modified files.
 
+    Full content of each file is read from git index (or target revision)
+    using a single `git cat-file --batch` process, so files are analyzed in
+    the version being committed, regardless of unstaged changes.
+
     Args:
         path: repository root path
         pattern: filter file types (regex)
         baseline_rev: git revision name for baseline or None for HEAD
         target_rev: git revision name for current or None for Index
+        backend: "cli" to run git command directly or "gitpython" to use
+            optional GitPython package
 
     Yields:
-        FileContent with path to file and added lines
+        FileContent with path to file, added lines, changed line ranges and
+        full staged content
     """
-    repo = git.Repo(path)  # type: ignore
+    changes = iter_changed_files(path, pattern, baseline_rev, target_rev, backend)
+    with BlobReader(path) as blobs:
+        for change in changes:
+            yield load_staged(change, path, blobs, target_rev)
+
+
+def iter_changed_files(
+    path: Path,
+    pattern: Optional[str] = None,
+    baseline_rev: Optional[str] = None,
+    target_rev: Optional[str] = None,
+    backend: str = "cli",
+) -> Generator[FileContent, None, None]:
+    """Yields git diffs for all modified files, without reading their content.
+
+    See `iter_diffs` for description of arguments, content of yielded files
+    can be read with `load_staged`.
+
+    Yields:
+        FileContent with path to file, added lines and changed line ranges
+    """
+    get_diffs = _GIT_BACKENDS[backend]
+    with profiler.span("git diff", "discovery"):
+        changes = get_diffs(path, baseline_rev, target_rev)
+
+    for change in changes:
+        if pattern is not None and not re.search(pattern, change.path):
+            continue
+        yield FileContent(
+            path=path / change.path,
+            content=_get_added_lines(change.diff),
+            changed_lines=get_changed_lines(change.diff),
+        )
+
+
+def load_staged(
+    file: FileContent, repo: Path, blobs: BlobReader, target_rev: Optional[str] = None
+) -> FileContent:
+    """Reads full content of changed file from git index or target revision.
 
+    Args:
+        file: changed file from `iter_changed_files`
+        repo: repository root path
+        blobs: reader of git objects in the repository
+        target_rev: git revision name or None for index
+    """
+    with profiler.span("read", path=str(file.path)):
+        data = blobs.read_staged(file.path.relative_to(repo).as_posix(), target_rev)
+    source = None if data is None else read_file(file.path, data).source
+    return file._replace(source=source)
+
+
+def iter_commit_diffs(
+    path: Path, revision_range: str, pattern: Optional[str] = None
+) -> Generator[FileContent, None, None]:
+    """Yields files changed by each commit in range, from the oldest commit.
+
+    Content of files is not read, files are identified by git object name of
+    their version in the commit, see `BlobReader`.
+
+    Args:
+        path: repository root path
+        revision_range: commits understood by `git log`, e.g. "v1.0..HEAD"
+        pattern: filter file types (regex)
+
+    Yields:
+        FileContent with path to file, added lines, changed line ranges,
+        commit and blob name
+    """
+    for commit, changes in git_cli.iter_commit_diffs(path, revision_range):
+        for change in changes:
+            if pattern is not None and not re.search(pattern, change.path):
+                continue
+            yield FileContent(
+                path=path / change.path,
+                content=_get_added_lines(change.diff),
+                changed_lines=get_changed_lines(change.diff),
+                commit=commit,
+                blob=change.blob,
+            )
+
+
+def _get_gitpython_diffs(
+    path: Path, baseline_rev: Optional[str], target_rev: Optional[str]
+) -> List[git_cli.FileDiff]:
+    """Gets patches of changed files using GitPython, without deleted files."""
+    try:
+        import git
+    except ImportError as exc:
+        raise ImportError(
+            "GitPython backend requires GitPython package, install it with "
+            "`pip install docstring_validator[gitpython]`"
+        ) from exc
+
+    repo = git.Repo(path)  # type: ignore
     baseline = repo.rev_parse(baseline_rev or "HEAD")
     target = repo.rev_parse(target_rev) if target_rev else git.Diffable.Index
 
     # equivalent to git diff --cached --unified=0 --patch
-    for change in baseline.diff(target, unified=0, create_patch=True):
-        # omit deleted files
-        if change.b_path is None:
-            continue
-        if pattern is not None:
-            if not re.search(pattern, change.b_path):
-                continue
+    changes = baseline.diff(target, unified=0, create_patch=True)
+    return [
+        git_cli.FileDiff(change.b_path, change.diff.decode())
+        for change in changes
+        if change.b_path is not None  # omit deleted files
+    ]
 
-        file_path = path / change.b_path
-        only_added_lines = _get_added_lines(change.diff.decode())
 
-        result = FileContent(
-            path=file_path,
-            content=only_added_lines,
-        )
-        yield result
+_GIT_BACKENDS = {"cli": git_cli.get_diffs, "gitpython": _get_gitpython_diffs}
 
 
-def iter_files(paths: List[Union[Path, str]]) -> Generator[FileContent, None, None]:
+def iter_files(
+    paths: List[Union[Path, str]], options: Optional[DiscoveryOptions] = None
+) -> Generator[FileContent, None, None]:
     """Yields python files with content for given directory.
 
     Args:
         paths: paths to files to be checked
+        options: file discovery settings
 
     Yields:
         FileContent with path to file and full content
     """
-    files = []
-    for path in paths:
-        path = Path(path).resolve()
-        if path.is_file():
-            files.append(path)
-        else:
-            files.extend(path.rglob("*.py"))
-    files = set(files)
+    for file_ in find_files(paths, options):
+        yield read_file(file_)
+
+
+def find_files(
+    paths: List[Union[Path, str]], options: Optional[DiscoveryOptions] = None
+) -> List[Path]:
+    """Finds python files in given locations.
+
+    Directories are searched recursively, skipping excluded directories, or
+    their files tracked by git are listed, depending on `options.backend`.
+    Files are returned in stable order without duplicates.
+
+    Args:
+        paths: paths to files or directories to be checked
+        options: file discovery settings
+
+    Returns:
+        List of resolved paths to python files
+    """
+    with profiler.span("find files", "discovery"):
+        return list(discover_files(paths, options))
+
+
+def read_file(path: Path, data: Optional[bytes] = None) -> FileContent:
+    """Reads python file for analysis.
 
-    for file_ in files:
-        result = FileContent(path=file_, content=file_.read_text().split("\n"))
-        yield result
+    Args:
+        path: path to the file
+        data: raw file content if already loaded
+
+    Returns:
+        FileContent with path to file and full content
+    """
+    if data is None:
+        with profiler.span("read", path=str(path)):
+            data = path.read_bytes()
+    source = data.decode()
+    if "\r" in source:  # universal newlines, as in Path.read_text
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return FileContent(path=path, content=LineBuffer(source), source=source)
 
 
-def _get_added_lines(diff: str) -> List[str]:
+def _get_added_lines(diff: str) -> LineBuffer:
     """Filters diff output to get only added lines."""
-    return [line for line in diff.split("\n") if line.startswith("+")]
+    return LineBuffer(diff, prefix="+")
+
+
+def get_changed_lines(diff: str) -> List[Tuple[int, int]]:
+    """Gets ranges of changed lines from hunk headers of unified diff.
+
+    Ranges are in line numbers of the new file version, both ends inclusive.
+    Hunk removing lines only is represented by the line preceding removed ones.
+
+    Args:
+        diff: unified diff of a single file
+
+    Returns:
+        List of (first line, last line) tuples
+    """
+    ranges = []
+    for match in HUNK_HEADER.finditer(diff):
+        start = int(match.group(1))
+        count = 1 if match.group(2) is None else int(match.group(2))
+        ranges.append((start, start + max(count, 1) - 1))
+    return ranges
 
 
 def find_func_names(
@@ -92,7 +255,8 @@ def find_func_names(
     """Finds function names in diffs.
 
     Match is done for function declarations - `def <func_name_patter>`.
-    Functions can be filtered using regex pattern.
+    Functions can be filtered using regex pattern. Content of `LineBuffer` is
+    searched at once, without splitting it to lines.
 
     Args:
         diff: section to be analyzed
@@ -102,6 +266,8 @@ def find_func_names(
         List of detected function names
     """
     pattern = f"def ({func_name_pattern})"  # \W?def\s+(\w+) ?
+    if isinstance(diff, LineBuffer):
+        return [match.group(1) for match in diff.search(pattern)]
 
     functions = []
     for line in diff:
@@ -111,6 +277,58 @@ def find_func_names(
     return functions
 
 
+@lru_cache(maxsize=None)
+def func_def_needle(func_name_pattern: Optional[str] = None) -> bytes:
+    """Gets literal bytes present in every line matched by `find_func_names`.
+
+    The needle is `def ` followed by literal prefix of the function name
+    pattern, e.g. `def test_` for `test_\\w+` pattern.
+
+    Args:
+        func_name_pattern: regex pattern for function name
+
+    Returns:
+        Literal bytes which must be present in a file with matching functions
+    """
+    pattern = f"{func_name_pattern}"  # formatted the same as in find_func_names
+    if "|" in pattern:
+        return b"def "
+
+    prefix = []
+    for char in pattern:
+        if char in _REGEX_SPECIAL_CHARS:
+            if char in "*?{" and prefix:
+                prefix.pop()  # preceding character is optional
+            break
+        prefix.append(char)
+    return f"def {''.join(prefix)}".encode()
+
+
+def read_if_contains(path: Path, needle: bytes) -> Optional[bytes]:
+    """Reads raw file content if it contains needle.
+
+    Big files are searched using mmap, so they are not loaded to memory if
+    needle is not present.
+
+    Args:
+        path: path to the file
+        needle: searched bytes
+
+    Returns:
+        File content or None if needle was not found.
+    """
+    with open(path, "rb") as file_:
+        size = os.fstat(file_.fileno()).st_size
+        if size < MMAP_MIN_SIZE:
+            data = file_.read()
+            return data if needle in data else None
+
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(needle) == -1:
+                return None
+            return mapped[:]
+
+
 def from_ref() -> Optional[str]:
     """Retrieves user provided --from-ref."""
     return os.environ.get("PRE_COMMIT_FROM_REF")
@@ -0,0 +1,335 @@
+"""Discovery of python files in directory trees.
+
+Directories are walked with `os.scandir`. Excluded directories (e.g. `.git`,
+virtual environments, build directories) are pruned before descending into
+them, optionally together with paths ignored in `.gitignore` files. Files
+are yielded in stable order - the same as sorted list of paths.
+
+Alternatively files can be listed by git, which yields only files tracked in
+the repository (optionally also untracked, not ignored ones) without walking
+directories, e.g. with generated code or vendored dependencies.
+"""
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+BACKENDS = ("walk", "git")
+DEFAULT_BACKEND = "walk"
+DEFAULT_INCLUDES = ("*.py",)
+DEFAULT_EXCLUDES = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    ".nox",
+    ".venv",
+    "venv",
+    ".eggs",
+    "*.egg-info",
+    "__pycache__",
+    "node_modules",
+    "build",
+    "dist",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".docstring_validator_cache",
+)
+
+
+class DiscoveryOptions(NamedTuple):
+    """Stores settings for file discovery."""
+
+    includes: Sequence[str] = DEFAULT_INCLUDES  # globs for files to be analyzed
+    excludes: Sequence[str] = ()  # globs for skipped files and directories
+    gitignore: bool = False  # skip paths ignored in .gitignore files
+    backend: str = DEFAULT_BACKEND  # "walk" directories or list files tracked by "git"
+    untracked: bool = False  # git backend lists also untracked, not ignored files
+
+    def get_excludes(self) -> Tuple[str, ...]:
+        """Returns user provided excludes together with default ones."""
+        return DEFAULT_EXCLUDES + tuple(self.excludes)
+
+
+class IgnoreRule(NamedTuple):
+    """Single pattern from .gitignore file."""
+
+    regex: Pattern  # compiled pattern
+    negated: bool  # pattern starts with "!" - path is not ignored
+    dir_only: bool  # pattern ends with "/" - matches only directories
+    anchored: bool  # pattern is matched against path relative to .gitignore
+
+
+class GitIgnore:
+    """Rules from a single .gitignore file.
+
+    Attributes:
+        base: directory containing .gitignore file
+        rules: parsed patterns in order of appearance
+    """
+
+    def __init__(self, base: str, rules: List[IgnoreRule]):
+        self.base = base
+        self.rules = rules
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["GitIgnore"]:
+        """Loads .gitignore from directory, returns None if there is none."""
+        try:
+            with open(os.path.join(directory, ".gitignore")) as file_:
+                lines = file_.read().splitlines()
+        except OSError:
+            return None
+        rules = [rule for rule in map(_parse_ignore_rule, lines) if rule]
+        return cls(directory, rules) if rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """Checks if path is ignored.
+
+        Returns:
+            True if path is ignored, False if it is explicitly not ignored and
+            None if no rule matches the path.
+        """
+        relative = path[len(os.path.join(self.base, "")) :].replace(os.sep, "/")
+        name = relative.rsplit("/", 1)[-1]
+        result = None
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(relative if rule.anchored else name):
+                result = not rule.negated
+        return result
+
+
+def discover_files(
+    paths: Sequence[Path], options: Optional[DiscoveryOptions] = None
+) -> Iterator[Path]:
+    """Yields python files from given locations, using backend from options.
+
+    See `walk_files` and `list_git_files` for description of backends.
+
+    Raises:
+        ValueError: if backend is not known
+    """
+    options = options or DiscoveryOptions()
+    if options.backend == "walk":
+        return walk_files(paths, options)
+    if options.backend == "git":
+        return list_git_files(paths, options)
+    raise ValueError(f"unknown discovery backend: {options.backend!r}")
+
+
+def walk_files(
+    paths: Sequence[Path], options: Optional[DiscoveryOptions] = None
+) -> Iterator[Path]:
+    """Yields python files from given locations.
+
+    Files passed explicitly are always yielded, directories are searched
+    recursively for files matching include patterns.
+
+    Args:
+        paths: paths to files or directories
+        options: discovery settings, defaults are used if not provided
+
+    Yields:
+        Path to each discovered file, without duplicates.
+    """
+    options = options or DiscoveryOptions()
+    includes = _compile_globs(options.includes)
+    excludes = _compile_globs(options.get_excludes())
+    seen = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if path.is_file():
+            files = [path]
+        else:
+            ignores = _load_parent_ignores(path) if options.gitignore else []
+            prefix = len(os.path.join(str(path), ""))
+            files = _walk(str(path), prefix, includes, excludes, options, ignores)
+        for file_ in files:
+            if file_ not in seen:
+                seen.add(file_)
+                yield file_
+
+
+def list_git_files(
+    paths: Sequence[Path], options: Optional[DiscoveryOptions] = None
+) -> Iterator[Path]:
+    """Yields python files tracked by git in given locations.
+
+    Files passed explicitly are always yielded. Directories are listed with
+    `git ls-files`, limited by pathspecs derived from include patterns, and
+    the listed paths are matched against include and exclude patterns like in
+    `walk_files`. Paths ignored by git are skipped without reading
+    `.gitignore` files. Files are yielded as git lists them, in index order.
+
+    Args:
+        paths: paths to files or directories in git repository
+        options: discovery settings, defaults are used if not provided
+
+    Yields:
+        Path to each discovered file, without duplicates.
+
+    Raises:
+        subprocess.CalledProcessError: if a directory is not in git repository
+    """
+    # imported on demand, subprocess is not needed by the default backend
+    from docstring_validator import git_cli
+
+    options = options or DiscoveryOptions()
+    includes = _compile_globs(options.includes)
+    excludes = _compile_globs(options.get_excludes())
+    pathspecs = _get_pathspecs(options.includes)
+    seen = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if path.is_file():
+            files = [path]
+        else:
+            listed = git_cli.iter_tracked_files(path, pathspecs, options.untracked)
+            files = (
+                Path(path, relative)
+                for relative in listed
+                if _is_included(relative, includes, excludes)
+            )
+        for file_ in files:
+            # tracked files removed from working tree are listed as well
+            if file_ not in seen and file_.is_file():
+                seen.add(file_)
+                yield file_
+
+
+def _get_pathspecs(includes: Sequence[str]) -> List[str]:
+    """Translates include globs to git pathspecs matching at least same files.
+
+    Wildcards of git pathspecs match also "/", so a glob matches relative path
+    as in `walk_files`, and the same glob after "*/" matches file name.
+    """
+    pathspecs = []
+    for pattern in includes:
+        pathspecs.append(pattern)
+        if "/" not in pattern and not pattern.startswith("*"):
+            pathspecs.append(f"*/{pattern}")
+    return pathspecs
+
+
+def _is_included(relative: str, includes: Pattern, excludes: Pattern) -> bool:
+    """Matches path listed by git as `walk_files` matches walked entries."""
+    parts = relative.split("/")
+    for end in range(1, len(parts) + 1):
+        if excludes.match(parts[end - 1]) or excludes.match("/".join(parts[:end])):
+            return False
+    return bool(includes.match(parts[-1]) or includes.match(relative))
+
+
+def _walk(
+    directory: str,
+    prefix: int,
+    includes: Pattern,
+    excludes: Pattern,
+    options: DiscoveryOptions,
+    ignores: List[GitIgnore],
+) -> Iterator[Path]:
+    """Walks directory tree, `prefix` is length of searched root path."""
+    if options.gitignore:
+        ignore = GitIgnore.load(directory)
+        if ignore is not None:
+            ignores = ignores + [ignore]
+
+    try:
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        relative = entry.path[prefix:].replace(os.sep, "/")
+        if excludes.match(entry.name) or excludes.match(relative):
+            continue
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if ignores and _is_ignored(entry.path, is_dir, ignores):
+            continue
+
+        if is_dir:
+            yield from _walk(entry.path, prefix, includes, excludes, options, ignores)
+        elif includes.match(entry.name) or includes.match(relative):
+            if entry.is_file():
+                yield Path(entry.path)
+
+
+def _compile_globs(patterns: Sequence[str]) -> Pattern:
+    """Compiles shell-style globs into a single regex, as used by fnmatch."""
+    if not patterns:
+        return re.compile(r"(?!)")  # matches nothing
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _is_ignored(path: str, is_dir: bool, ignores: List[GitIgnore]) -> bool:
+    ignored = False
+    for ignore in ignores:
+        result = ignore.match(path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
+
+
+def _load_parent_ignores(path: Path) -> List[GitIgnore]:
+    """Loads .gitignore files from repository root down to parent of `path`."""
+    parents = []
+    for parent in path.parents:
+        parents.append(parent)
+        if (parent / ".git").exists():
+            break
+    else:
+        return []
+
+    ignores = [GitIgnore.load(str(parent)) for parent in reversed(parents)]
+    return [ignore for ignore in ignores if ignore is not None]
+
+
+def _parse_ignore_rule(line: str) -> Optional[IgnoreRule]:
+    line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated or line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    anchored = "/" in line
+    line = line.lstrip("/")
+    if not line:
+        return None
+    return IgnoreRule(re.compile(_translate(line)), negated, dir_only, anchored)
+
+
+def _translate(pattern: str) -> str:
+    """Translates gitignore glob to regex, `*` does not match `/`."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            chars = pattern[i + 1 : end]
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            regex += f"[{chars}]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return regex + r"\Z"
@@ -66,7 +66,9 @@ class Docstring:
         string_chunks = raw_docstring.split("\n\n")
         raw_chunks = []
         for chunk in string_chunks:
-            raw_chunks.append([line.strip() for line in chunk.split("\n") if line])
+            lines = [line.strip() for line in chunk.split("\n") if line]
+            if lines:
+                raw_chunks.append(lines)
         return raw_chunks
 
     def _parse_raw_chunks(self, raw_chunks: List[List[str]]) -> List[chunks.Chunk]:
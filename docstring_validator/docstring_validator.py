@@ -1,17 +1,138 @@
 """Runners for different modes of operation for docstring validator."""
+import os
+import re
+import threading
+from collections import Counter, OrderedDict, deque
 from pathlib import Path
-from typing import Generator, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from docstring_validator import diff_util
-from docstring_validator.code_parser import get_docstring
+from docstring_validator import code_parser, diff_util, profiler, schema_plan
+from docstring_validator.blob_reader import BlobReader
+from docstring_validator.cache import (
+    BlobCache,
+    ResultCache,
+    Stamp,
+    StatCache,
+    get_stamp,
+)
+from docstring_validator.discovery import DiscoveryOptions, discover_files
 from docstring_validator.docstring_model import Docstring
-from docstring_validator.reporter import report_errors
-from docstring_validator.validation_error import ValidationError
+from docstring_validator.result_store import Report, ResultStore
+from docstring_validator.summary import Summary
+from docstring_validator.validation_error import ErrorRecord, ValidationError
+
+if TYPE_CHECKING:  # imported on demand, sharding loads output writers
+    from docstring_validator.shard import Shard
+
+# Work smaller than this (in bytes) is analyzed serially, pool start-up would dominate
+PARALLEL_MIN_BYTES = 256 * 1024
+# Files submitted to pool and not yet yielded per worker, bounds results kept in memory
+PARALLEL_WINDOW = 8
+# Number of distinct docstrings with memoized validation result
+DEFAULT_MEMO_SIZE = 4096
+
+WorkItem = Union[Path, diff_util.FileContent]
+
+
+class AnalysisOptions(NamedTuple):
+    """Stores settings for analysis of a single file."""
+
+    func_name_filter: Optional[str] = None  # pattern for function names
+    cache_dir: Optional[Path] = None  # location of result cache, None to disable
+    memo_size: int = DEFAULT_MEMO_SIZE  # validation memo capacity, 0 to disable
+    profile: bool = False  # record profiler spans, also in worker processes
+    max_errors: Optional[int] = None  # stop after given number of errors
+    parser: str = code_parser.DEFAULT_PARSER  # engine finding functions, see PARSERS
+
+
+class FileResult(NamedTuple):
+    """Stores analysis result for a single file."""
+
+    path: Path  # path of the analyzed file
+    errors: Dict[str, List[ValidationError]]  # errors keyed by function name
+    functions: Dict[str, code_parser.FunctionInfo]  # definitions of failing functions
+    stats: Counter  # counters collected during analysis
+    trace: Sequence[dict] = ()  # profiler spans recorded in worker process
+    stamp: Optional[Stamp] = None  # version of analyzed file, for stat cache
+    commit: Optional[str] = None  # commit which changed the file, in range audit
+    checked: int = 0  # number of validated functions
+
+    def to_dict(self) -> dict:
+        """Converts result to JSON serializable dictionary, without path and stats."""
+        return dict(
+            errors={
+                func: [[error.code, error.text] for error in func_errors]
+                for func, func_errors in self.errors.items()
+            },
+            functions={func: list(info) for func, info in self.functions.items()},
+            checked=self.checked,
+        )
+
+    @classmethod
+    def from_dict(cls, path: Path, data: dict, stats: Counter) -> "FileResult":
+        """Restores result created with `to_dict`."""
+        errors = {
+            func: [ValidationError(code, text) for code, text in func_errors]
+            for func, func_errors in data["errors"].items()
+        }
+        functions = {
+            func: code_parser.FunctionInfo(*info)
+            for func, info in data["functions"].items()
+        }
+        return cls(path, errors, functions, stats, checked=data["checked"])
+
+    def count(self) -> int:
+        """Returns number of detected errors."""
+        return sum(len(func_errors) for func_errors in self.errors.values())
+
+    def truncate(self, limit: int) -> "FileResult":
+        """Returns result with only first `limit` errors."""
+        errors = {}
+        for func, func_errors in self.errors.items():
+            if limit <= 0:
+                break
+            errors[func] = func_errors[:limit]
+            limit -= len(errors[func])
+        functions = {func: self.functions[func] for func in errors}
+        return self._replace(errors=errors, functions=functions)
+
+    def iter_records(self) -> Iterator[ErrorRecord]:
+        """Yields located errors detected in the file."""
+        for func, func_errors in self.errors.items():
+            info = self.functions[func]
+            for error in func_errors:
+                yield ErrorRecord(
+                    self.path,
+                    func,
+                    info.lineno,
+                    info.end_lineno,
+                    error.code,
+                    error.text,
+                    self.commit,
+                )
 
 
 def analyze_staged(
-    path: Union[Path, str], func_name_filter: Optional[str] = None
-) -> List[str]:
+    path: Union[Path, str],
+    func_name_filter: Optional[str] = None,
+    jobs: int = 1,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    max_errors: Optional[int] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Report:
     """Finds new functions in staged files and analyzes docstrings.
 
     To filter functions to be analyzed `func_name_filter` must be provided.
@@ -29,22 +150,33 @@ def analyze_staged(
     Args:
         path: repository root path
         func_name_filter: pattern for function names
+        jobs: number of worker processes, 0 to use all CPUs
+        stats: optional counter updated with analysis statistics
+        memo_size: number of distinct docstrings with memoized validation result
+        max_errors: stop analysis after given number of errors, None for no limit
+        parser: engine finding functions in files, "ast" or "tokenize"
 
     Returns:
-        Text report from analysis
+        Text report from analysis, lines are formatted when accessed
     """
-    generator = diff_util.iter_diffs(
-        Path(path).resolve(),
-        pattern=r"\.py$",
-        baseline_rev=diff_util.from_ref(),
-        target_rev=diff_util.to_ref(),
+    records = iter_staged_errors(
+        path, func_name_filter, jobs, stats, memo_size, max_errors, parser
     )
-    return _analyze_files(generator, func_name_filter)
+    return ResultStore.from_records(records).report()
 
 
 def analyze_files(
-    path: List[Union[Path, str]], func_name_filter: Optional[str] = None
-) -> List[str]:
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str] = None,
+    jobs: int = 1,
+    cache_dir: Optional[Union[Path, str]] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    discovery: Optional[DiscoveryOptions] = None,
+    max_errors: Optional[int] = None,
+    shard: Optional["Shard"] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Report:
     """Finds functions in files in provided location and analyzes docstrings.
 
     Path can be file name or directory. If directory is provided, then it will
@@ -62,38 +194,651 @@ def analyze_files(
     >>> docstring.validator.analyze_files(path, pattern)
     ...
 
+    Directories are searched for files matching include patterns from
+    `discovery`, skipping excluded paths (e.g. `.git`, `.tox`, virtual
+    environments and build directories). With `discovery.backend` set to
+    "git", only files tracked by git are analyzed.
+
+    Results can be cached on disk between runs in `cache_dir`. Only files which
+    content changed since previous run are analyzed then.
+
     Args:
         path: paths to files to be analyzed
         func_name_filter: pattern for function names
+        jobs: number of worker processes, 0 to use all CPUs
+        cache_dir: location of result cache, None disables cache
+        stats: optional counter updated with analysis statistics
+        memo_size: number of distinct docstrings with memoized validation result
+        discovery: file discovery settings, e.g. include and exclude patterns
+        max_errors: stop analysis after given number of errors, None for no limit.
+            Number of files left unchecked is counted in `stats`.
+        shard: analyze only files of given shard, see `Shard.select`
+        parser: engine finding functions in files, "ast" or "tokenize". Both
+            give the same results, "tokenize" does not build syntax trees.
 
     Returns:
-        Text report from analysis
+        Text report from analysis, lines are formatted when accessed. Errors
+        are kept in compact `ResultStore`, available as `store` attribute.
+    """
+    records = iter_errors(
+        path,
+        func_name_filter,
+        jobs,
+        cache_dir,
+        stats,
+        memo_size,
+        discovery,
+        max_errors,
+        shard,
+        parser,
+    )
+    return ResultStore.from_records(records).report()
+
+
+def iter_staged_errors(
+    path: Union[Path, str],
+    func_name_filter: Optional[str] = None,
+    jobs: int = 1,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    max_errors: Optional[int] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Iterator[ErrorRecord]:
+    """Yields errors for new functions in staged files as files are analyzed.
+
+    Streaming counterpart of `analyze_staged`, see it for description of
+    arguments. Errors of a file are yielded as soon as the file is analyzed,
+    files are reported in order of git diff.
+
+    Yields:
+        ErrorRecord for each detected error
     """
-    generator = diff_util.iter_files(path)
-    return _analyze_files(generator, func_name_filter)
+    repo = Path(path).resolve()
+    target_rev = diff_util.to_ref()
+    changes = diff_util.iter_changed_files(
+        repo, pattern=r"\.py$", baseline_rev=diff_util.from_ref(), target_rev=target_rev
+    )
+    options = AnalysisOptions(
+        func_name_filter,
+        memo_size=memo_size,
+        profile=profiler.is_enabled(),
+        max_errors=max_errors,
+        parser=parser,
+    )
+    with BlobReader(repo) as blobs:
 
+        def load(file: diff_util.FileContent) -> diff_util.FileContent:
+            return diff_util.load_staged(file, repo, blobs, target_rev)
+
+        for result in _iter_results(changes, options, jobs, stats, load):
+            yield from result.iter_records()
+
+
+def iter_range_errors(
+    path: Union[Path, str],
+    revision_range: str,
+    func_name_filter: Optional[str] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    max_errors: Optional[int] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Iterator[ErrorRecord]:
+    """Yields errors for functions changed by each commit in revision range.
+
+    Commits are analyzed from the oldest one, merge commits are skipped. Each
+    commit is checked like staged changes - only functions overlapping lines
+    changed by the commit are validated, in the version from the commit.
+    Errors are attributed to the commit in `ErrorRecord.commit`.
+
+    Files are read from git objects. Parsed files are kept in memory keyed by
+    blob object name, and validation results by docstring text, so a file
+    version or docstring present in many commits is processed once.
+
+    >>> import docstring_validator
+    >>> for error in docstring_validator.iter_range_errors(".", "v1.0..HEAD"):
+    ...     print(error.commit, error.path, error.function, error.code)
+
+    Args:
+        path: repository root path
+        revision_range: commits understood by `git log`, e.g. "v1.0..HEAD"
+        func_name_filter: pattern for function names
+        stats: optional counter updated with analysis statistics
+        memo_size: number of distinct docstrings with memoized validation result
+        max_errors: stop analysis after given number of errors, None for no limit
+        parser: engine finding functions in files, "ast" or "tokenize"
+
+    Yields:
+        ErrorRecord for each detected error
+    """
+    repo = Path(path).resolve()
+    changes = diff_util.iter_commit_diffs(repo, revision_range, pattern=r"\.py$")
+    options = AnalysisOptions(
+        func_name_filter,
+        memo_size=memo_size,
+        profile=profiler.is_enabled(),
+        max_errors=max_errors,
+        parser=parser,
+    )
+    with BlobReader(repo) as blobs:
+        # serial analysis, parsed blobs are cached in this process
+        results = _iter_results(
+            changes, options, 1, stats, lambda file: _load_blob(file, blobs)
+        )
+        for result in results:
+            yield from result.iter_records()
+
+
+def _load_blob(file: diff_util.FileContent, blobs: BlobReader) -> diff_util.FileContent:
+    """Reads file version from git, unless it was parsed before."""
+    if not file.changed_lines or file.blob is None or file.blob in _blob_cache:
+        return file
+    with profiler.span("read", path=str(file.path)):
+        data = blobs.read(file.blob)
+    if data is None:  # e.g. submodule, nothing to analyze
+        return file._replace(changed_lines=[])
+    return file._replace(source=diff_util.read_file(file.path, data).source)
+
+
+def iter_errors(
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str] = None,
+    jobs: int = 1,
+    cache_dir: Optional[Union[Path, str]] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    discovery: Optional[DiscoveryOptions] = None,
+    max_errors: Optional[int] = None,
+    shard: Optional["Shard"] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+    files: Optional[Sequence[Path]] = None,
+) -> Iterator[ErrorRecord]:
+    """Yields errors for functions in provided location as files are analyzed.
+
+    Streaming counterpart of `analyze_files`, see it for description of
+    arguments. Errors of a file are yielded as soon as the file is analyzed,
+    so detected errors are available before analysis of all files is done.
+
+    >>> import docstring_validator
+    >>> for error in docstring_validator.iter_errors(["tests"], "test_\\w+"):
+    ...     print(error.path, error.function, error.line, error.code)
+
+    Args:
+        files: files already discovered in `path`, e.g. to match records with
+            shard indexes, discovery is not repeated then
+
+    Yields:
+        ErrorRecord for each detected error
+    """
+    results = _iter_file_results(
+        path,
+        func_name_filter,
+        jobs,
+        cache_dir,
+        stats,
+        memo_size,
+        discovery,
+        max_errors,
+        shard,
+        parser,
+        files,
+    )
+    for result in results:
+        yield from result.iter_records()
+
+
+def summarize_files(
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str] = None,
+    jobs: int = 1,
+    cache_dir: Optional[Union[Path, str]] = None,
+    stats: Optional[Counter] = None,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    discovery: Optional[DiscoveryOptions] = None,
+    root: Optional[Union[Path, str]] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+) -> Summary:
+    """Counts errors and checked functions in provided location.
+
+    Counterpart of `analyze_files` for dashboards, see it for description of
+    arguments. Results of files are added to counters as they are analyzed and
+    dropped, so memory use does not grow with number of files and errors.
+    Without parallel jobs files are analyzed as they are discovered, so list
+    of all paths is not kept either.
+
+    >>> import docstring_validator
+    >>> summary = docstring_validator.summarize_files(["."], "test_\\w+")
+    >>> summary.total.checked, summary.total.failing, summary.codes
+    ...
+
+    Args:
+        root: directory whose subdirectories are counted as packages, current
+            working directory by default
+        parser: engine finding functions in files, "ast" or "tokenize"
+
+    Returns:
+        Counts per error code, per top-level package and in total
+    """
+    summary = Summary(root)
+    results = _iter_file_results(
+        path,
+        func_name_filter,
+        jobs,
+        cache_dir,
+        stats,
+        memo_size,
+        discovery,
+        parser=parser,
+        # serial analysis consumes discovered paths as they are found
+        files=discover_files(path, discovery) if jobs == 1 else None,
+    )
+    for result in results:
+        summary.add(result.path, result.checked, result.errors)
+    return summary
+
+
+def _iter_file_results(
+    path: List[Union[Path, str]],
+    func_name_filter: Optional[str],
+    jobs: int,
+    cache_dir: Optional[Union[Path, str]],
+    stats: Optional[Counter],
+    memo_size: int,
+    discovery: Optional[DiscoveryOptions],
+    max_errors: Optional[int] = None,
+    shard: Optional["Shard"] = None,
+    parser: str = code_parser.DEFAULT_PARSER,
+    files: Optional[Iterable[Path]] = None,
+) -> Iterator[FileResult]:
+    """Discovers files in provided location and yields their analysis results."""
+    if files is None:
+        files = _find_files(path, discovery, serial=shard is None and jobs == 1)
+    if shard is not None:
+        files = [files[i] for i in shard.select(files)]
+    options = AnalysisOptions(
+        func_name_filter,
+        Path(cache_dir).resolve() if cache_dir else None,
+        memo_size,
+        profiler.is_enabled(),
+        max_errors,
+        parser,
+    )
+    return _iter_results(files, options, jobs, stats)
+
+
+def _find_files(
+    path: List[Union[Path, str]], discovery: Optional[DiscoveryOptions], serial: bool
+) -> Iterable[Path]:
+    """Discovers files, as they are listed if analysis is serial and git lists them."""
+    if serial and discovery and discovery.backend == "git":
+        # analysis starts while git is still listing files
+        return discover_files(path, discovery)
+    return diff_util.find_files(path, discovery)
 
-def _analyze_files(
-    generator: Generator, func_name_filter: Optional[str] = None
-) -> List[str]:
-    errors = {}
-    for file in generator:
-        func_names = diff_util.find_func_names(file.content, func_name_filter)
 
-        file_errors = {}
-        for func in func_names:
-            result = _analyze_docstring(get_docstring(file.path, func))
+def _iter_results(
+    work: Iterable[WorkItem],
+    options: AnalysisOptions,
+    jobs: int = 1,
+    stats: Optional[Counter] = None,
+    load: Optional[Callable[[WorkItem], WorkItem]] = None,
+) -> Iterator[FileResult]:
+    """Analyzes files serially or in process pool, keeping order of `work`.
+
+    Serial analysis consumes `work` lazily. Pool is used only when it pays off,
+    biggest files are scheduled first to keep workers evenly loaded until the
+    end of the run, while results are still yielded in order of `work`. At
+    most `PARALLEL_WINDOW` files per worker are submitted ahead, so results
+    waiting to be yielded do not accumulate in memory.
+
+    `load` prepares item just before its analysis, e.g. reads its content
+    from git, so work which is not analyzed is not loaded either.
+
+    When `options.max_errors` errors are found, remaining files are not
+    analyzed and pending parallel work is cancelled. Number of skipped files
+    is counted in `files_unchecked` statistic, without loading them.
+    """
+    load = load or _keep
+    if jobs != 1:
+        work = list(work)
+        jobs = min(jobs or os.cpu_count() or 1, len(work))
+    sizes = [_get_size(item) for item in work] if jobs > 1 else []
+
+    if jobs <= 1 or sum(sizes) < PARALLEL_MIN_BYTES:
+        pending = iter(work)
+        results = (_analyze_file(load(item), options) for item in pending)
+    else:
+        pending = None
+        results = _iter_parallel(work, sizes, options, jobs, load)
+
+    budget = options.max_errors
+    analyzed = 0
+    written = 0
+    for result in results:
+        analyzed += 1
+        written += result.stats["cache_writes"]
+        _collect_result(result, options, stats)
+        if budget is not None:
+            if result.count() >= budget:
+                results.close()  # cancels pending parallel work
+                if stats is not None:
+                    stats["error_limit_reached"] = 1
+                    stats["files_unchecked"] += (
+                        len(work) - analyzed
+                        if pending is None
+                        else sum(1 for _ in pending)
+                    )
+                yield result.truncate(budget)
+                break
+            budget -= result.count()
+        yield result
+
+    if options.cache_dir is not None and written:
+        # pruning scans the whole cache, so it is skipped when nothing was added
+        ResultCache(options.cache_dir).prune()
+
+
+def _keep(item: WorkItem) -> WorkItem:
+    return item
+
+
+def _collect_result(
+    result: FileResult, options: AnalysisOptions, stats: Optional[Counter]
+):
+    """Merges statistics, profiler spans and stat cache entry of file result."""
+    if stats is not None:
+        stats.update(result.stats)
+    if result.trace:
+        profiler.record(result.trace)
+    if result.stamp is not None and _stat_cache is not None:
+        # stored in main process, also for results from pool workers
+        _stat_cache.put(
+            result.path, options.func_name_filter, result.stamp, result.to_dict()
+        )
+
+
+def _iter_parallel(
+    work: List[WorkItem],
+    sizes: List[int],
+    options: AnalysisOptions,
+    jobs: int,
+    load: Callable[[WorkItem], WorkItem],
+) -> Iterator[FileResult]:
+    # imported on demand, multiprocessing adds to startup time of every run
+    from concurrent.futures import ProcessPoolExecutor
+
+    schedule = deque(sorted(range(len(work)), key=lambda i: sizes[i], reverse=True))
+    limit = jobs * PARALLEL_WINDOW
+    futures = {}  # submitted files, until their result is yielded
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            for i in range(len(work)):
+                while schedule and len(futures) < limit:
+                    j = schedule.popleft()
+                    if j >= i and j not in futures:  # not submitted out of order
+                        futures[j] = executor.submit(
+                            _analyze_file, load(work[j]), options
+                        )
+                if i not in futures:
+                    # needed before bigger files, submitted out of order
+                    futures[i] = executor.submit(_analyze_file, load(work[i]), options)
+                # results are not kept after they are yielded
+                yield futures.pop(i).result()
+        finally:
+            # files not started yet are skipped when consumer stops early
+            for future in futures.values():
+                future.cancel()
+
+
+def _analyze_file(item: WorkItem, options: AnalysisOptions) -> FileResult:
+    """Reads, parses and validates single file, using result cache if enabled."""
+    if options.profile and not profiler.is_enabled():
+        # running in pool worker, spans are passed to main process with result
+        profiler.enable()
+        try:
+            result = _analyze_file(item, options)
+        finally:
+            recorded = profiler.disable()
+        return result._replace(trace=recorded.events)
+
+    path = item if isinstance(item, Path) else item.path
+    with profiler.span("file", path=str(path)):
+        return _analyze_work_item(item, options)
+
+
+def _analyze_work_item(item: WorkItem, options: AnalysisOptions) -> FileResult:
+    stats = Counter(files=1)
+    if not isinstance(item, Path):
+        return _validate_file(item, options, stats)
+    if _stat_cache is None:
+        return _analyze_path(item, options, stats)
+
+    stamp = get_stamp(item)
+    cached = _stat_cache.get(item, options.func_name_filter, stamp)
+    if cached is not None:
+        stats["stat_cache_hits"] += 1
+        return FileResult.from_dict(item, cached, stats)
+    result = _analyze_path(item, options, stats)
+    return result._replace(stamp=stamp) if _is_complete(result, options) else result
+
+
+def _is_complete(result: FileResult, options: AnalysisOptions) -> bool:
+    """Checks that result was not cut short by error limit, so it can be cached."""
+    return options.max_errors is None or result.count() < options.max_errors
+
+
+def _analyze_path(item: Path, options: AnalysisOptions, stats: Counter) -> FileResult:
+    with profiler.span("read", path=str(item)):
+        data = _read_path(item, options)
+    return _analyze_data(item, data, options, stats)
+
+
+def _read_path(item: Path, options: AnalysisOptions) -> Optional[bytes]:
+    """Reads file content, None if file has no matching function definitions."""
+    return diff_util.read_if_contains(
+        item, diff_util.func_def_needle(options.func_name_filter)
+    )
+
+
+def _analyze_data(
+    item: Path, data: Optional[bytes], options: AnalysisOptions, stats: Counter
+) -> FileResult:
+    """Analyzes already read file, using result cache if enabled."""
+    # files without matching function definitions are not decoded nor parsed
+    if data is None:
+        stats["files_skipped"] += 1
+        return FileResult(item, {}, {}, stats)
+    if options.cache_dir is None:
+        return _validate_file(diff_util.read_file(item, data), options, stats)
+
+    cache = ResultCache(options.cache_dir)
+    key = cache.key(data, options.func_name_filter)
+    cached = cache.get(key)
+    if cached is not None:
+        stats["cache_hits"] += 1
+        return FileResult.from_dict(item, cached, stats)
+
+    stats["cache_misses"] += 1
+    result = _validate_file(diff_util.read_file(item, data), options, stats)
+    if _is_complete(result, options):
+        cache.put(key, result.to_dict())
+        stats["cache_writes"] += 1
+    return result
+
+
+def _validate_file(
+    file: diff_util.FileContent, options: AnalysisOptions, stats: Counter
+) -> FileResult:
+    if file.changed_lines is None:
+        func_names = diff_util.find_func_names(file.content, options.func_name_filter)
+        if not func_names:
+            return FileResult(file.path, {}, {}, stats)
+        index = _parse_file(file, options.parser, stats)
+        functions = [index.get_function(func) for func in func_names]
+    else:
+        if not file.changed_lines:
+            return FileResult(file.path, {}, {}, stats, commit=file.commit)
+        index = _parse_file(file, options.parser, stats)
+        functions = _find_changed_functions(
+            index, file.changed_lines, options.func_name_filter
+        )
+
+    memo = _get_memo(options.memo_size)
+    errors = {}
+    failing = {}
+    remaining = options.max_errors
+    checked = 0
+    with profiler.span("validate", path=str(file.path)):
+        for func in functions:
+            checked += 1
+            result = memo.validate(func.docstring, stats, remaining)
             if result:
-                file_errors[func] = result
-        if file_errors:
-            errors[file.path] = file_errors
+                errors[func.name] = result
+                failing[func.name] = func
+                if remaining is not None:
+                    remaining -= len(result)
+                    if remaining <= 0:
+                        break
+    return FileResult(
+        file.path, errors, failing, stats, commit=file.commit, checked=checked
+    )
+
+
+def _find_changed_functions(
+    index: code_parser.SymbolIndex,
+    changed_lines: List[Tuple[int, int]],
+    func_name_filter: Optional[str],
+) -> List[code_parser.FunctionInfo]:
+    """Finds functions matching name pattern which overlap changed lines.
+
+    Name is matched the same way as in `find_func_names`, from its beginning.
+    """
+    pattern = re.compile(f"{func_name_filter}")
+    functions = []
+    for func in index.functions:
+        if not pattern.match(func.name):
+            continue
+        last_line = func.end_lineno or func.lineno
+        if any(
+            start <= last_line and func.lineno <= end for start, end in changed_lines
+        ):
+            functions.append(func)
+    return functions
+
+
+def _get_size(item: WorkItem) -> int:
+    path = item if isinstance(item, Path) else item.path
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
 
-    report = report_errors(errors)
-    return report
+def _parse_file(
+    file: diff_util.FileContent, parser: str, stats: Counter
+) -> code_parser.SymbolIndex:
+    """Builds symbol index reusing already loaded file content if possible."""
+    if file.blob is not None and file.source is None:
+        # loaded just before analysis, see `_load_blob`
+        index = _blob_cache.get(file.blob)
+        if index is not None:
+            stats["blob_cache_hits"] += 1
+            return index
+    if file.source is None:
+        return code_parser.parse_file(file.path, parser)
+    index = code_parser.parse_source(file.source, file.path, parser)
+    if file.blob is not None:
+        _blob_cache.put(file.blob, index)
+    return index
 
 
-def _analyze_docstring(raw_docstring: Optional[str]) -> List[ValidationError]:
-    """Checks if docstring adheres to schema."""
+def _analyze_docstring(
+    raw_docstring: Optional[str], limit: Optional[int] = None
+) -> List[ValidationError]:
+    """Checks if docstring adheres to schema, returning at most `limit` errors."""
+    plan = schema_plan.get_plan(Docstring)
+    if plan is not None:
+        return plan.validate(raw_docstring, limit)
+
     docstring = Docstring(raw_docstring)
     errors = docstring.validate()
-    return errors
+    return errors if limit is None else errors[:limit]
+
+
+class _ValidationMemo:
+    """Bounded memo of docstring validation results.
+
+    Identical docstrings (e.g. in parametrized or generated tests) are validated
+    only once. Results are keyed by docstring text and schema identity, least
+    recently used results are dropped when memo is full. Memo is shared by
+    analyses running concurrently in threads, e.g. with asyncio API.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(
+        self, raw_docstring: Optional[str], stats: Counter, limit: Optional[int] = None
+    ) -> List[ValidationError]:
+        """Validates docstring, results limited with `limit` are not memoized."""
+        if self.maxsize <= 0:
+            return _analyze_docstring(raw_docstring, limit)
+
+        key = (id(Docstring.schema), raw_docstring)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+        if result is not None:
+            stats["memo_hits"] += 1
+            return list(result[:limit])
+
+        stats["memo_misses"] += 1
+        result = _analyze_docstring(raw_docstring, limit)
+        if limit is None or len(result) < limit:
+            with self._lock:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return list(result)
+
+
+_memo = _ValidationMemo(DEFAULT_MEMO_SIZE)
+
+
+_stat_cache: Optional[StatCache] = None
+
+# parsed files from git history, keyed by blob object name
+_blob_cache = BlobCache()
+
+
+def enable_stat_cache(cache: Optional[StatCache] = None) -> StatCache:
+    """Keeps results of analyzed files in memory of this process.
+
+    Results are reused while modification time and size of files are
+    unchanged. Meant for long-running processes, e.g. daemon.
+    """
+    global _stat_cache
+    _stat_cache = cache or StatCache()
+    return _stat_cache
+
+
+def disable_stat_cache():
+    """Drops in-memory results of analyzed files."""
+    global _stat_cache
+    _stat_cache = None
+
+
+def reset_memo():
+    """Drops memoized validation results, e.g. between benchmark runs."""
+    global _memo
+    _memo = _ValidationMemo(_memo.maxsize)
+
+
+def _get_memo(maxsize: int) -> _ValidationMemo:
+    """Returns memo shared by all files analyzed in this process."""
+    global _memo
+    if _memo.maxsize != maxsize:
+        _memo = _ValidationMemo(maxsize)
+    return _memo
@@ -0,0 +1,207 @@
+"""Minimal git backend calling git command line tool directly.
+
+Only the operations needed by staged files check, commit range audit and
+discovery of tracked files are supported. Spawning `git diff` is much cheaper than importing GitPython,
+which dominated startup time of the pre-commit hook.
+"""
+import codecs
+import subprocess
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+DIFF_ARGS = (
+    "diff",
+    "--unified=0",
+    "--no-color",
+    "--no-ext-diff",
+    "--find-renames",
+    "--full-index",
+    # paths are parsed with these prefixes, override diff.noprefix and similar config
+    "--src-prefix=a/",
+    "--dst-prefix=b/",
+)
+# commits are separated by NUL, which git never prints in text patches
+LOG_ARGS = ("log", "--no-merges", "--reverse", "--no-show-signature", "--format=%x00%H")
+LS_FILES_ARGS = ("ls-files", "-z", "--cached")
+READ_SIZE = 64 * 1024
+
+
+class FileDiff(NamedTuple):
+    """Patch of a single file."""
+
+    path: str  # path in target version, relative to repository root
+    diff: str  # hunks of unified diff
+    blob: Optional[str] = None  # object name of target version, if content changed
+
+
+def get_diffs(
+    repo: Union[Path, str],
+    baseline_rev: Optional[str] = None,
+    target_rev: Optional[str] = None,
+) -> List[FileDiff]:
+    """Gets patches of files changed between revisions, without deleted files.
+
+    Args:
+        repo: path to git repository
+        baseline_rev: git revision name for baseline or None for HEAD
+        target_rev: git revision name for current or None for Index
+
+    Raises:
+        subprocess.CalledProcessError: if git command fails
+    """
+    args = ["git", "-c", "core.quotePath=false", *DIFF_ARGS]
+    if target_rev is None:
+        # without baseline git compares index with HEAD or with empty tree
+        # before the first commit
+        args += ["--cached"] + ([baseline_rev] if baseline_rev else [])
+    else:
+        args += [baseline_rev or "HEAD", target_rev]
+    args.append("--")
+
+    output = subprocess.run(
+        args, cwd=repo, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ).stdout
+    return parse_diff(output)
+
+
+def iter_commit_diffs(
+    repo: Union[Path, str], revision_range: str
+) -> Iterator[Tuple[str, List[FileDiff]]]:
+    """Yields patches of each commit in range, from the oldest commit.
+
+    Merge commits are skipped, their changes are attributed to merged
+    commits. Output of a single `git log` process is parsed as it is read.
+
+    Args:
+        repo: path to git repository
+        revision_range: commits understood by `git log`, e.g. "v1.0..HEAD"
+
+    Yields:
+        Tuple of commit object name and patches of files it changed
+
+    Raises:
+        subprocess.CalledProcessError: if git command fails
+    """
+    args = ["git", "-c", "core.quotePath=false", *LOG_ARGS, *DIFF_ARGS[1:]]
+    args += [revision_range, "--"]
+    for block in _iter_output(args, repo, b"\0"):
+        commit, _, output = block.partition(b"\n")
+        if commit:
+            yield commit.decode(), parse_diff(output)
+
+
+def iter_tracked_files(
+    directory: Union[Path, str], pathspecs: Sequence[str] = (), untracked: bool = False
+) -> Iterator[str]:
+    """Yields files tracked by git in directory, as `git ls-files` lists them.
+
+    Paths are yielded while git is still running, so analysis of the first
+    files can start before the whole repository is listed.
+
+    Args:
+        directory: directory in git repository
+        pathspecs: git pathspecs limiting listed files, e.g. "*.py"
+        untracked: list also untracked files, which are not ignored
+
+    Yields:
+        Path of each file relative to `directory`, in git index order
+
+    Raises:
+        subprocess.CalledProcessError: if git command fails, e.g. directory is
+            not in a git repository
+    """
+    args = ["git", *LS_FILES_ARGS]
+    if untracked:
+        args += ["--others", "--exclude-standard"]
+    args += ["--", *pathspecs]
+    for path in _iter_output(args, directory, b"\0"):
+        if path:
+            yield path.decode(errors="surrogateescape")
+
+
+def _iter_output(
+    args: List[str], cwd: Union[Path, str], separator: bytes
+) -> Iterator[bytes]:
+    """Runs git command, yielding parts of its output as they are read.
+
+    Process is killed if consumer stops before reading all of the output.
+
+    Raises:
+        subprocess.CalledProcessError: if git command fails
+    """
+    with subprocess.Popen(
+        args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        try:
+            yield from _split_stream(process, separator)
+        finally:
+            if process.poll() is None:  # consumer stopped early
+                process.kill()
+        stderr = process.stderr.read()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args, stderr=stderr)
+
+
+def _split_stream(process: subprocess.Popen, separator: bytes) -> Iterator[bytes]:
+    """Splits standard output of process, without joining all of it."""
+    pending: List[bytes] = []
+    for chunk in iter(partial(process.stdout.read, READ_SIZE), b""):
+        *complete, rest = chunk.split(separator)
+        for part in complete:
+            pending.append(part)
+            yield b"".join(pending)
+            pending = []
+        pending.append(rest)
+    process.wait()
+    yield b"".join(pending)
+
+
+def parse_diff(output: bytes) -> List[FileDiff]:
+    """Splits output of `git diff` into patches of separate files."""
+    diffs = []
+    for block in (b"\n" + output).split(b"\ndiff --git ")[1:]:
+        header, _, body = block.partition(b"\n@@")
+        lines = header.split(b"\n")
+        path = _get_target_path(lines)
+        if path is not None:
+            diff = ("@@" + body.decode(errors="replace")) if body else ""
+            diffs.append(FileDiff(path, diff, _get_blob(lines)))
+    return diffs
+
+
+def _get_blob(header: List[bytes]) -> Optional[str]:
+    """Reads object name of new file version from "index <old>..<new>" line."""
+    for line in header[1:]:
+        if line.startswith(b"index "):
+            names = line.split()[1]
+            return names.partition(b"..")[2].decode() or None
+    return None
+
+
+def _get_target_path(header: List[bytes]) -> Optional[str]:
+    """Reads path of new file version from header of a file patch.
+
+    Header starts with "a/<path> b/<path>" line, followed by extended header
+    lines and, if file content was changed, "---" and "+++" lines.
+    """
+    path = None
+    for line in header[1:]:
+        if line.startswith(b"deleted file mode"):
+            return None
+        if line.startswith(b"+++ "):
+            # git appends tab to unquoted paths containing spaces
+            path = _unquote(line[4:].rstrip(b"\t"))[2:]  # strip "b/"
+        elif line.startswith(b"rename to ") and path is None:
+            path = _unquote(line[len(b"rename to ") :])
+    if path is None:
+        # "a/<path> b/<path>" - both paths are the same without rename
+        path = _unquote(header[0][len(header[0]) // 2 + 1 :])[2:]
+    return path or None
+
+
+def _unquote(path: bytes) -> str:
+    """Decodes path which git quotes as C string if it has special chars."""
+    if path.startswith(b'"') and path.endswith(b'"'):
+        path = codecs.escape_decode(path[1:-1])[0]
+    return path.decode(errors="surrogateescape")
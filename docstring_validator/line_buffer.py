@@ -0,0 +1,98 @@
+"""Lines of a file or diff without a separate string for every line.
+
+`LineBuffer` behaves like the list returned by `text.split("\\n")`, but keeps
+only the original text and offsets of line beginnings. Lines are sliced from
+the text when accessed, so big generated files do not allocate one string
+object per line.
+"""
+import re
+from array import array
+from collections.abc import Sequence
+from typing import Iterator, Match, Optional
+
+
+class LineBuffer(Sequence):
+    """Read only sequence of lines stored as a single string.
+
+    Attributes:
+        text: complete text, lines are separated by "\\n"
+        prefix: only lines starting with prefix are included, e.g. "+" for
+            lines added in a diff
+    """
+
+    def __init__(self, text: str, prefix: str = ""):
+        self.text = text
+        self.prefix = prefix
+        self._offsets: Optional[array] = None
+
+    @property
+    def offsets(self) -> array:
+        """Offsets of included lines in text, built on first use."""
+        if self._offsets is None:
+            self._offsets = array("q", self._iter_offsets())
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._line_at(self.offsets[index])
+
+    def __iter__(self) -> Iterator[str]:
+        for start in self._iter_offsets():
+            yield self._line_at(start)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LineBuffer, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LineBuffer({len(self.text)} characters, prefix={self.prefix!r})"
+
+    def search(self, pattern: str) -> Iterator[Match[str]]:
+        """Yields first match of pattern in each included line.
+
+        Results are the same as of `re.search(pattern, line)` for every line,
+        but the whole text is searched at once and only lines with a match
+        are sliced from it.
+
+        Args:
+            pattern: regex pattern
+
+        Yields:
+            Match object for each line containing the pattern
+        """
+        candidates = re.compile(pattern, re.MULTILINE)
+        text = self.text
+        pos = 0
+        while pos <= len(text):
+            candidate = candidates.search(text, pos)
+            if candidate is None:
+                return
+            start = text.rfind("\n", 0, candidate.start()) + 1
+            end = text.find("\n", candidate.start())
+            if end == -1:
+                end = len(text)
+            if text.startswith(self.prefix, start):
+                match = re.search(pattern, text[start:end])
+                if match:
+                    yield match
+            pos = end + 1
+
+    def _iter_offsets(self) -> Iterator[int]:
+        text, prefix = self.text, self.prefix
+        start = 0
+        while True:
+            if text.startswith(prefix, start):
+                yield start
+            end = text.find("\n", start)
+            if end == -1:
+                return
+            start = end + 1
+
+    def _line_at(self, start: int) -> str:
+        end = self.text.find("\n", start)
+        return self.text[start:] if end == -1 else self.text[start:end]
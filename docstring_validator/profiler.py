@@ -0,0 +1,119 @@
+"""Span based profiler for stages of the analysis.
+
+Spans are recorded only when profiler is enabled, otherwise `span` returns
+shared no-op context manager, so instrumentation costs a single function
+call. Recorded spans are exported in Chrome trace event format, which can
+be opened in chrome://tracing or https://ui.perfetto.dev.
+"""
+import contextlib
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import ContextManager, Iterator, List, Optional, Tuple
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Profiler:
+    """Collects spans as Chrome trace "complete" events.
+
+    Attributes:
+        events: recorded trace events
+    """
+
+    def __init__(self):
+        self.events: List[dict] = []
+        self.pid = os.getpid()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, args: dict) -> Iterator[None]:
+        """Records duration of the block as trace event."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append(
+                dict(
+                    name=name,
+                    cat=category,
+                    ph="X",
+                    ts=start * 1e6,
+                    dur=(end - start) * 1e6,
+                    pid=self.pid,
+                    tid=threading.get_ident(),
+                    args=args,
+                )
+            )
+
+    def to_chrome_trace(self) -> dict:
+        """Exports recorded spans as Chrome trace document."""
+        return dict(traceEvents=self.events, displayTimeUnit="ms")
+
+    def totals(self) -> List[Tuple[str, float]]:
+        """Sums durations of spans grouped by name.
+
+        Returns:
+            List of (span name, duration in seconds) sorted by duration.
+        """
+        durations = defaultdict(float)
+        for event in self.events:
+            durations[event["name"]] += event["dur"] / 1e6
+        return sorted(durations.items(), key=lambda item: item[1], reverse=True)
+
+    def slowest(self, name: str, key: str, top: int) -> List[Tuple[str, float]]:
+        """Sums durations of `name` spans grouped by `key` argument.
+
+        Args:
+            name: name of spans to aggregate
+            key: span argument used for grouping, e.g. "path"
+            top: number of returned groups
+
+        Returns:
+            List of (key value, duration in seconds) sorted by duration.
+        """
+        durations = defaultdict(float)
+        for event in self.events:
+            if event["name"] == name:
+                durations[str(event["args"].get(key))] += event["dur"] / 1e6
+        return sorted(durations.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+_active: Optional[Profiler] = None
+
+
+def span(name: str, category: str = "analysis", **args) -> ContextManager[None]:
+    """Returns context manager recording span if profiling is enabled."""
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, category, args)
+
+
+def enable() -> Profiler:
+    """Starts recording spans in this process."""
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def disable() -> Optional[Profiler]:
+    """Stops recording spans, returns profiler with recorded spans."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def is_enabled() -> bool:
+    """Checks if spans are recorded in this process.
+
+    Profiler inherited by forked pool worker is not considered enabled, as
+    spans recorded there would never reach the main process.
+    """
+    return _active is not None and _active.pid == os.getpid()
+
+
+def record(events: List[dict]):
+    """Adds events recorded in other process, e.g. by pool worker."""
+    if _active is not None:
+        _active.events.extend(events)
@@ -1,17 +1,30 @@
 """Utilities for human readable error report."""
+from collections import Counter
 from string import Template
-from typing import List
+from typing import Dict, Iterable, List, Mapping, Optional
 
-from docstring_validator.code_parser import get_func_ranges
+from docstring_validator import profiler
+from docstring_validator.profiler import Profiler
+from docstring_validator.summary import Summary
+from docstring_validator.code_parser import FunctionInfo, parse_file
+from docstring_validator.validation_error import ErrorRecord
 
 COLORS = {
     "bold": "\033[1m",
     "red": "\033[31m",
+    "yellow": "\033[33m",
     "magenta": "\033[35m",
     "cyan": "\033[36m",
     "reset": "\033[m",
 }
 
+NO_COLORS = {name: "" for name in COLORS}
+
+# length of abbreviated commit names
+COMMIT_ABBREV = 10
+
+COMMIT_FORMAT = Template("$yellow$commit$reset ")
+
 ERROR_FORMAT = Template(
     "$bold$file$reset$cyan:$reset"
     "$magenta$func$reset$cyan:$reset"
@@ -20,7 +33,9 @@ ERROR_FORMAT = Template(
 )
 
 
-def report_errors(errors: dict) -> List[str]:
+def report_errors(
+    errors: dict, symbols: Optional[Dict[object, Mapping[str, FunctionInfo]]] = None
+) -> List[str]:
     """Prepares report from unformatted errors.
 
     The input dictionary should have structure:
@@ -38,20 +53,152 @@ def report_errors(errors: dict) -> List[str]:
     Returns:
         Formatted error report as a list of strings.
     """
+    with profiler.span("report", "report"):
+        return _report_errors(errors, symbols or {})
+
+
+def _report_errors(
+    errors: dict, symbols: Dict[object, Mapping[str, FunctionInfo]]
+) -> List[str]:
     report = []
     for file_, file_errors in errors.items():
+        file_symbols = symbols.get(file_)
+        if file_symbols is None:
+            file_symbols = parse_file(file_)
         for func, func_errors in file_errors.items():
-            start_line, _ = get_func_ranges(file_, func)
+            info = file_symbols[func]
             for error in func_errors:
-                report.append(
-                    ERROR_FORMAT.substitute(
-                        file=file_,
-                        func=func,
-                        row=start_line,
-                        code=error.code,
-                        error=error.text,
-                        **COLORS,
-                    )
+                record = ErrorRecord(
+                    file_, func, info.lineno, info.end_lineno, error.code, error.text
                 )
+                report.append(format_record(record))
+
+    return report
+
+
+def report_records(records: Iterable[ErrorRecord]) -> List[str]:
+    """Prepares report from located errors.
+
+    Args:
+        records: errors detected by analysis
+
+    Returns:
+        Formatted error report as a list of strings.
+    """
+    return [format_record(record) for record in records]
+
+
+def format_record(record: ErrorRecord, colors: bool = True) -> str:
+    """Formats single located error as human readable line.
+
+    Errors from commit range audit are prefixed with abbreviated commit name.
+
+    Args:
+        record: located error
+        colors: highlight parts of the line with ANSI color codes
+    """
+    palette = COLORS if colors else NO_COLORS
+    line = ERROR_FORMAT.substitute(
+        file=record.path,
+        func=record.function,
+        row=record.line,
+        code=record.code,
+        error=record.text,
+        **palette,
+    )
+    if record.commit is None:
+        return line
+    return (
+        COMMIT_FORMAT.substitute(commit=record.commit[:COMMIT_ABBREV], **palette) + line
+    )
+
+
+def report_stats(stats: Counter) -> List[str]:
+    """Prepares human readable summary of analysis statistics.
 
+    Args:
+        stats: counters collected during analysis
+
+    Returns:
+        Formatted statistics as a list of strings.
+    """
+    report = [f"Analyzed files: {stats['files']}"]
+    if stats["files_skipped"]:
+        report.append(
+            f"Skipped files without matching functions: {stats['files_skipped']}"
+        )
+    if stats["stat_cache_hits"]:
+        report.append(f"Unmodified files reused by daemon: {stats['stat_cache_hits']}")
+    if stats["blob_cache_hits"]:
+        report.append(f"Parsed file versions reused: {stats['blob_cache_hits']}")
+    if stats["cache_hits"] or stats["cache_misses"]:
+        report.append(
+            _format_ratio("Result cache", stats["cache_hits"], stats["cache_misses"])
+        )
+    if stats["memo_hits"] or stats["memo_misses"]:
+        report.append(
+            _format_ratio("Docstring memo", stats["memo_hits"], stats["memo_misses"])
+        )
+    return report
+
+
+def report_summary(summary: Summary) -> List[str]:
+    """Prepares summary of analysis results as plain text tables.
+
+    Args:
+        summary: aggregated counts of analysis results
+
+    Returns:
+        Formatted summary as a list of strings.
+    """
+    total = summary.total
+    report = [
+        f"Files: {total.files}, functions checked: {total.checked}, "
+        f"failing: {total.failing} ({total.compliance:.1%} compliant), "
+        f"errors: {total.errors}"
+    ]
+    if summary.codes:
+        report.append("")
+        report.append(f"{'Code':<8}{'Errors':>10}")
+        report.extend(
+            f"{code:<8}{count:>10}" for code, count in sorted(summary.codes.items())
+        )
+    if summary.packages:
+        width = max(len("Package"), *map(len, summary.packages)) + 2
+        report.append("")
+        report.append(
+            f"{'Package':<{width}}{'Files':>8}{'Checked':>10}{'Failing':>10}"
+            f"{'Errors':>10}{'Compliance':>12}"
+        )
+        for name in sorted(summary.packages):
+            counts = summary.packages[name]
+            report.append(
+                f"{name:<{width}}{counts.files:>8}{counts.checked:>10}"
+                f"{counts.failing:>10}{counts.errors:>10}{counts.compliance:>12.1%}"
+            )
+    return report
+
+
+def _format_ratio(name: str, hits: int, misses: int) -> str:
+    ratio = hits / (hits + misses) if hits + misses else 0.0
+    return f"{name}: {hits} hits, {misses} misses ({ratio:.1%} hit ratio)"
+
+
+def report_profile(recorded: Profiler, top: int) -> List[str]:
+    """Prepares summary of profiled run.
+
+    Args:
+        recorded: profiler with recorded spans
+        top: number of slowest files to include
+
+    Returns:
+        Formatted summary as a list of strings.
+    """
+    report = ["Time per span:"]
+    report.extend(f"{seconds:10.3f} s  {name}" for name, seconds in recorded.totals())
+    report.append(f"Slowest {top} files:")
+    report.extend(
+        f"{seconds:10.3f} s  {path}"
+        for path, seconds in recorded.slowest("file", "path", top)
+    )
     return report
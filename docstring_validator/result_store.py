@@ -0,0 +1,173 @@
+"""Compact storage for large number of located errors.
+
+Every `ErrorRecord` is a tuple with its own references to path, function
+name and message, which adds up when hundreds of thousands of errors are
+kept, e.g. during adoption of the validator in existing code base. Store
+keeps errors in columns of integer arrays - each path and string is stored
+once and referenced by its index. Records and formatted report lines are
+created only when errors are read.
+
+`analyze_files` and `analyze_staged` collect errors into the store and return
+`Report` - a read only list of report lines formatted on access.
+"""
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Callable, Dict, Generic, Hashable, Iterable, Iterator, List, TypeVar
+
+from docstring_validator.reporter import format_record
+from docstring_validator.validation_error import ErrorRecord
+
+T = TypeVar("T", bound=Hashable)
+
+# end line of functions without known end
+_NO_LINE = -1
+# commit of errors not attributed to a commit
+_NO_COMMIT = -1
+
+
+class InternTable(Generic[T]):
+    """Assigns consecutive ids to distinct values.
+
+    Attributes:
+        values: distinct values, id of value is its index
+    """
+
+    def __init__(self):
+        self.values: List[T] = []
+        self._ids: Dict[T, int] = {}
+
+    def intern(self, value: T) -> int:
+        """Returns id of value, adding it to the table if it is new."""
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ResultStore:
+    """Located errors stored in columns of integer arrays.
+
+    Attributes:
+        paths: paths of analyzed files
+        strings: function names, error codes, messages and commits
+    """
+
+    def __init__(self):
+        self.paths: InternTable[Path] = InternTable()
+        self.strings: InternTable[str] = InternTable()
+        self._path_ids = array("I")
+        self._function_ids = array("I")
+        self._lines = array("I")
+        self._end_lines = array("i")
+        self._code_ids = array("I")
+        self._text_ids = array("I")
+        self._commit_ids = array("i")
+
+    @classmethod
+    def from_records(cls, records: Iterable[ErrorRecord]) -> "ResultStore":
+        """Creates store with given errors, consuming iterable lazily."""
+        store = cls()
+        store.extend(records)
+        return store
+
+    def add(self, record: ErrorRecord):
+        """Appends single error to the store."""
+        strings = self.strings
+        self._path_ids.append(self.paths.intern(record.path))
+        self._function_ids.append(strings.intern(record.function))
+        self._lines.append(record.line)
+        self._end_lines.append(_NO_LINE if record.end_line is None else record.end_line)
+        self._code_ids.append(strings.intern(record.code))
+        self._text_ids.append(strings.intern(record.text))
+        self._commit_ids.append(
+            _NO_COMMIT if record.commit is None else strings.intern(record.commit)
+        )
+
+    def extend(self, records: Iterable[ErrorRecord]):
+        """Appends errors to the store."""
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: int) -> ErrorRecord:
+        strings = self.strings.values
+        end_line = self._end_lines[index]
+        commit = self._commit_ids[index]
+        return ErrorRecord(
+            self.paths.values[self._path_ids[index]],
+            strings[self._function_ids[index]],
+            self._lines[index],
+            None if end_line == _NO_LINE else end_line,
+            strings[self._code_ids[index]],
+            strings[self._text_ids[index]],
+            None if commit == _NO_COMMIT else strings[commit],
+        )
+
+    def __iter__(self) -> Iterator[ErrorRecord]:
+        return (self[index] for index in range(len(self)))
+
+    def render(
+        self, formatter: Callable[[ErrorRecord], str] = format_record
+    ) -> Iterator[str]:
+        """Yields formatted errors, formatting each one when it is requested."""
+        return map(formatter, self)
+
+    def report(
+        self, formatter: Callable[[ErrorRecord], str] = format_record
+    ) -> "Report":
+        """Returns report lines of stored errors, formatted when accessed."""
+        return Report(self, formatter)
+
+    def count_codes(self) -> Counter:
+        """Counts errors by error code without creating records."""
+        strings = self.strings.values
+        return Counter({strings[i]: n for i, n in Counter(self._code_ids).items()})
+
+
+class Report(Sequence):
+    """Read only list of formatted errors backed by `ResultStore`.
+
+    Behaves like list returned by `report_records`, but a line is formatted
+    only when it is accessed and is not kept afterwards.
+
+    Attributes:
+        store: stored errors
+        formatter: function formatting single error
+    """
+
+    def __init__(
+        self,
+        store: ResultStore,
+        formatter: Callable[[ErrorRecord], str] = format_record,
+    ):
+        self.store = store
+        self.formatter = formatter
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.formatter(self.store[index])
+
+    def __iter__(self) -> Iterator[str]:
+        return self.store.render(self.formatter)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Report, list)):
+            return len(self) == len(other) and all(
+                line == other_line for line, other_line in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Report({len(self)} errors)"
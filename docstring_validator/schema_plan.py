@@ -0,0 +1,189 @@
+"""Docstring schema compiled into validation plan.
+
+Docstring and Chunk models interpret schema for each validated docstring -
+every section is identified, instantiated and counted separately. Validation
+plan precomputes everything that does not depend on validated docstring:
+header lookup table, section validators and occurrence bounds, so docstring
+is validated in a single pass over its lines.
+
+Plan produces the same errors, in the same order, as `Docstring.validate`.
+"""
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from docstring_validator import chunks, validators
+from docstring_validator.docstring_model import Docstring
+from docstring_validator.validation_error import ValidationError
+
+Validator = Callable[[List[str], str], Optional[ValidationError]]
+
+
+class Section(NamedTuple):
+    """Precomputed data for one type of docstring section."""
+
+    index: int  # position of section type in schema
+    name: str  # human readable section name used in error messages
+    parse: Optional[Callable[[List[str]], List[str]]]  # content preprocessing
+    validators: Tuple[Validator, ...]  # chunk validators
+
+
+class ValidationPlan:
+    """Docstring schema compiled for fast validation.
+
+    Attributes:
+        headers: section headers mapped to section data
+        default: section used for chunks without known header
+        names: section names in schema order
+        min_counts: minimal number of occurrences in schema order
+        max_counts: maximal number of occurrences in schema order
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, Section],
+        default: Section,
+        names: Sequence[str],
+        min_counts: Sequence[float],
+        max_counts: Sequence[float],
+    ):
+        self.headers = headers
+        self.default = default
+        self.names = tuple(names)
+        self.min_counts = tuple(min_counts)
+        self.max_counts = tuple(max_counts)
+
+    @classmethod
+    def compile(cls, docstring_cls: Type[Docstring] = Docstring) -> "ValidationPlan":
+        """Compiles schema and validators of Docstring class into a plan.
+
+        Raises:
+            ValueError: if Docstring class uses validators not supported by plan.
+        """
+        unsupported = [
+            validator
+            for validator in docstring_cls.validators
+            if validator is not validators.validate_chunk_occurences
+        ]
+        if unsupported:
+            raise ValueError(f"Cannot compile docstring validators {unsupported}")
+
+        schema = list(docstring_cls.schema.items())
+        positions = {chunk_cls: i for i, (chunk_cls, _) in enumerate(schema)}
+
+        def section(chunk_cls: Type[chunks.Chunk]) -> Section:
+            parse = chunk_cls.parse_content
+            return Section(
+                index=positions[chunk_cls],
+                name=chunk_cls.chunk_type.value,
+                parse=None if parse is chunks.Chunk.parse_content else parse,
+                validators=tuple(chunk_cls.validators or ()),
+            )
+
+        headers = {
+            header: section(chunks.type_map[chunk_type])
+            for header, chunk_type in chunks.CHUNK_HEADERS.items()
+        }
+        default = section(chunks.type_map[chunks.ChunkTypes.DESCRIPTION])
+        return cls(
+            headers,
+            default,
+            names=[chunk_cls.chunk_type.value for chunk_cls, _ in schema],
+            min_counts=[ranges["min"] for _, ranges in schema],
+            max_counts=[ranges["max"] for _, ranges in schema],
+        )
+
+    def validate(
+        self, raw_docstring: Optional[str], limit: Optional[int] = None
+    ) -> List[ValidationError]:
+        """Validates docstring against compiled schema.
+
+        Args:
+            raw_docstring: validated docstring
+            limit: maximal number of returned errors, None for no limit. Once
+                limit is reached sections are only counted, not validated.
+                Returned errors are the first errors of unlimited validation.
+
+        Returns:
+            List of errors detected by validation functions.
+        """
+        if raw_docstring is None:
+            return [ValidationError("E300", "Missing/Empty docstring")]
+
+        counts = [0] * len(self.names)
+        errors = []
+        chunk = []
+        for line in raw_docstring.split("\n"):
+            if line:
+                chunk.append(line.strip())
+            elif chunk:
+                self._validate_chunk(chunk, counts, errors, limit)
+                chunk = []
+        if chunk:
+            self._validate_chunk(chunk, counts, errors, limit)
+
+        if not any(counts):
+            return [ValidationError("E300", "Missing/Empty docstring")]
+        errors = self._validate_occurrences(counts) + errors
+        return errors if limit is None else errors[:limit]
+
+    def _validate_chunk(
+        self,
+        chunk: List[str],
+        counts: List[int],
+        errors: List[ValidationError],
+        limit: Optional[int],
+    ):
+        section = self.headers.get(chunk[0].partition(":")[0], self.default)
+        counts[section.index] += 1
+        if limit is not None and len(errors) >= limit:
+            return
+
+        content = chunk if section.parse is None else section.parse(chunk)
+        for validator in section.validators:
+            result = validator(content, section.name)
+            if result:
+                errors.append(result)
+                if limit is not None and len(errors) >= limit:
+                    return
+
+    def _validate_occurrences(self, counts: List[int]) -> List[ValidationError]:
+        errors = []
+        for section, actual, min, max in zip(
+            self.names, counts, self.min_counts, self.max_counts
+        ):
+            if min > 0 and actual == 0:
+                errors.append(ValidationError("E211", f"{section} section is missing"))
+            elif actual > max:
+                errors.append(
+                    ValidationError(
+                        "E212",
+                        f"Detected {section} section {actual} time(s), max allowed is {max}",
+                    )
+                )
+            elif actual < min:
+                errors.append(
+                    ValidationError(
+                        "E213",
+                        f"Detected {section} section {actual} time(s), min allowed is {min}",
+                    )
+                )
+        return errors
+
+
+_plans: Dict[Tuple[type, int], Optional[ValidationPlan]] = {}
+
+
+def get_plan(docstring_cls: Type[Docstring] = Docstring) -> Optional[ValidationPlan]:
+    """Returns compiled plan for Docstring class, compiling it on first use.
+
+    Plan is recompiled when schema of the class is replaced.
+
+    Returns:
+        Validation plan or None if Docstring class cannot be compiled.
+    """
+    key = (docstring_cls, id(docstring_cls.schema))
+    if key not in _plans:
+        try:
+            _plans[key] = ValidationPlan.compile(docstring_cls)
+        except ValueError:
+            _plans[key] = None
+    return _plans[key]
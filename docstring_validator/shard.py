@@ -0,0 +1,220 @@
+"""Splitting analysis of many files into shards run by separate CI jobs.
+
+Discovered files are partitioned into shards balanced by file size, using
+greedy longest processing time first scheduling: files are assigned from the
+biggest one to the currently smallest shard. Partition depends only on the
+list of files and their sizes, so every job computes the same partition.
+
+Each shard writes partial result as JSON Lines: header with shard and number
+of all files, one line for each error with index of its file in discovery
+order, and statistics in the last line. Errors of a shard are ordered by
+file index, so partial results are merged with a streaming k-way merge into
+the order of unsharded run.
+"""
+import heapq
+import json
+from collections import Counter
+from pathlib import Path
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from docstring_validator.validation_error import ErrorRecord
+from docstring_validator.writers import Writer
+from docstring_validator.version import __version__
+
+IndexedRecord = Tuple[int, ErrorRecord]  # index of file in discovery order, error
+
+
+class Shard(NamedTuple):
+    """Part of analyzed files, `index` of `count` numbered from 1."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """Parses shard in INDEX/COUNT format, e.g. 2/4.
+
+        Raises:
+            ValueError: if value has invalid format or index is out of range
+        """
+        index, sep, count = value.partition("/")
+        if not sep or not index.isdigit() or not count.isdigit():
+            raise ValueError(f"expected INDEX/COUNT, got {value!r}")
+        shard = cls(int(index), int(count))
+        if not 1 <= shard.index <= shard.count:
+            raise ValueError(f"shard index must be between 1 and count, got {value!r}")
+        return shard
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def select(self, files: Sequence[Path]) -> List[int]:
+        """Finds indexes of files analyzed in this shard, in ascending order."""
+        sizes = [_get_size(path) for path in files]
+        return partition(sizes, self.count)[self.index - 1]
+
+
+def partition(sizes: Sequence[int], count: int) -> List[List[int]]:
+    """Partitions items into `count` groups with balanced total size.
+
+    Args:
+        sizes: size of each item
+        count: number of groups
+
+    Returns:
+        Sorted indexes of items in each group. Ties are resolved by item and
+        group index, so the result is deterministic.
+    """
+    groups: List[List[int]] = [[] for _ in range(count)]
+    loads = [(0, group) for group in range(count)]
+    for item in sorted(range(len(sizes)), key=lambda i: (-sizes[i], i)):
+        load, group = heapq.heappop(loads)
+        groups[group].append(item)
+        heapq.heappush(loads, (load + sizes[item], group))
+    return [sorted(group) for group in groups]
+
+
+class PartialWriter(Writer):
+    """Writes partial result of a shard.
+
+    Attributes:
+        stream: output stream
+        shard: analyzed shard
+        indexes: index of each discovered file, from all shards
+        max_errors: error limit of the analysis, None for no limit
+        stats: statistics of the analysis, written when it is finished
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        shard: Shard,
+        files: Sequence[Path],
+        max_errors: Optional[int],
+        stats: Counter,
+    ):
+        super().__init__(stream)
+        self.shard = shard
+        self.indexes = {path: index for index, path in enumerate(files)}
+        self.max_errors = max_errors
+        self.stats = stats
+
+    def start(self):
+        header = dict(
+            version=__version__,
+            shard=str(self.shard),
+            files=len(self.indexes),
+            max_errors=self.max_errors,
+        )
+        print(json.dumps(header), file=self.stream)
+
+    def write(self, record: ErrorRecord):
+        data = dict(
+            file=self.indexes[record.path],
+            path=str(record.path),
+            function=record.function,
+            line=record.line,
+            end_line=record.end_line,
+            code=record.code,
+            text=record.text,
+        )
+        print(json.dumps(data), file=self.stream)
+
+    def finish(self):
+        # statistics line marks partial result as complete
+        print(json.dumps(dict(stats=dict(self.stats))), file=self.stream)
+        self.stream.flush()
+
+
+class PartialResult:
+    """Reads partial result written by `PartialWriter`.
+
+    Attributes:
+        stream: input stream
+        name: name of the input used in error messages
+        shard: analyzed shard
+        files: number of files in all shards
+        max_errors: error limit of the analysis, None for no limit
+        version: version of Docstring Validator which analyzed the shard
+        stats: statistics of the shard, available once all errors are read
+    """
+
+    def __init__(self, stream: TextIO, name: str = "<stream>"):
+        self.stream = stream
+        self.name = name
+        try:
+            header = json.loads(stream.readline())
+            self.shard = Shard.parse(header["shard"])
+            self.files = header["files"]
+            self.max_errors = header["max_errors"]
+            self.version = header["version"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError(f"{name} is not a partial result: {exc}") from None
+        self.stats = Counter()
+
+    def __iter__(self) -> Iterator[IndexedRecord]:
+        for line in self.stream:
+            data = json.loads(line)
+            if "stats" in data:
+                self.stats.update(data["stats"])
+                return
+            record = ErrorRecord(
+                Path(data["path"]),
+                data["function"],
+                data["line"],
+                data["end_line"],
+                data["code"],
+                data["text"],
+            )
+            yield data["file"], record
+        raise ValueError(f"{self.name} is incomplete, shard did not finish")
+
+
+def check_complete(partials: Sequence[PartialResult]):
+    """Checks that partial results cover all shards of the same analysis.
+
+    Raises:
+        ValueError: if a shard is missing or duplicated, or results come from
+            different runs
+    """
+    if not partials:
+        raise ValueError("no partial results")
+    first = partials[0]
+    for partial in partials:
+        run = (partial.shard.count, partial.files, partial.max_errors, partial.version)
+        if run != (first.shard.count, first.files, first.max_errors, first.version):
+            raise ValueError(
+                f"{partial.name} and {first.name} come from different runs"
+            )
+    found = Counter(partial.shard.index for partial in partials)
+    duplicated = sorted(index for index, count in found.items() if count > 1)
+    missing = sorted(set(range(1, first.shard.count + 1)) - set(found))
+    if duplicated:
+        raise ValueError(f"duplicated shards: {_format_indexes(duplicated)}")
+    if missing:
+        raise ValueError(f"missing shards: {_format_indexes(missing)}")
+
+
+def merge(partials: Iterable[PartialResult]) -> Iterator[IndexedRecord]:
+    """Merges errors of partial results into order of unsharded analysis."""
+    return heapq.merge(*partials, key=lambda item: item[0])
+
+
+def _format_indexes(indexes: List[int]) -> str:
+    return ", ".join(map(str, indexes))
+
+
+def _get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -0,0 +1,113 @@
+"""Aggregated counts of analysis results, without keeping detected errors.
+
+Dashboards tracking docstring compliance of a code base need only numbers:
+errors per code, checked and failing functions per top-level package and in
+total. `Summary` folds results of analyzed files into counters as they are
+produced, so its size depends on number of error codes and packages, not on
+number of files or errors.
+"""
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+from docstring_validator.validation_error import ValidationError
+
+# package of files directly in the root directory
+ROOT_PACKAGE = "."
+
+
+class PackageSummary:
+    """Counts for files of a single top-level package.
+
+    Attributes:
+        files: number of analyzed files
+        checked: number of validated functions
+        failing: number of functions with invalid docstring
+        errors: number of detected errors
+    """
+
+    __slots__ = ("files", "checked", "failing", "errors")
+
+    def __init__(self):
+        self.files = 0
+        self.checked = 0
+        self.failing = 0
+        self.errors = 0
+
+    @property
+    def compliance(self) -> float:
+        """Ratio of functions with valid docstring, 1.0 if none was checked."""
+        return 1.0 - self.failing / self.checked if self.checked else 1.0
+
+    def to_dict(self) -> dict:
+        """Converts counts to JSON serializable dictionary."""
+        return dict(
+            files=self.files,
+            checked=self.checked,
+            failing=self.failing,
+            errors=self.errors,
+            compliance=round(self.compliance, 4),
+        )
+
+
+class Summary:
+    """Streaming aggregation of analysis results.
+
+    Attributes:
+        root: directory whose subdirectories are reported as packages
+        total: counts for all analyzed files
+        packages: counts for each top-level directory under root
+        codes: number of errors with each error code
+    """
+
+    def __init__(self, root: Optional[Union[Path, str]] = None):
+        self.root = Path(root or ".").resolve()
+        self.total = PackageSummary()
+        self.packages: Dict[str, PackageSummary] = {}
+        self.codes: Counter = Counter()
+
+    def add(
+        self,
+        path: Path,
+        checked: int,
+        errors: Mapping[str, Sequence[ValidationError]],
+    ):
+        """Adds result of analyzed file.
+
+        Args:
+            path: path of the analyzed file
+            checked: number of functions validated in the file
+            errors: errors of failing functions keyed by function name
+        """
+        name = self.get_package(path)
+        package = self.packages.get(name)
+        if package is None:
+            package = self.packages[name] = PackageSummary()
+        failing = len(errors)
+        count = 0
+        for func_errors in errors.values():
+            count += len(func_errors)
+            self.codes.update(error.code for error in func_errors)
+        for counts in (self.total, package):
+            counts.files += 1
+            counts.checked += checked
+            counts.failing += failing
+            counts.errors += count
+
+    def get_package(self, path: Path) -> str:
+        """Returns top-level directory of path under root, e.g. "tests"."""
+        try:
+            parts = Path(path).absolute().relative_to(self.root).parts
+        except ValueError:  # outside of root, reported by its directory
+            return str(Path(path).parent)
+        return parts[0] if len(parts) > 1 else ROOT_PACKAGE
+
+    def to_dict(self) -> dict:
+        """Converts summary to JSON serializable dictionary."""
+        return dict(
+            **self.total.to_dict(),
+            codes=dict(sorted(self.codes.items())),
+            packages={
+                name: self.packages[name].to_dict() for name in sorted(self.packages)
+            },
+        )
@@ -0,0 +1,236 @@
+"""Extraction of function definitions from tokens, without building AST.
+
+Functions are found in a single pass over tokens of the module. Nesting of
+classes and functions is tracked with indentation tokens, end of a function
+is the last line of its last statement and docstring is the first statement
+of its body if it consists only of string literals. Results are the same as
+from `code_parser`, which is used as a fallback for sources which cannot be
+tokenized or contain constructs not handled here.
+
+Unlike `ast`, tokenizer does not check syntax of the module, so errors which
+do not break tokenization are not reported.
+"""
+import ast
+import io
+import tokenize
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+from docstring_validator.code_parser import FunctionInfo, SymbolIndex, _parse_source
+
+_IGNORED = {tokenize.COMMENT, tokenize.NL}
+_OPENING = {"(", "[", "{"}
+_CLOSING = {")", "]", "}"}
+_PREFIX_CHARS = "rRuUbBfF"
+
+
+class UnsupportedSource(ValueError):
+    """Source cannot be reliably analyzed without building AST."""
+
+
+class _Scope:
+    """Class or function definition with not yet finished body."""
+
+    __slots__ = ("prefix", "depth", "info", "inline")
+
+    def __init__(self, prefix: str, info: Optional[dict]):
+        self.prefix = prefix  # qualname prefix of nested definitions
+        self.depth: Optional[int] = None  # indentation depth of the body
+        self.info = info  # FunctionInfo fields, None for classes
+        self.inline = False  # body in the same line as definition
+
+
+def parse_source(
+    source: Union[str, bytes], py_file: Optional[Union[Path, str]] = None
+) -> SymbolIndex:
+    """Parses python source code into SymbolIndex using tokenizer.
+
+    Args:
+        source: content of python module
+        py_file: optional path of the module, used in error messages
+
+    Returns:
+        Index of all functions defined in the source.
+    """
+    try:
+        functions = scan_functions(source)
+    except (tokenize.TokenError, SyntaxError, UnsupportedSource):
+        return _parse_source(source, py_file)
+    return SymbolIndex(Path(py_file) if py_file else None, functions)
+
+
+def scan_functions(source: Union[str, bytes]) -> List[FunctionInfo]:
+    """Finds function definitions in python source code.
+
+    Args:
+        source: content of python module
+
+    Returns:
+        Functions in order of their definitions.
+
+    Raises:
+        tokenize.TokenError: if source cannot be tokenized
+        SyntaxError: if indentation of source is inconsistent
+        UnsupportedSource: if source contains unexpected tokens
+    """
+    functions: List[dict] = []  # FunctionInfo fields, updated until scope ends
+    scopes: List[_Scope] = []
+    depth = 0  # current indentation depth
+    parens = 0  # depth of open brackets
+    last_row = 0  # last line of the latest statement
+
+    header: Optional[_Scope] = None  # definition before colon of its header
+    header_parens = 0
+    body: Optional[_Scope] = None  # definition after colon, before its body
+    block = False  # body of definition starts in the next line
+    docstring: Optional[_Scope] = None  # function collecting its first statement
+    statement: List[tokenize.TokenInfo] = []
+    previous: Optional[tokenize.TokenInfo] = None  # last significant token
+    keyword: Optional[tokenize.TokenInfo] = None  # def or class before name
+
+    for token in _tokenize(source):
+        type_, string = token.type, token.string
+        if type_ in _IGNORED:
+            continue
+
+        if body is not None:
+            if type_ == tokenize.NEWLINE and not block:
+                block = True
+                previous = token
+                continue
+            if type_ == tokenize.INDENT and block:
+                depth += 1
+                body.depth = depth
+            elif block:
+                raise UnsupportedSource(f"expected indented block at {token.start}")
+            else:
+                body.inline = True
+            if body.info is not None:
+                if docstring is not None:
+                    _finish_docstring(docstring, statement)
+                docstring, statement = body, []
+            body, block = None, False
+            if type_ == tokenize.INDENT:
+                previous = token
+                continue
+
+        if docstring is not None:
+            if type_ == tokenize.NEWLINE or (string == ";" and parens == 0):
+                _finish_docstring(docstring, statement)
+                docstring = None
+            elif type_ != tokenize.DEDENT:
+                statement.append(token)
+
+        if type_ == tokenize.OP:
+            if string in _OPENING:
+                parens += 1
+            elif string in _CLOSING:
+                parens -= 1
+            elif string == ":" and header is not None and parens == header_parens:
+                body, header = header, None
+        elif type_ == tokenize.NAME:
+            if keyword is not None:
+                header = _open_scope(token, keyword, previous, scopes)
+                header_parens = parens
+                scopes.append(header)
+                if header.info is not None:
+                    functions.append(header.info)
+                keyword = None
+            elif string in ("def", "class"):
+                keyword = token
+                continue  # keeps `async` as previous token
+        elif type_ == tokenize.NEWLINE:
+            last_row = token.start[0]
+            if scopes and scopes[-1].inline:
+                _close_scope(scopes.pop(), last_row)
+        elif type_ == tokenize.INDENT:
+            depth += 1
+        elif type_ == tokenize.DEDENT:
+            depth -= 1
+            while scopes and scopes[-1].depth is not None and scopes[-1].depth > depth:
+                _close_scope(scopes.pop(), last_row)
+
+        previous = token
+
+    if scopes or header is not None or body is not None or keyword is not None:
+        raise UnsupportedSource("unexpected end of source")
+    return [FunctionInfo(**info) for info in functions]
+
+
+def _tokenize(source: Union[str, bytes]) -> Iterator[tokenize.TokenInfo]:
+    if isinstance(source, bytes):
+        return tokenize.tokenize(io.BytesIO(source).readline)
+    return tokenize.generate_tokens(io.StringIO(source).readline)
+
+
+def _open_scope(
+    name: tokenize.TokenInfo,
+    keyword: tokenize.TokenInfo,
+    before: Optional[tokenize.TokenInfo],
+    scopes: List[_Scope],
+) -> _Scope:
+    """Creates scope for definition of name after def or class keyword."""
+    if name.type != tokenize.NAME:
+        raise UnsupportedSource(f"expected name at {name.start}")
+    parent = scopes[-1].prefix if scopes else ""
+    qualname = f"{parent}{name.string}"
+    if keyword.string == "class":
+        return _Scope(f"{qualname}.", None)
+
+    is_async = before is not None and before.string == "async"
+    info = dict(
+        name=name.string,
+        qualname=qualname,
+        kind="async def" if is_async else "def",
+        lineno=before.start[0] if is_async else keyword.start[0],
+        end_lineno=None,
+        docstring=None,
+    )
+    return _Scope(f"{qualname}.<locals>.", info)
+
+
+def _close_scope(scope: _Scope, last_row: int):
+    if scope.info is not None:
+        scope.info["end_lineno"] = last_row
+
+
+def _finish_docstring(scope: _Scope, statement: List[tokenize.TokenInfo]):
+    """Stores docstring of function if its first statement is a string."""
+    while len(statement) > 2 and _is_parenthesized(statement):
+        statement = statement[1:-1]
+    if not statement or any(token.type != tokenize.STRING for token in statement):
+        return
+
+    prefixes = [_get_prefix(token.string).lower() for token in statement]
+    if any("f" in prefix for prefix in prefixes):
+        return  # formatted string is not a docstring
+    if any("b" in prefix for prefix in prefixes):
+        if not all("b" in prefix for prefix in prefixes):
+            raise UnsupportedSource(f"bytes mixed with str at {statement[0].start}")
+        return  # bytes literal is not a docstring
+    value = "".join(
+        _evaluate_string(token.string, len(prefix), "r" in prefix)
+        for token, prefix in zip(statement, prefixes)
+    )
+
+    # imported on demand, as in ast.get_docstring
+    import inspect
+
+    scope.info["docstring"] = inspect.cleandoc(value)
+
+
+def _is_parenthesized(statement: List[tokenize.TokenInfo]) -> bool:
+    return statement[0].string == "(" and statement[-1].string == ")"
+
+
+def _get_prefix(literal: str) -> str:
+    return literal[: len(literal) - len(literal.lstrip(_PREFIX_CHARS))]
+
+
+def _evaluate_string(literal: str, prefix: int, raw: bool) -> str:
+    """Gets value of string literal, without compiling simple literals."""
+    quotes = 3 if literal[prefix : prefix + 3] in ('"""', "'''") else 1
+    value = literal[prefix + quotes : -quotes]
+    if "\r" in value or ("\\" in value and not raw):
+        return ast.literal_eval(literal)
+    return value
@@ -1,4 +1,7 @@
 """Library with classes for representing validation errors."""
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 
 class ValidationError:
@@ -9,6 +12,23 @@ class ValidationError:
         text: description of discovered error
     """
 
+    __slots__ = ("code", "text")
+
     def __init__(self, code: str, text: str):
-        self.code = code
+        self.code = sys.intern(code)
         self.text = text
+
+    def __repr__(self) -> str:
+        return f"ValidationError({self.code!r}, {self.text!r})"
+
+
+class ErrorRecord(NamedTuple):
+    """Validation error located in analyzed file."""
+
+    path: Path  # path of the analyzed file
+    function: str  # name of function with invalid docstring
+    line: int  # first line of the function
+    end_line: Optional[int]  # last line of the function
+    code: str  # error code describing validation error
+    text: str  # description of discovered error
+    commit: Optional[str] = None  # commit which changed the function, in range audit
@@ -61,9 +61,19 @@ def validate_paragraph(content: List[str], type_: str) -> Optional[ValidationErr
     return
 
 
+# list element index patterns, compiled once at import
+_ELEMENT_INDEX = dict(
+    ordered=re.compile(r"^\s*\d+\. "),
+    unordered=re.compile(r"^\s*- "),
+)
+_FIRST_ELEMENT_INDEX = dict(
+    ordered=re.compile("1. "),
+    unordered=re.compile("-"),
+)
+
+
 def _merge_multiline_elements(elements: List[str], type_: str) -> Optional[List[str]]:
-    types = dict(ordered=r"\d+\.", unordered="-")
-    index = f"^\\s*{types[type_]} "
+    index = _ELEMENT_INDEX[type_]
 
     first_element = elements.pop(0)
     first_element_ok = _validate_first_element(first_element, type_)
@@ -73,7 +83,7 @@ def _merge_multiline_elements(elements: List[str], type_: str) -> Optional[List[
     merged = [first_element]
 
     for line in elements:
-        if re.search(index, line):
+        if index.search(line):
             merged.append(line)
         else:
             merged[-1] = f"{merged[-1]} {line}"
@@ -81,8 +91,7 @@ def _merge_multiline_elements(elements: List[str], type_: str) -> Optional[List[
 
 
 def _validate_first_element(first_element: str, type_: str) -> bool:
-    first_element_index = dict(ordered="1. ", unordered="-")[type_]
-    return bool(re.search(first_element_index, first_element))
+    return bool(_FIRST_ELEMENT_INDEX[type_].search(first_element))
 
 
 def validate_chunk_occurences(chunks: Sequence, schema: dict) -> List[ValidationError]:
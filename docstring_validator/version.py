@@ -0,0 +1,2 @@
+"""Version of Docstring Validator package."""
+__version__ = "1.0.0"
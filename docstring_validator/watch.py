@@ -0,0 +1,231 @@
+"""Watch mode - revalidation of files modified since previous check.
+
+Searched locations are polled for modified, new and removed python files.
+Files are identified by modification time and size, only changed files are
+analyzed again. Errors of each file are kept in memory, so after every check
+only new and fixed errors are reported. Consecutive saves of files are
+grouped - analysis starts when files were not modified for debounce period.
+Files which cannot be analyzed, e.g. half-edited with syntax errors, keep
+their previous errors and are analyzed again when modified.
+
+Polling is used instead of OS file change notifications, which are not
+available in python standard library.
+"""
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from docstring_validator import diff_util
+from docstring_validator.cache import Stamp, get_stamp
+from docstring_validator.discovery import DiscoveryOptions
+from docstring_validator.reporter import format_record
+from docstring_validator.validation_error import ErrorRecord
+
+DEFAULT_INTERVAL = 0.5  # seconds between scans of watched locations
+DEFAULT_DEBOUNCE = 0.3  # seconds without modification before analysis
+
+# errors of files which cannot be analyzed, watching continues
+ANALYSIS_ERRORS = (SyntaxError, ValueError, OSError)
+
+Analyzer = Callable[[List[Path]], Iterable[ErrorRecord]]
+
+
+class Watcher:
+    """Keeps errors of watched files, updating them for changed files.
+
+    Attributes:
+        paths: watched files and directories
+        analyze: function analyzing given files, e.g. `iter_errors`
+        discovery: settings for discovery of files in watched directories
+        stamps: modification time and size of analyzed files
+        errors: errors detected in each analyzed file
+        failures: version and error message of files which cannot be analyzed
+    """
+
+    def __init__(
+        self,
+        paths: List[Union[Path, str]],
+        analyze: Analyzer,
+        discovery: Optional[DiscoveryOptions] = None,
+    ):
+        self.paths = paths
+        self.analyze = analyze
+        self.discovery = discovery
+        self.stamps: Dict[Path, Stamp] = {}
+        self.errors: Dict[Path, List[ErrorRecord]] = {}
+        self.failures: Dict[Path, Tuple[Stamp, str]] = {}
+
+    def scan(self) -> Dict[Path, Stamp]:
+        """Finds watched files with their current modification time and size."""
+        stamps = {}
+        for path in diff_util.find_files(self.paths, self.discovery):
+            try:
+                stamps[path] = get_stamp(path)
+            except OSError:  # removed during scan
+                continue
+        return stamps
+
+    def changes(self, stamps: Dict[Path, Stamp]) -> Tuple[List[Path], List[Path]]:
+        """Finds changed and removed files, failed versions are not retried.
+
+        Args:
+            stamps: current state of watched files, as returned by `scan`
+
+        Returns:
+            Tuple of files to be analyzed and files removed since previous update
+        """
+        changed = []
+        for path, stamp in stamps.items():
+            failed, _ = self.failures.get(path, (None, None))
+            if stamp not in (self.stamps.get(path), failed):
+                changed.append(path)
+        removed = [path for path in self.stamps if path not in stamps]
+        return changed, removed
+
+    def update(
+        self, stamps: Dict[Path, Stamp]
+    ) -> Tuple[List[ErrorRecord], List[ErrorRecord]]:
+        """Analyzes files changed since previous update.
+
+        Args:
+            stamps: current state of watched files, as returned by `scan`
+
+        Files which cannot be analyzed keep their previous version and errors,
+        the failure is stored in `failures` until the file is modified again.
+
+        Returns:
+            Tuple of new and fixed errors. Errors are compared by function,
+            code and message, so errors moved to another line are not reported.
+        """
+        changed, removed = self.changes(stamps)
+        errors, failures = self._analyze(changed) if changed else ({}, {})
+
+        stamps = dict(stamps)
+        for path, message in failures.items():
+            self.failures[path] = (stamps[path], message)
+            if path in self.stamps:
+                stamps[path] = self.stamps[path]
+            else:
+                del stamps[path]
+        for path in errors:
+            self.failures.pop(path, None)
+
+        new, fixed = [], []
+        for path in removed:
+            self.failures.pop(path, None)
+            fixed.extend(self.errors.pop(path, []))
+        for path, file_errors in errors.items():
+            file_new, file_fixed = _compare(self.errors.get(path, []), file_errors)
+            new.extend(file_new)
+            fixed.extend(file_fixed)
+            if file_errors:
+                self.errors[path] = file_errors
+            else:
+                self.errors.pop(path, None)
+        self.stamps = stamps
+        return new, fixed
+
+    def _analyze(
+        self, paths: List[Path]
+    ) -> Tuple[Dict[Path, List[ErrorRecord]], Dict[Path, str]]:
+        """Analyzes files, returns errors of analyzed files and failures of others."""
+        errors: Dict[Path, List[ErrorRecord]] = {path: [] for path in paths}
+        try:
+            for record in self.analyze(paths):
+                errors.setdefault(record.path, []).append(record)
+            return errors, {}
+        except ANALYSIS_ERRORS as exc:
+            if len(paths) == 1:
+                return {}, {paths[0]: f"{type(exc).__name__}: {exc}"}
+
+        # find files which cannot be analyzed, analyzing them one by one
+        errors, failures = {}, {}
+        for path in paths:
+            file_errors, file_failures = self._analyze([path])
+            errors.update(file_errors)
+            failures.update(file_failures)
+        return errors, failures
+
+    def count(self) -> int:
+        """Returns number of errors in all watched files."""
+        return sum(len(file_errors) for file_errors in self.errors.values())
+
+
+def watch(
+    watcher: Watcher,
+    output: TextIO,
+    interval: float = DEFAULT_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    checks: Optional[int] = None,
+):
+    """Analyzes watched files and reports changes of errors until interrupted.
+
+    Args:
+        watcher: watched files with their errors
+        output: stream for reports
+        interval: time between scans of watched locations in seconds
+        debounce: time without file modifications before analysis starts
+        checks: number of checks after which watching stops, None for no limit
+    """
+    new, _ = watcher.update(watcher.scan())
+    _report(output, new, [], watcher)
+    while checks is None or checks > 0:
+        time.sleep(interval)
+        stamps = watcher.scan()
+        if not any(watcher.changes(stamps)):
+            continue
+        while True:  # wait until burst of saves is over
+            time.sleep(debounce)
+            latest = watcher.scan()
+            if latest == stamps:
+                break
+            stamps = latest
+        new, fixed = watcher.update(stamps)
+        _report(output, new, fixed, watcher)
+        if checks is not None:
+            checks -= 1
+
+
+def _compare(
+    old: List[ErrorRecord], current: List[ErrorRecord]
+) -> Tuple[List[ErrorRecord], List[ErrorRecord]]:
+    """Finds errors present only in current and only in old results."""
+
+    def key(record: ErrorRecord) -> tuple:
+        return record.function, record.code, record.text
+
+    old_keys = Counter(map(key, old))
+    current_keys = Counter(map(key, current))
+    added = current_keys - old_keys
+    removed = old_keys - current_keys
+
+    new = []
+    for record in current:
+        if added[key(record)] > 0:
+            added[key(record)] -= 1
+            new.append(record)
+    fixed = []
+    for record in old:
+        if removed[key(record)] > 0:
+            removed[key(record)] -= 1
+            fixed.append(record)
+    return new, fixed
+
+
+def _report(
+    output: TextIO, new: List[ErrorRecord], fixed: List[ErrorRecord], watcher: Watcher
+):
+    timestamp = time.strftime("%H:%M:%S")
+    print(
+        f"[{timestamp}] {len(new)} new, {len(fixed)} fixed, "
+        f"{watcher.count()} issue(s) in total",
+        file=output,
+    )
+    for path, (_, message) in watcher.failures.items():
+        print(f"! {path}: cannot be analyzed, {message}", file=output)
+    for record in new:
+        print(f"+ {format_record(record)}", file=output)
+    for record in fixed:
+        print(f"- {format_record(record)}", file=output)
+    output.flush()
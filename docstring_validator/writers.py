@@ -0,0 +1,236 @@
+"""Writers of detected errors in human and machine readable formats.
+
+Errors are written as soon as they are detected. JSON Lines and text writers
+keep nothing in memory. SARIF writer keeps only the set of error codes, as
+rules are listed after results. JUnit writer buffers errors of a single
+file, which are written as one test suite.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO, Tuple, Type
+
+from docstring_validator.reporter import COMMIT_ABBREV, format_record
+from docstring_validator.validation_error import ErrorRecord
+from docstring_validator.version import __version__
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "docstring-validator"
+
+_XML_ESCAPES = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;"}
+# whitespace is escaped too, attribute value normalization would replace it
+_XML_ATTR_ESCAPES = {
+    **_XML_ESCAPES,
+    ord('"'): "&quot;",
+    ord("\n"): "&#10;",
+    ord("\r"): "&#13;",
+    ord("\t"): "&#9;",
+}
+
+
+class Writer:
+    """Base class for error writers.
+
+    Attributes:
+        stream: output stream
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def start(self):
+        """Writes beginning of the document."""
+
+    def write(self, record: ErrorRecord):
+        """Writes single error."""
+        raise NotImplementedError
+
+    def finish(self):
+        """Writes end of the document."""
+
+
+class TextWriter(Writer):
+    """Writes human readable lines, colored if stream is a terminal."""
+
+    def __init__(self, stream: TextIO, colors: Optional[bool] = None):
+        super().__init__(stream)
+        self.colors = _isatty(stream) if colors is None else colors
+        self.found = False
+
+    def write(self, record: ErrorRecord):
+        if not self.found:
+            print(
+                "Issues found in docstrings by Docstring Validator:\n", file=self.stream
+            )
+            self.found = True
+        print(format_record(record, self.colors), file=self.stream, flush=True)
+
+
+class JsonLinesWriter(Writer):
+    """Writes each error as JSON object in separate line."""
+
+    def write(self, record: ErrorRecord):
+        data = dict(
+            path=str(record.path),
+            function=record.function,
+            line=record.line,
+            end_line=record.end_line,
+            code=record.code,
+            text=record.text,
+        )
+        if record.commit is not None:
+            data["commit"] = record.commit
+        print(json.dumps(data), file=self.stream, flush=True)
+
+
+class SarifWriter(Writer):
+    """Writes SARIF 2.1.0 log with a single run.
+
+    Results are written before tool description, which lists rules of
+    reported error codes.
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.rules: Dict[str, str] = {}  # error code to first message
+        self.count = 0
+
+    def start(self):
+        self.stream.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", "runs": [{{"results": ['
+        )
+
+    def write(self, record: ErrorRecord):
+        self.rules.setdefault(record.code, record.text)
+        region = dict(startLine=record.line)
+        if record.end_line is not None:
+            region["endLine"] = record.end_line
+        result = dict(
+            ruleId=record.code,
+            level="error",
+            message=dict(text=f"{record.function}: {record.text}"),
+            locations=[
+                dict(
+                    physicalLocation=dict(
+                        artifactLocation=dict(uri=_uri(record.path)), region=region
+                    ),
+                    logicalLocations=[dict(name=record.function, kind="function")],
+                )
+            ],
+        )
+        if record.commit is not None:
+            result["properties"] = dict(commit=record.commit)
+        self.stream.write(("\n" if self.count == 0 else ",\n") + json.dumps(result))
+        self.count += 1
+
+    def finish(self):
+        rules = [
+            dict(id=code, shortDescription=dict(text=text))
+            for code, text in sorted(self.rules.items())
+        ]
+        driver = dict(name=TOOL_NAME, version=__version__, rules=rules)
+        self.stream.write(f'\n], "tool": {json.dumps(dict(driver=driver))}}}]}}\n')
+        self.stream.flush()
+
+
+class JUnitWriter(Writer):
+    """Writes JUnit XML report with test suite for each file.
+
+    Each function with invalid docstring is a failed test case. Errors are
+    reported file by file, so only errors of the current file are buffered.
+    In commit range audit, each file changed by a commit is a separate suite.
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.suite: Optional[Tuple[Path, Optional[str]]] = None  # path and commit
+        self.functions: Dict[str, List[ErrorRecord]] = {}
+
+    def start(self):
+        self.stream.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        self.stream.write(f"<testsuites name={_quoteattr(TOOL_NAME)}>\n")
+
+    def write(self, record: ErrorRecord):
+        suite = (record.path, record.commit)
+        if suite != self.suite:
+            self._write_suite()
+            self.suite = suite
+        self.functions.setdefault(record.function, []).append(record)
+
+    def finish(self):
+        self._write_suite()
+        self.stream.write("</testsuites>\n")
+        self.stream.flush()
+
+    def _write_suite(self):
+        if not self.functions:
+            return
+        path, commit = self.suite
+        path = str(path) if commit is None else f"{commit[:COMMIT_ABBREV]}:{path}"
+        count = len(self.functions)
+        self.stream.write(
+            f'  <testsuite name={_quoteattr(path)} tests="{count}" failures="{count}">\n'
+        )
+        for function, records in self.functions.items():
+            message = "; ".join(f"{record.code} {record.text}" for record in records)
+            details = "\n".join(
+                f"{path}:{_format_lines(record)}: {record.code} {record.text}"
+                for record in records
+            )
+            self.stream.write(
+                f"    <testcase classname={_quoteattr(path)} name={_quoteattr(function)}>\n"
+                f"      <failure type={_quoteattr(records[0].code)} "
+                f"message={_quoteattr(message)}>{_escape(details)}</failure>\n"
+                "    </testcase>\n"
+            )
+        self.stream.write("  </testsuite>\n")
+        self.stream.flush()
+        self.functions = {}
+
+
+WRITERS: Dict[str, Type[Writer]] = {
+    "text": TextWriter,
+    "jsonl": JsonLinesWriter,
+    "sarif": SarifWriter,
+    "junit": JUnitWriter,
+}
+
+
+def get_writer(name: str, stream: TextIO, **kwargs) -> Writer:
+    """Creates writer for format name, one of `WRITERS`."""
+    return WRITERS[name](stream, **kwargs)
+
+
+def _format_lines(record: ErrorRecord) -> str:
+    """Formats lines of the function as "line-end_line", or "line" if end is unknown."""
+    if record.end_line is None:
+        return str(record.line)
+    return f"{record.line}-{record.end_line}"
+
+
+def _isatty(stream: TextIO) -> bool:
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def _escape(text: str) -> str:
+    """Escapes XML character data, as `xml.sax.saxutils.escape`.
+
+    Implemented here, as importing `xml.sax.saxutils` loads `urllib.request`
+    and adds to startup time of every run.
+    """
+    return text.translate(_XML_ESCAPES)
+
+
+def _quoteattr(text: str) -> str:
+    """Escapes and quotes XML attribute value, as `xml.sax.saxutils.quoteattr`."""
+    return f'"{text.translate(_XML_ATTR_ESCAPES)}"'
+
+
+def _uri(path: Path) -> str:
+    """Returns path relative to working directory or absolute file URI."""
+    if not path.is_absolute():
+        return path.as_posix()
+    try:
+        return path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.as_uri()
@@ -5,7 +5,7 @@ setup(
     version="1.0.0",
     description="Pre-commit hook for validating function names against provided schema",
     packages=find_packages(),
-    install_requires=["GitPython"],
+    extras_require={"gitpython": ["GitPython"]},
     entry_points={
         "console_scripts": ["docstring-validator = docstring_validator.cli_lib:run_cli"]
     },
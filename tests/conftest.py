@@ -0,0 +1,22 @@
+import subprocess
+
+import pytest
+
+
+@pytest.fixture
+def git(tmp_path, monkeypatch):
+    """Initializes git repository in `tmp_path`, returns git command runner."""
+
+    def run(*args) -> str:
+        result = subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+        return result.stdout.decode()
+
+    monkeypatch.delenv("PRE_COMMIT_FROM_REF", raising=False)
+    monkeypatch.delenv("PRE_COMMIT_TO_REF", raising=False)
+    run("init")
+    return run
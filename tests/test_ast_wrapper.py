@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from docstring_validator import code_parser
 
 REPO_PATH = Path(__file__).parent.parent.absolute()
@@ -28,3 +30,42 @@ def test_get_docstring():
     for docstring, expected_len in zip(docstrings, lens):
         docstring = "" if docstring is None else docstring
         assert len(docstring) == expected_len
+
+
+def test_parse_file():
+    index = code_parser.parse_file(DUMMY_MODULE)
+
+    assert [func.name for func in index.functions][:3] == [
+        "test_ping",
+        "test_BUG1701",
+        "test_BUG2137",
+    ]
+    assert index["test_ping"].lineno == 7
+    assert index["test_ping"].end_lineno == 27
+    assert index["test_BUG1701"].docstring == "Simple docstring."
+    assert index["dummy"].docstring is None
+    assert index.by_qualname["A.b"].name == "b"
+
+
+def test_parse_source_nested_functions():
+    source = (
+        "def f():\n"
+        "    def g():\n"
+        "        pass\n"
+        "\n"
+        "\n"
+        "async def g():\n"
+        '    """Module level."""\n'
+    )
+    index = code_parser.parse_source(source)
+
+    assert [func.qualname for func in index.functions] == ["f", "f.<locals>.g", "g"]
+    assert index["g"].kind == "async def"
+    assert index["g"].docstring == "Module level."
+
+
+def test_get_function_missing():
+    index = code_parser.parse_file(DUMMY_MODULE)
+
+    with pytest.raises(ValueError):
+        index.get_function("missing")
@@ -0,0 +1,72 @@
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from docstring_validator.async_api import analyze_files_async, iter_errors_async
+from docstring_validator.docstring_validator import analyze_files, iter_errors
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+PATHS = [REPO_PATH / "tests" / "dummy_module.py", REPO_PATH / "tests" / "testing.py"]
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_iter_errors_async_matches_iter_errors(concurrency):
+    records = asyncio.run(
+        collect(iter_errors_async(PATHS, r"test_\w+", concurrency=concurrency))
+    )
+
+    assert records == list(iter_errors(PATHS, r"test_\w+"))
+
+
+def test_analyze_files_async():
+    report = asyncio.run(analyze_files_async(PATHS, r"test_\w+"))
+
+    assert report == analyze_files(PATHS, r"test_\w+")
+
+
+def test_external_executor():
+    with ThreadPoolExecutor(2) as executor:
+        records = asyncio.run(
+            collect(iter_errors_async(PATHS, r"test_\w+", executor=executor))
+        )
+        assert executor.submit(len, records).result() == len(records)
+
+    assert records == list(iter_errors(PATHS, r"test_\w+"))
+
+
+def test_max_errors(tmp_path):
+    for i in range(5):
+        (tmp_path / f"test_{i}.py").write_text(
+            "def test_a():\n    pass\n\n\ndef test_b():\n    pass\n"
+        )
+    stats = Counter()
+    records = asyncio.run(
+        collect(iter_errors_async([tmp_path], r"test_\w+", stats=stats, max_errors=3))
+    )
+
+    assert [(record.path.name, record.function) for record in records] == [
+        ("test_0.py", "test_a"),
+        ("test_0.py", "test_b"),
+        ("test_1.py", "test_a"),
+    ]
+    assert stats["files"] == 2
+    assert stats["files_unchecked"] == 3
+
+
+def test_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    asyncio.run(collect(iter_errors_async(PATHS, r"test_\w+", cache_dir=cache_dir)))
+    stats = Counter()
+    records = asyncio.run(
+        collect(iter_errors_async(PATHS, r"test_\w+", cache_dir=cache_dir, stats=stats))
+    )
+
+    assert records == list(iter_errors(PATHS, r"test_\w+"))
+    assert stats["cache_hits"] == 2
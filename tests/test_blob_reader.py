@@ -0,0 +1,28 @@
+from docstring_validator.blob_reader import BlobReader
+
+
+def test_read_staged(tmp_path, git):
+    (tmp_path / "a.py").write_text("committed\n")
+    git("add", "a.py")
+    git("commit", "-m", "init")
+    (tmp_path / "a.py").write_text("staged\n")
+    git("add", "a.py")
+    (tmp_path / "a.py").write_text("working tree\n")
+
+    with BlobReader(tmp_path) as reader:
+        assert reader.read_staged("a.py") == b"staged\n"
+        assert reader.read_staged("a.py", "HEAD") == b"committed\n"
+        assert reader.read_staged("missing.py") is None
+        assert reader.read("HEAD") is None  # commit, not a blob
+        assert reader.read_staged("a.py") == b"staged\n"
+
+
+def test_read_binary_content(tmp_path, git):
+    content = b"\x00\n\nline\r\n" * 1000
+    (tmp_path / "b.bin").write_bytes(content)
+    git("add", "b.bin")
+
+    reader = BlobReader(tmp_path)
+    assert reader.read_staged("b.bin") == content
+    reader.close()
+    reader.close()
@@ -0,0 +1,63 @@
+import os
+from collections import Counter
+from pathlib import Path
+
+from docstring_validator import analyze_files
+from docstring_validator.cache import ResultCache
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+DATA = REPO_PATH / "tests" / "testing.py"
+
+
+def test_key():
+    key = ResultCache.key(b"content", r"test_\w+")
+
+    assert key == ResultCache.key(b"content", r"test_\w+")
+    assert key != ResultCache.key(b"content", r"\w+")
+    assert key != ResultCache.key(b"changed content", r"test_\w+")
+
+
+def test_put_get(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    key = ResultCache.key(b"content", None)
+
+    assert cache.get(key) is None
+    cache.put(key, {"errors": {}})
+    assert cache.get(key) == {"errors": {}}
+    assert (tmp_path / "cache" / ".gitignore").exists()
+
+
+def test_prune_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_size=40)
+    keys = [ResultCache.key(str(i).encode(), None) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, {"data": "x" * 5})
+        entry = cache._entry_path(key)
+        os.utime(entry, (i, i))
+
+    assert cache.prune() == 1
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+
+
+def test_analyze_files_cached(tmp_path):
+    stats = Counter()
+    report = analyze_files([DATA], r"test_\w+", cache_dir=tmp_path, stats=stats)
+    assert stats["cache_misses"] == 1
+
+    stats = Counter()
+    cached_report = analyze_files([DATA], r"test_\w+", cache_dir=tmp_path, stats=stats)
+    assert stats["cache_hits"] == 1
+    assert cached_report == report
+
+
+def test_prune_only_after_writes(tmp_path, monkeypatch):
+    pruned = []
+    monkeypatch.setattr(ResultCache, "prune", lambda cache: pruned.append(cache))
+    stats = Counter()
+    analyze_files([DATA], r"test_\w+", cache_dir=tmp_path, stats=stats)
+    assert stats["cache_writes"] == 1
+    assert len(pruned) == 1
+
+    analyze_files([DATA], r"test_\w+", cache_dir=tmp_path)
+    assert len(pruned) == 1
@@ -0,0 +1,144 @@
+import io
+import json
+from collections import Counter
+
+import pytest
+
+from docstring_validator import cli_lib, docstring_validator, git_cli
+from docstring_validator.blob_reader import BlobReader
+from docstring_validator.cache import BlobCache
+from docstring_validator.reporter import format_record
+from docstring_validator.result_store import ResultStore
+
+VALID = '''    """Summary.
+
+    Test steps:
+    1. A
+
+    Pass criteria:
+    - B
+
+    Fail criteria:
+    - C
+    """
+'''
+FIRST = f"def test_a():\n    pass\n\n\ndef test_b():\n{VALID}    pass\n"
+SECOND = "def test_a():\n    pass\n\n\ndef test_b():\n    pass\n"
+
+
+@pytest.fixture
+def history(tmp_path, git, monkeypatch):
+    """Repository with three commits, the last one restores the first version."""
+    monkeypatch.setattr(docstring_validator, "_blob_cache", BlobCache())
+
+    def commit(message, **files):
+        for name, content in files.items():
+            (tmp_path / name).write_text(content)
+        git("add", ".")
+        git("commit", "-q", "-m", message)
+        return git("rev-parse", "HEAD").strip()
+
+    base = commit("base", **{"README": "readme\n"})
+    commits = [
+        commit("add tests", **{"test_a.py": FIRST}),
+        commit("break test_b", **{"test_a.py": SECOND, "other.txt": "x\n"}),
+        commit("revert", **{"test_a.py": FIRST, "test_c.py": FIRST}),
+    ]
+    return tmp_path, base, commits
+
+
+def test_iter_commit_diffs(history):
+    repo, base, commits = history
+    diffs = list(git_cli.iter_commit_diffs(repo, f"{base}..HEAD"))
+
+    assert [commit for commit, _ in diffs] == commits
+    assert [[diff.path for diff in files] for _, files in diffs] == [
+        ["test_a.py"],
+        ["other.txt", "test_a.py"],
+        ["test_a.py", "test_c.py"],
+    ]
+    first_blob = diffs[0][1][0].blob
+    assert [diff.blob for diff in diffs[2][1]] == [first_blob, first_blob]
+
+
+def test_iter_commit_diffs_stops_early(history):
+    repo, base, _ = history
+    diffs = git_cli.iter_commit_diffs(repo, "HEAD")
+    assert next(diffs)[0] == base
+    diffs.close()
+
+
+def test_iter_commit_diffs_invalid_range(history):
+    repo, _, _ = history
+    with pytest.raises(Exception):
+        list(git_cli.iter_commit_diffs(repo, "missing..HEAD"))
+
+
+def test_errors_are_attributed_to_commits(history):
+    repo, base, commits = history
+    stats = Counter()
+    records = list(
+        docstring_validator.iter_range_errors(
+            repo, f"{base}..HEAD", r"test_\w+", stats=stats
+        )
+    )
+
+    assert [(r.commit, r.path.name, r.function, r.code) for r in records] == [
+        (commits[0], "test_a.py", "test_a", "E300"),
+        (commits[1], "test_a.py", "test_b", "E300"),
+        (commits[2], "test_c.py", "test_a", "E300"),
+    ]
+    # the last commit restores and copies the file from the first one
+    assert stats["blob_cache_hits"] == 2
+
+
+def test_range_max_errors(history):
+    repo, base, commits = history
+    stats = Counter()
+    records = list(
+        docstring_validator.iter_range_errors(
+            repo, f"{base}..HEAD", r"test_\w+", stats=stats, max_errors=1
+        )
+    )
+
+    assert [record.commit for record in records] == commits[:1]
+    assert stats["error_limit_reached"] == 1
+    assert stats["files_unchecked"] == 3
+
+
+def test_range_max_errors_does_not_read_remaining_blobs(history, monkeypatch):
+    repo, base, _ = history
+    reads = []
+    read = BlobReader.read
+    monkeypatch.setattr(
+        BlobReader, "read", lambda self, spec: reads.append(spec) or read(self, spec)
+    )
+    records = list(
+        docstring_validator.iter_range_errors(
+            repo, f"{base}..HEAD", r"test_\w+", max_errors=1
+        )
+    )
+
+    assert len(records) == 1
+    assert len(reads) == 1
+
+
+def test_cli_range(history, monkeypatch):
+    repo, base, commits = history
+    monkeypatch.chdir(repo)
+    stdout = io.StringIO()
+    argv = ["-p", r"test_\w+", "--range", f"{base}..HEAD", "--format", "jsonl"]
+
+    assert cli_lib.main(argv, stdout) == 1
+    lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [line["commit"] for line in lines] == commits
+
+
+def test_commit_in_reports(history):
+    repo, base, commits = history
+    records = list(
+        docstring_validator.iter_range_errors(repo, f"{base}..HEAD", r"test_\w+")
+    )
+
+    assert format_record(records[0], colors=False).startswith(f"{commits[0][:10]} ")
+    assert list(ResultStore.from_records(records)) == records
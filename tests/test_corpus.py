@@ -0,0 +1,21 @@
+import random
+
+from benchmarks.corpus import CorpusConfig, generate_corpus, generate_module
+from docstring_validator import analyze_files
+
+
+def test_generate_module_deterministic():
+    config = CorpusConfig(functions=10)
+    first = generate_module(random.Random(1), config)
+    second = generate_module(random.Random(1), config)
+
+    assert first == second
+    assert first != generate_module(random.Random(2), config)
+
+
+def test_generate_corpus_validity_mix(tmp_path):
+    generate_corpus(tmp_path / "valid", CorpusConfig(files=2, valid_ratio=1.0))
+    generate_corpus(tmp_path / "invalid", CorpusConfig(files=2, valid_ratio=0.0))
+
+    assert analyze_files([tmp_path / "valid"], r"test_\w+") == []
+    assert len(analyze_files([tmp_path / "invalid"], r"test_\w+")) >= 100
@@ -0,0 +1,143 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import cli_lib, daemon
+
+TESTING = """def test_a():
+    pass
+"""
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / "daemon.sock"
+    thread = threading.Thread(target=daemon.serve, args=(path, 1, cli_lib.main))
+    thread.start()
+    while not path.exists():
+        time.sleep(0.01)
+    yield path
+    thread.join()
+    assert not path.exists()
+
+
+def run(path, argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = daemon.run_client(daemon.connect(path, start=False), argv, stdout, stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_client_output_matches_local_run(server, tmp_path, monkeypatch):
+    (tmp_path / "test_a.py").write_text(TESTING)
+    monkeypatch.chdir(tmp_path)
+    argv = ["test_a.py", "-p", r"test_\w+", "--no-cache"]
+
+    stdout = io.StringIO()
+    local_code = cli_lib.main(argv, stdout, io.StringIO())
+
+    code, output, _ = run(server, argv)
+    assert (code, output) == (local_code, stdout.getvalue())
+    assert code == 1
+    assert "E300" in output
+
+
+def test_unmodified_files_are_reused(server, tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text(TESTING)
+    argv = [str(module), "-p", r"test_\w+", "--no-cache", "-v"]
+
+    _, _, stats = run(server, argv)
+    assert "reused by daemon" not in stats
+    _, _, stats = run(server, argv)
+    assert "Unmodified files reused by daemon: 1" in stats
+
+    module.write_text(TESTING.replace("pass", '"""Summary."""'))
+    code, output, stats = run(server, argv)
+    assert "reused by daemon" not in stats
+    assert "E300" not in output
+
+
+def test_invalid_request_does_not_stop_daemon(server, tmp_path):
+    code, _, error = run(server, ["--jobs", "-1"])
+    assert code == 2
+    code, _, _ = run(server, [str(tmp_path)])
+    assert code == 0
+
+
+def test_second_daemon_exits_immediately(server):
+    daemon.serve(server, 10, cli_lib.main)
+    assert server.exists()
+
+
+def test_connect_without_daemon(tmp_path):
+    with pytest.raises(OSError):
+        daemon.connect(tmp_path / "missing.sock", start=False)
+
+
+def test_client_starts_daemon(tmp_path):
+    path = tmp_path / "daemon.sock"
+    (tmp_path / "test_a.py").write_text(TESTING)
+    env = dict(os.environ, PYTHONPATH=str(Path(cli_lib.__file__).parent.parent))
+    argv = ["--client", "--socket", str(path), "--idle-timeout", "1", "-p", r"test_\w+"]
+
+    result = subprocess.run(
+        [sys.executable, "-m", "docstring_validator", *argv, "test_a.py"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1
+    assert "E300" in result.stdout
+    assert "not available" not in result.stderr
+    assert path.exists()
+
+    while path.exists():  # daemon stops when idle
+        time.sleep(0.05)
+
+
+def test_socket_path_in_runtime_dir(tmp_path, monkeypatch):
+    runtime_dir = tmp_path / "runtime"
+    runtime_dir.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+
+    assert daemon.get_socket_path().parent == runtime_dir
+
+
+def test_socket_path_in_private_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    path = daemon.get_socket_path()
+    assert path.parent.parent == tmp_path
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+    assert daemon.get_socket_path() == path
+
+
+def test_shared_socket_dir_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    (tmp_path / f"docstring-validator-{os.getuid()}").mkdir(mode=0o777)
+    os.chmod(tmp_path / f"docstring-validator-{os.getuid()}", 0o777)
+
+    with pytest.raises(PermissionError):
+        daemon.get_socket_path()
+
+
+def test_socket_of_other_user_is_rejected(server, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(server).st_uid + 1)
+    with pytest.raises(PermissionError):
+        daemon.connect(server, start=False)
+
+
+def test_client_watch_is_rejected(capsys):
+    with pytest.raises(SystemExit):
+        cli_lib.get_args(["--client", "--watch", "tests"])
+    assert "--watch" in capsys.readouterr().err
@@ -0,0 +1,173 @@
+import io
+import subprocess
+
+import pytest
+
+from docstring_validator import cli_lib, discovery
+
+FILES = [
+    "a.py",
+    "pkg/b.py",
+    "pkg/sub/c.py",
+    "pkg/z.py",
+    "pkg/notes.txt",
+    ".git/hooks/hook.py",
+    ".venv/lib/site.py",
+    "node_modules/pkg/d.py",
+    "build/lib/e.py",
+    "generated/f.py",
+    "generated/keep.py",
+    "logs/debug.py",
+]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name in FILES:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / ".gitignore").write_text("# comment\ngenerated/\nlogs/*.py\n")
+    (tmp_path / "generated" / ".gitignore").write_text("!keep.py\n")
+    return tmp_path
+
+
+def relative(root, paths):
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+def test_walk_files_default_excludes(tree):
+    files = relative(tree, discovery.walk_files([tree]))
+
+    assert files == [
+        "a.py",
+        "generated/f.py",
+        "generated/keep.py",
+        "logs/debug.py",
+        "pkg/b.py",
+        "pkg/sub/c.py",
+        "pkg/z.py",
+    ]
+
+
+def test_walk_files_gitignore(tree):
+    options = discovery.DiscoveryOptions(gitignore=True)
+    files = relative(tree, discovery.walk_files([tree], options))
+
+    assert files == ["a.py", "pkg/b.py", "pkg/sub/c.py", "pkg/z.py"]
+
+
+def test_walk_files_include_exclude(tree):
+    options = discovery.DiscoveryOptions(
+        includes=["*.py", "*.txt"], excludes=["pkg/sub", "generated"]
+    )
+    files = relative(tree, discovery.walk_files([tree], options))
+
+    assert files == ["a.py", "logs/debug.py", "pkg/b.py", "pkg/notes.txt", "pkg/z.py"]
+
+
+def test_walk_files_explicit_files(tree):
+    paths = [tree / "build" / "lib" / "e.py", tree / "pkg", tree / "pkg" / "b.py"]
+    files = relative(tree, discovery.walk_files(paths))
+
+    assert files == ["build/lib/e.py", "pkg/b.py", "pkg/sub/c.py", "pkg/z.py"]
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected",
+    [
+        ("*.log", "a/b.log", True),
+        ("/root.py", "root.py", True),
+        ("/root.py", "a/root.py", False),
+        ("a/**/c.py", "a/b/d/c.py", True),
+        ("**/c.py", "x/c.py", True),
+        ("a/**", "a/b/c", True),
+        ("file[!0-9].py", "file1.py", False),
+    ],
+)
+def test_gitignore_patterns(tmp_path, pattern, path, expected):
+    (tmp_path / ".gitignore").write_text(pattern)
+    ignore = discovery.GitIgnore.load(str(tmp_path))
+
+    assert bool(ignore.match(str(tmp_path / path), is_dir=False)) is expected
+
+
+@pytest.fixture
+def repo(tree, git):
+    git("add", "a.py", "pkg/b.py", "pkg/sub/c.py", "pkg/notes.txt", "build")
+    git("add", "--force", "generated/f.py")
+    (tree / "deleted.py").write_text("")
+    git("add", "deleted.py")
+    (tree / "deleted.py").unlink()
+    return tree
+
+
+def test_list_git_files(repo):
+    files = relative(repo, discovery.list_git_files([repo]))
+
+    assert files == ["a.py", "generated/f.py", "pkg/b.py", "pkg/sub/c.py"]
+
+
+def test_list_git_files_untracked(repo):
+    options = discovery.DiscoveryOptions(untracked=True)
+    files = relative(repo, discovery.list_git_files([repo], options))
+
+    assert sorted(files) == [
+        "a.py",
+        "generated/f.py",
+        "pkg/b.py",
+        "pkg/sub/c.py",
+        "pkg/z.py",
+    ]
+
+
+def test_list_git_files_include_exclude(repo):
+    options = discovery.DiscoveryOptions(
+        includes=["c.py", "*.txt"], excludes=["generated"]
+    )
+    files = relative(repo, discovery.list_git_files([repo], options))
+
+    assert files == ["pkg/notes.txt", "pkg/sub/c.py"]
+
+
+def test_list_git_files_explicit_files(repo):
+    paths = [repo / "pkg" / "z.py", repo / "pkg", repo / "a.py"]
+    files = relative(repo, discovery.list_git_files(paths))
+
+    assert files == ["pkg/z.py", "pkg/b.py", "pkg/sub/c.py", "a.py"]
+
+
+def test_list_git_files_not_in_repository(tmp_path):
+    with pytest.raises(subprocess.CalledProcessError):
+        list(discovery.list_git_files([tmp_path]))
+
+
+def test_discover_files_backend(repo):
+    options = discovery.DiscoveryOptions(backend="git")
+    files = relative(repo, discovery.discover_files([repo], options))
+    assert files == ["a.py", "generated/f.py", "pkg/b.py", "pkg/sub/c.py"]
+
+    with pytest.raises(ValueError):
+        discovery.discover_files([repo], discovery.DiscoveryOptions(backend="find"))
+
+
+def test_cli_git_discovery(tmp_path, git):
+    for name in ("test_tracked.py", "test_untracked.py"):
+        (tmp_path / name).write_text("def test_a():\n    pass\n")
+    git("add", "test_tracked.py")
+    argv = [str(tmp_path), "-p", r"test_\w+", "--no-cache", "--discovery", "git"]
+
+    stdout = io.StringIO()
+    assert cli_lib.main(argv, stdout) == 1
+    assert "test_tracked.py" in stdout.getvalue()
+    assert "test_untracked.py" not in stdout.getvalue()
+
+    stdout = io.StringIO()
+    assert cli_lib.main(argv + ["--untracked"], stdout) == 1
+    assert stdout.getvalue().count("E300") == 2
+
+
+def test_cli_untracked_requires_git_discovery(capsys):
+    with pytest.raises(SystemExit):
+        cli_lib.get_args(["--untracked", "tests"])
+    assert "--discovery git" in capsys.readouterr().err
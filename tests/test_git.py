@@ -1,8 +1,10 @@
+from collections import Counter
 from pathlib import Path
 
 import pytest
 
-from docstring_validator import diff_util
+from docstring_validator import analyze_files, diff_util, iter_staged_errors
+from docstring_validator.blob_reader import BlobReader
 
 REPO_PATH = Path(__file__).parent.parent.absolute()
 
@@ -39,3 +41,100 @@ def test_find_func_names():
     names = diff_util.find_func_names(diff, r"test_\w+")
     assert len(names) == 1
     assert names == ["test_BUG1701"]
+
+
+@pytest.mark.parametrize(
+    "pattern, needle",
+    [
+        (r"test_\w+", b"def test_"),
+        (r"test_BUG\d+", b"def test_BUG"),
+        ("tests?_", b"def test"),
+        ("test_(a|b)", b"def "),
+        (r"(?i)test_\w+", b"def "),
+    ],
+)
+def test_func_def_needle(pattern, needle):
+    assert diff_util.func_def_needle(pattern) == needle
+
+
+@pytest.mark.parametrize("mmap_min_size", [0, 1024 * 1024])
+def test_read_if_contains(tmp_path, monkeypatch, mmap_min_size):
+    monkeypatch.setattr(diff_util, "MMAP_MIN_SIZE", mmap_min_size)
+    path = tmp_path / "module.py"
+    path.write_text("def test_abc():\n    pass\n")
+
+    assert diff_util.read_if_contains(path, b"def test_") == path.read_bytes()
+    assert diff_util.read_if_contains(path, b"def check_") is None
+
+
+def test_analyze_files_skips_files_without_functions():
+    stats = Counter()
+    paths = [REPO_PATH / "tests" / "static_data.py", REPO_PATH / "tests" / "testing.py"]
+    report = analyze_files(paths, r"test_\w+", stats=stats)
+
+    assert len(report) == 2
+    assert stats["files"] == 2
+    assert stats["files_skipped"] == 1
+
+
+@pytest.mark.parametrize(
+    "diff, expected",
+    [
+        ("@@ -1,2 +1,3 @@\n def a():\n+    pass\n", [(1, 3)]),
+        ("@@ -5 +5 @@\n-a\n+b\n@@ -10,0 +11,2 @@\n+c\n+d\n", [(5, 5), (11, 12)]),
+        ("@@ -3,2 +2,0 @@\n-a\n-b\n", [(2, 2)]),
+        ("", []),
+    ],
+)
+def test_get_changed_lines(diff, expected):
+    assert diff_util.get_changed_lines(diff) == expected
+
+
+def test_staged_changes_select_enclosing_functions(tmp_path, git):
+    module = tmp_path / "test_module.py"
+    source = (Path(__file__).parent / "testing.py").read_text()
+    module.write_text(source)
+    git("add", "test_module.py")
+    git("commit", "-m", "init")
+
+    # change docstring body only, no function definition is in added lines
+    module.write_text(source.replace("    3. B\n", "    3. X\n"))
+    git("add", "test_module.py")
+
+    records = list(iter_staged_errors(tmp_path, r"test_\w+"))
+    assert {record.function for record in records} == {"test_c"}
+
+
+def test_staged_content_is_read_from_index(tmp_path, git):
+    module = tmp_path / "test_module.py"
+    git("commit", "--allow-empty", "-m", "init")
+    module.write_text("def test_a():\n    pass\n")
+    git("add", "test_module.py")
+    # unstaged fix must not hide error in staged version
+    module.write_text('\n\ndef test_a():\n    """Summary."""\n')
+
+    diffs = list(diff_util.iter_diffs(tmp_path))
+    assert [diff.source for diff in diffs] == ["def test_a():\n    pass\n"]
+
+    records = list(iter_staged_errors(tmp_path, r"test_\w+"))
+    assert [(record.function, record.code, record.line) for record in records] == [
+        ("test_a", "E300", 1)
+    ]
+
+
+def test_staged_error_limit_does_not_read_remaining_files(tmp_path, git, monkeypatch):
+    git("commit", "--allow-empty", "-m", "init")
+    for i in range(5):
+        (tmp_path / f"test_{i}.py").write_text("def test_a():\n    pass\n")
+    git("add", ".")
+    reads = []
+    read = BlobReader.read
+    monkeypatch.setattr(
+        BlobReader, "read", lambda self, spec: reads.append(spec) or read(self, spec)
+    )
+
+    stats = Counter()
+    records = list(iter_staged_errors(tmp_path, r"test_\w+", stats=stats, max_errors=1))
+    assert len(records) == 1
+    assert stats["files_unchecked"] == 4
+    assert reads == [":test_0.py"]
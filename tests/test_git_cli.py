@@ -0,0 +1,104 @@
+import pytest
+
+from docstring_validator import diff_util, git_cli
+
+
+def test_parse_diff():
+    output = b"""diff --git a/a.py b/a.py
+index 1111111..2222222 100644
+--- a/a.py
++++ b/a.py
+@@ -1,0 +2,2 @@
++def test_a():
++    pass
+diff --git a/old.py b/new.py
+similarity index 100%
+rename from old.py
+rename to new.py
+diff --git a/gone.py b/gone.py
+deleted file mode 100644
+index 3333333..0000000
+--- a/gone.py
++++ /dev/null
+@@ -1 +0,0 @@
+-x = 1
+diff --git "a/sp ace\\303\\244.py" "b/sp ace\\303\\244.py"
+new file mode 100644
+--- /dev/null
++++ "b/sp ace\\303\\244.py"
+@@ -0,0 +1 @@
++y = 2
+"""
+    assert git_cli.parse_diff(output) == [
+        git_cli.FileDiff(
+            "a.py", "@@ -1,0 +2,2 @@\n+def test_a():\n+    pass", "2222222"
+        ),
+        git_cli.FileDiff("new.py", ""),
+        git_cli.FileDiff("sp aceä.py", "@@ -0,0 +1 @@\n+y = 2\n"),
+    ]
+
+
+def test_parse_empty_diff():
+    assert git_cli.parse_diff(b"") == []
+
+
+@pytest.fixture
+def repo(tmp_path, git):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    git("add", ".")
+    git("commit", "-m", "init")
+    (tmp_path / "a.py").write_text("a = 1\n\n\ndef test_a():\n    pass\n")
+    (tmp_path / "c d.py").write_text("c = 1\n")
+    git("rm", "-q", "b.py")
+    git("add", ".")
+    return tmp_path
+
+
+def test_get_diffs(repo):
+    diffs = git_cli.get_diffs(repo)
+    assert [diff.path for diff in diffs] == ["a.py", "c d.py"]
+    assert diff_util.get_changed_lines(diffs[0].diff) == [(2, 5)]
+
+
+def test_get_diffs_between_revisions(repo, git):
+    git("commit", "-m", "second")
+    diffs = git_cli.get_diffs(repo, "HEAD~1", "HEAD")
+    assert [diff.path for diff in diffs] == ["a.py", "c d.py"]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        ("diff.noprefix", "true"),
+        ("diff.mnemonicPrefix", "true"),
+        ("diff.dstPrefix", "new/"),
+    ],
+)
+def test_diff_prefix_config_is_ignored(repo, git, config):
+    git("config", *config)
+    diffs = git_cli.get_diffs(repo)
+    assert [diff.path for diff in diffs] == ["a.py", "c d.py"]
+
+    git("commit", "-m", "second")
+    commits = list(git_cli.iter_commit_diffs(repo, "HEAD~1..HEAD"))
+    assert [diff.path for diff in commits[0][1]] == ["a.py", "c d.py"]
+
+
+def test_get_diffs_before_first_commit(tmp_path, git):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    git("add", "a.py")
+    assert git_cli.get_diffs(tmp_path) == [
+        git_cli.FileDiff(
+            "a.py",
+            "@@ -0,0 +1 @@\n+a = 1\n",
+            "1337a530cbc1bd7d20aee2d80f1f174a9182417d",  # git hash-object a.py
+        )
+    ]
+
+
+def test_backends_are_equivalent(repo):
+    pytest.importorskip("git")
+    cli = list(diff_util.iter_diffs(repo, backend="cli"))
+    gitpython = list(diff_util.iter_diffs(repo, backend="gitpython"))
+    assert cli == gitpython
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+# cumulative import time of the package in microseconds, generous to avoid
+# flaky failures on slow machines - regressions are usually much bigger
+IMPORT_TIME_BUDGET = 200_000
+
+# modules imported only when needed, e.g. by GitPython backend or parallel run,
+# or never, e.g. loaded with xml.sax.saxutils
+LAZY_MODULES = (
+    "git",
+    "concurrent.futures",
+    "multiprocessing",
+    "xml",
+    "urllib.request",
+    "http",
+    "email",
+    "ssl",
+)
+
+
+def get_import_times(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time_budget():
+    times = get_import_times("docstring_validator")
+    assert times["docstring_validator"] < IMPORT_TIME_BUDGET
+
+
+def test_optional_features_are_not_imported():
+    times = get_import_times("docstring_validator")
+    assert "docstring_validator.shard" not in times
+    assert "docstring_validator.writers" not in times
+
+
+def test_heavy_modules_are_not_imported():
+    times = get_import_times("docstring_validator.cli_lib")
+    imported = [
+        module
+        for module in times
+        for lazy in LAZY_MODULES
+        if module == lazy or module.startswith(f"{lazy}.")
+    ]
+    assert imported == []
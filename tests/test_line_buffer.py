@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from docstring_validator.diff_util import find_func_names, read_file
+from docstring_validator.line_buffer import LineBuffer
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+
+TEXT = "+def test_a():\n    pass\n+\n+def test_b(): def test_c\n\n"
+
+
+@pytest.mark.parametrize("prefix", ["", "+"])
+def test_lines_match_split(prefix):
+    lines = [line for line in TEXT.split("\n") if line.startswith(prefix)]
+    buffer = LineBuffer(TEXT, prefix)
+
+    assert len(buffer) == len(lines)
+    assert list(buffer) == lines
+    assert [buffer[i] for i in range(len(lines))] == lines
+    assert buffer[-1] == lines[-1]
+    assert buffer[1:3] == lines[1:3]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"test_\w+", r"test_[^(]+", r"test_\w+$", r"test_b\(\)\s+def", "(?i:TEST_A)", "x"],
+)
+@pytest.mark.parametrize("prefix", ["", "+"])
+def test_find_func_names_matches_line_by_line(pattern, prefix):
+    buffer = LineBuffer(TEXT, prefix)
+
+    assert find_func_names(buffer, pattern) == find_func_names(list(buffer), pattern)
+
+
+@pytest.mark.parametrize("name", ["dummy_module.py", "testing.py"])
+def test_find_func_names_in_module(name):
+    path = REPO_PATH / "tests" / name
+    lines = path.read_text().split("\n")
+
+    content = read_file(path).content
+    assert isinstance(content, LineBuffer)
+    assert find_func_names(content, r"test_\w+") == find_func_names(lines, r"test_\w+")
+
+
+def test_read_file_normalizes_newlines(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_bytes(b"def a():\r\n    pass\rdef b():\n")
+
+    assert list(read_file(path).content) == ["def a():", "    pass", "def b():", ""]
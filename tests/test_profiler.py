@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+from docstring_validator import analyze_files, docstring_validator, profiler
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+PATHS = [REPO_PATH / "tests" / "dummy_module.py", REPO_PATH / "tests" / "testing.py"]
+
+
+def test_span_disabled():
+    assert not profiler.is_enabled()
+    assert profiler.span("parse") is profiler.span("validate")
+
+
+def test_profile_analysis():
+    recorded = profiler.enable()
+    try:
+        analyze_files(PATHS, r"test_\w+")
+    finally:
+        profiler.disable()
+
+    names = {event["name"] for event in recorded.events}
+    assert {"find files", "read", "parse", "validate", "file"} <= names
+    assert recorded.to_chrome_trace()["traceEvents"] is recorded.events
+
+    slowest = recorded.slowest("file", "path", top=1)
+    assert len(slowest) == 1
+    assert slowest[0][0] in {str(path) for path in PATHS}
+
+
+def test_profile_pool_workers(monkeypatch):
+    monkeypatch.setattr(docstring_validator, "PARALLEL_MIN_BYTES", 0)
+    recorded = profiler.enable()
+    try:
+        analyze_files(PATHS, r"test_\w+", jobs=2)
+    finally:
+        profiler.disable()
+
+    parse_events = [event for event in recorded.events if event["name"] == "parse"]
+    assert len(parse_events) == 2
+    assert all(event["pid"] != os.getpid() for event in parse_events)
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from docstring_validator import reporter
+from docstring_validator import code_parser, reporter
 from docstring_validator.validation_error import ValidationError
 
 
@@ -25,3 +25,17 @@ def test_report_errors():
     report = reporter.report_errors(ERRORS)
     assert isinstance(report, list)
     assert len(report) == 3
+
+
+def test_report_errors_with_symbols():
+    symbols = {
+        Path("tests/dummy_module.py"): {
+            "test_BUG2042005": code_parser.FunctionInfo(
+                "test_BUG2042005", "test_BUG2042005", "def", 1, 2, None
+            )
+        }
+    }
+    errors = {Path("tests/dummy_module.py"): ERRORS[Path("tests/dummy_module.py")]}
+    report = reporter.report_errors(errors, symbols)
+    assert len(report) == 1
+    assert "1\033[36m:" in report[0]
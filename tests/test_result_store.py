@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import ResultStore, analyze_files, iter_errors
+from docstring_validator.reporter import report_records
+from docstring_validator.validation_error import ErrorRecord, ValidationError
+
+RECORDS = [
+    ErrorRecord(Path("a.py"), "test_a", 1, 3, "E300", "Missing/Empty docstring"),
+    ErrorRecord(Path("a.py"), "test_b", 5, None, "E300", "Missing/Empty docstring"),
+    ErrorRecord(
+        Path("b.py"), "test_a", 70000, 70010, "E211", "Pass section is missing"
+    ),
+]
+
+
+def test_roundtrip():
+    store = ResultStore.from_records(RECORDS)
+    assert len(store) == 3
+    assert list(store) == RECORDS
+    assert store[1] == RECORDS[1]
+
+
+def test_values_are_interned():
+    store = ResultStore.from_records(RECORDS * 1000)
+    assert len(store) == 3000
+    assert store.paths.values == [Path("a.py"), Path("b.py")]
+    assert len(store.strings) == 6
+    assert store.count_codes() == {"E300": 2000, "E211": 1000}
+
+
+def test_render_matches_report():
+    store = ResultStore.from_records(RECORDS)
+    assert list(store.render()) == report_records(RECORDS)
+
+
+def test_report_is_formatted_lazily():
+    formatted = []
+
+    def formatter(record):
+        formatted.append(record)
+        return record.function
+
+    report = ResultStore.from_records(RECORDS).report(formatter)
+    assert formatted == []
+    assert report[-1] == "test_a"
+    assert report[:2] == ["test_a", "test_b"]
+    assert len(report) == 3
+    assert report == ["test_a", "test_b", "test_a"]
+    assert len(formatted) == 6
+
+
+def test_analyze_files_returns_report():
+    path = Path(__file__).parent / "testing.py"
+    report = analyze_files([path], r"test_\w+")
+    assert list(report.store) == list(iter_errors([path], r"test_\w+"))
+    assert report == report_records(report.store)
+
+
+def test_store_analysis_results():
+    path = Path(__file__).parent / "testing.py"
+    records = list(iter_errors([path], r"test_\w+"))
+    assert list(ResultStore.from_records(iter_errors([path], r"test_\w+"))) == records
+
+
+def test_validation_error_has_no_instance_dict():
+    error = ValidationError("E300", "Missing/Empty docstring")
+    assert not hasattr(error, "__dict__")
+    with pytest.raises(AttributeError):
+        error.line = 1
+    assert error.code is sys.intern("E300")
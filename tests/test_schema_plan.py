@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import code_parser, docstring_model, schema_plan
+from tests.static_data import VALID_DOCSTRING
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+
+DOCSTRINGS = [
+    VALID_DOCSTRING,
+    None,
+    "",
+    "Simple docstring.",
+    "Summary.\n\n\n\nTest steps:\n1. A\n\n\nPass criteria:\n- B",
+    "Summary.\n\nTest steps:\n1. A\n3. B\n\nTest steps:\n2. C",
+    "Summary.\n   \nTest steps:\n1. A\n\nPass criteria:\nB\n\nFail criteria:\n- C",
+    "Summary.\n\nTest steps:\n\nPass criteria:\n- A\n\nFail criteria:\n-B",
+    "Summary.\n\nReference: BUG1, BUG2\n\nReference:\n- BUG3",
+    "Test steps:\n1. A\nmultiline\n2. B\n\nReferences: BUG1",
+]
+
+
+def module_docstrings():
+    for module in ("dummy_module.py", "testing.py"):
+        index = code_parser.parse_file(REPO_PATH / "tests" / module)
+        for func in index.functions:
+            yield func.docstring
+
+
+def errors(errors):
+    return [(error.code, error.text) for error in errors]
+
+
+@pytest.mark.parametrize("docstring", DOCSTRINGS + list(module_docstrings()))
+def test_plan_matches_docstring_model(docstring):
+    plan = schema_plan.ValidationPlan.compile()
+    expected = docstring_model.Docstring(docstring).validate()
+
+    assert errors(plan.validate(docstring)) == errors(expected)
+
+
+def test_get_plan_is_cached():
+    assert schema_plan.get_plan() is schema_plan.get_plan()
+
+
+def test_get_plan_unsupported_validators():
+    class CustomDocstring(docstring_model.Docstring):
+        validators = [lambda chunks, schema: []]
+
+    assert schema_plan.get_plan(CustomDocstring) is None
+
+
+@pytest.mark.parametrize("docstring", DOCSTRINGS + list(module_docstrings()))
+@pytest.mark.parametrize("limit", [1, 2])
+def test_limited_plan_returns_first_errors(docstring, limit):
+    plan = schema_plan.ValidationPlan.compile()
+    expected = plan.validate(docstring)[:limit]
+
+    assert errors(plan.validate(docstring, limit)) == errors(expected)
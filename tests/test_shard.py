@@ -0,0 +1,142 @@
+import io
+
+import pytest
+
+from docstring_validator import cli_lib, iter_errors
+from docstring_validator.shard import Shard, partition
+
+VALID = '''    """Summary.
+
+    Test steps:
+    1. A
+
+    Pass criteria:
+    - B
+
+    Fail criteria:
+    - C
+    """
+'''
+
+
+@pytest.mark.parametrize(
+    "value, shard",
+    [("1/4", Shard(1, 4)), ("4/4", Shard(4, 4)), ("1/1", Shard(1, 1))],
+)
+def test_parse(value, shard):
+    assert Shard.parse(value) == shard
+    assert str(shard) == value
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1", "a/b", "1/0", "-1/2"])
+def test_parse_invalid(value):
+    with pytest.raises(ValueError):
+        Shard.parse(value)
+
+
+def test_partition_balances_sizes():
+    sizes = [10, 1, 7, 3, 3, 5, 1]
+    groups = partition(sizes, 3)
+
+    assert sorted(i for group in groups for i in group) == list(range(len(sizes)))
+    assert all(group == sorted(group) for group in groups)
+    assert [sum(sizes[i] for i in group) for group in groups] == [10, 10, 10]
+    assert partition(sizes, 3) == groups
+
+
+def test_partition_more_shards_than_items():
+    assert partition([1, 2], 3) == [[1], [0], []]
+
+
+def make_modules(tmp_path, count=7):
+    modules = tmp_path / "src"
+    modules.mkdir()
+    for i in range(count):
+        functions = [
+            f"def test_{j}():\n{VALID if (i + j) % 3 else ''}    pass\n"
+            for j in range(i + 1)
+        ]
+        (modules / f"test_{i}.py").write_text("\n\n".join(functions))
+    return modules
+
+
+def run(argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    if argv[:1] != ["merge"]:
+        argv = [*argv, "--no-cache"]  # cache would be written to working directory
+    code = cli_lib.main(argv, stdout, stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def run_sharded(tmp_path, args, count, merge_args=()):
+    partials = []
+    for index in range(1, count + 1):
+        code, output, _ = run([*args, "--shard", f"{index}/{count}"])
+        assert code in (0, 1)
+        partial = tmp_path / f"shard-{index}.jsonl"
+        partial.write_text(output)
+        partials.append(str(partial))
+    return run(["merge", *partials, *merge_args])
+
+
+def test_iter_errors_shards_cover_all_files(tmp_path):
+    modules = make_modules(tmp_path)
+    expected = list(iter_errors([modules], r"test_\w+"))
+
+    sharded = []
+    for index in (1, 2, 3):
+        sharded.extend(iter_errors([modules], r"test_\w+", shard=Shard(index, 3)))
+    assert sorted(sharded) == sorted(expected)
+
+
+@pytest.mark.parametrize("count", [1, 3, 10])
+@pytest.mark.parametrize("limit", [[], ["--max-errors", "4"]])
+def test_merge_matches_unsharded_run(tmp_path, count, limit):
+    modules = make_modules(tmp_path)
+    args = [str(modules), "-p", r"test_\w+", "--no-cache", *limit]
+
+    expected = run([*args, "--format", "jsonl"])
+    assert expected[1]
+    assert run_sharded(tmp_path, args, count, ["--format", "jsonl"]) == expected
+
+
+def test_merge_with_symlinked_module(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "mod.py").write_text("def test_a():\n    pass\n")
+    modules = make_modules(tmp_path)
+    (modules / "link.py").symlink_to(real / "mod.py")
+    args = [str(modules), "-p", r"test_\w+"]
+
+    expected = run([*args, "--format", "jsonl"])
+    assert '"path": "' + str(modules / "link.py") in expected[1]
+    assert run_sharded(tmp_path, args, 2, ["--format", "jsonl"]) == expected
+
+
+def test_merge_without_errors(tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text(f"def test_a():\n{VALID}    pass\n")
+
+    assert run_sharded(tmp_path, [str(module), "-p", r"test_\w+"], 2) == (0, "", "")
+
+
+def test_merge_missing_shard(tmp_path):
+    modules = make_modules(tmp_path)
+    _, output, _ = run([str(modules), "-p", r"test_\w+", "--shard", "1/2"])
+    partial = tmp_path / "shard-1.jsonl"
+    partial.write_text(output)
+
+    code, _, stderr = run(["merge", str(partial)])
+    assert code == 2
+    assert "missing shards: 2" in stderr
+
+
+def test_merge_incomplete_shard(tmp_path):
+    modules = make_modules(tmp_path)
+    _, output, _ = run([str(modules), "-p", r"test_\w+", "--shard", "1/1"])
+    partial = tmp_path / "shard-1.jsonl"
+    partial.write_text("".join(output.splitlines(keepends=True)[:-1]))
+
+    code, _, stderr = run(["merge", str(partial)])
+    assert code == 2
+    assert "incomplete" in stderr
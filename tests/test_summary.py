@@ -0,0 +1,157 @@
+import io
+import json
+import shutil
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import (
+    cli_lib,
+    diff_util,
+    iter_errors,
+    profiler,
+    summarize_files,
+)
+from docstring_validator.reporter import report_summary
+from docstring_validator.summary import ROOT_PACKAGE, Summary
+from docstring_validator.validation_error import ValidationError
+
+TESTS_PATH = Path(__file__).parent
+MISSING = ValidationError("E300", "Missing/Empty docstring")
+NO_PASS = ValidationError("E211", "Pass section is missing")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Two packages and a module in root, copied from test data."""
+    for name in ("pkg_a/sub/testing.py", "pkg_b/dummy_module.py", "testing.py"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(TESTS_PATH / path.name, path)
+    return tmp_path
+
+
+def test_add(tmp_path):
+    summary = Summary(tmp_path)
+    summary.add(tmp_path / "pkg" / "a.py", 3, {"test_a": [MISSING, NO_PASS]})
+    summary.add(tmp_path / "pkg" / "sub" / "b.py", 2, {"test_b": [NO_PASS]})
+    summary.add(tmp_path / "c.py", 1, {})
+
+    assert summary.codes == Counter(E211=2, E300=1)
+    assert summary.total.to_dict() == dict(
+        files=3, checked=6, failing=2, errors=3, compliance=0.6667
+    )
+    assert summary.packages["pkg"].to_dict() == dict(
+        files=2, checked=5, failing=2, errors=3, compliance=0.6
+    )
+    assert summary.packages[ROOT_PACKAGE].compliance == 1.0
+
+
+def test_package_outside_root(tmp_path):
+    summary = Summary(tmp_path / "root")
+    assert summary.get_package(tmp_path / "other" / "a.py") == str(tmp_path / "other")
+
+
+def test_report_summary(tmp_path):
+    summary = Summary(tmp_path)
+    summary.add(tmp_path / "tests" / "a.py", 4, {"test_a": [MISSING]})
+
+    assert report_summary(summary) == [
+        "Files: 1, functions checked: 4, failing: 1 (75.0% compliant), errors: 1",
+        "",
+        "Code        Errors",
+        "E300             1",
+        "",
+        "Package     Files   Checked   Failing    Errors  Compliance",
+        "tests           1         4         1         1       75.0%",
+    ]
+
+
+def test_empty_summary():
+    summary = Summary()
+    assert report_summary(summary) == [
+        "Files: 0, functions checked: 0, failing: 0 (100.0% compliant), errors: 0"
+    ]
+    assert summary.to_dict()["compliance"] == 1.0
+
+
+def test_summarize_files(tree):
+    summary = summarize_files([tree], r"test_\w+", root=tree)
+    records = list(iter_errors([tree], r"test_\w+"))
+
+    assert summary.total.errors == len(records)
+    assert summary.codes == Counter(record.code for record in records)
+    assert summary.total.failing == len({(r.path, r.function) for r in records})
+    assert sorted(summary.packages) == [ROOT_PACKAGE, "pkg_a", "pkg_b"]
+    assert summary.packages["pkg_a"].to_dict() == (
+        summary.packages[ROOT_PACKAGE].to_dict()
+    )
+    assert summary.total.checked == 2 * summary.packages["pkg_a"].checked + (
+        summary.packages["pkg_b"].checked
+    )
+
+
+def test_summarize_files_without_path_list(tree, monkeypatch):
+    expected = summarize_files([tree], r"test_\w+", root=tree).to_dict()
+
+    def find_files(*args):
+        raise AssertionError("serial summary must not collect all paths")
+
+    monkeypatch.setattr(diff_util, "find_files", find_files)
+    assert summarize_files([tree], r"test_\w+", root=tree).to_dict() == expected
+
+
+def test_summarize_cached_files(tree, tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("cache")
+    first = summarize_files([tree], r"test_\w+", cache_dir=cache_dir, root=tree)
+    stats = Counter()
+    second = summarize_files(
+        [tree], r"test_\w+", cache_dir=cache_dir, stats=stats, root=tree
+    )
+
+    assert stats["cache_hits"] == 3
+    assert second.to_dict() == first.to_dict()
+
+
+def test_cli_summary(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    stdout = io.StringIO()
+
+    assert (
+        cli_lib.main([".", "-p", r"test_\w+", "--summary", "--no-cache"], stdout) == 1
+    )
+    assert stdout.getvalue().startswith("Files: 3, functions checked: ")
+
+    stdout = io.StringIO()
+    argv = [".", "-p", r"test_\w+", "--summary", "--no-cache", "--format", "jsonl"]
+    assert cli_lib.main(argv, stdout) == 1
+    data = json.loads(stdout.getvalue())
+    assert data == summarize_files([tree], r"test_\w+").to_dict()
+
+
+def test_cli_summary_profile(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    stderr = io.StringIO()
+    argv = [".", "-p", r"test_\w+", "--summary", "--no-cache", "--profile", "t.json"]
+
+    assert cli_lib.main(argv, io.StringIO(), stderr) == 1
+    assert not profiler.is_enabled()
+    names = {
+        event["name"] for event in json.loads(Path("t.json").read_text())["traceEvents"]
+    }
+    assert {"parse", "validate"} <= names
+    assert "parse" in stderr.getvalue()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--summary", "-s"],
+        ["--summary", "--fail-fast", "tests"],
+        ["--summary", "--format", "sarif", "tests"],
+    ],
+)
+def test_cli_summary_invalid_options(argv):
+    with pytest.raises(SystemExit):
+        cli_lib.get_args(argv)
@@ -0,0 +1,132 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import analyze_files, cli_lib, code_parser, token_parser
+
+REPO_PATH = Path(__file__).parent.parent.absolute()
+MODULES = sorted((REPO_PATH / "tests").glob("*.py")) + sorted(
+    (REPO_PATH / "docstring_validator").glob("*.py")
+)
+
+SOURCES = {
+    "nested": (
+        "class A:\n"
+        "    class B:\n"
+        "        def f(self):\n"
+        "            def g():\n"
+        "                pass\n"
+        "            return g\n"
+        "\n"
+        "    # trailing comment\n"
+        "\n"
+        "@decorator(lambda: 1)\n"
+        "async def h(x: dict = {'a': 1}) -> 'A':\n"
+        '    """Docstring."""\n'
+        "    if x:\n"
+        "        return (1,\n"
+        "                2)\n"
+        "    # comment after body\n"
+    ),
+    "inline": (
+        "def f(): pass\n"
+        "def g(): 'inline'; pass\n"
+        "class C: x = 1\n"
+        "def h():  # comment\n"
+        "    pass"
+    ),
+    "strings": (
+        "def concatenated():\n"
+        "    ('first '\n"
+        '     "second")\n'
+        "def raw():\n"
+        "    r'''\\d+\n"
+        "        indented'''\n"
+        "def escaped():\n"
+        "    '\\tescaped\\x41'\n"
+        "def formatted():\n"
+        "    f'{1}'\n"
+        "def data():\n"
+        "    b'bytes'\n"
+        "def call():\n"
+        "    'text'.strip()\n"
+        "def comment_first():\n"
+        "    # comment\n"
+        "    '''After comment.'''\n"
+    ),
+    "brackets": (
+        "def f(a=(1,\n"
+        "         2), b=[x for x in 'ab']) -> {1: 2}.get:\n"
+        "    return {\n"
+        "        'key': lambda: None,\n"
+        "    }\n"
+        "\n"
+        "def g(): return\n"
+    ),
+}
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_same_functions_as_ast(name):
+    source = SOURCES[name]
+    expected = code_parser.parse_source(source).functions
+
+    assert token_parser.scan_functions(source) == expected
+
+
+@pytest.mark.parametrize("path", MODULES, ids=lambda path: path.name)
+def test_same_functions_as_ast_in_modules(path):
+    source = path.read_text()
+    expected = code_parser.parse_source(source).functions
+
+    assert token_parser.scan_functions(source) == expected
+    assert token_parser.scan_functions(path.read_bytes()) == expected
+
+
+def test_parser_selection():
+    index = code_parser.parse_source(SOURCES["nested"], "module.py", "tokenize")
+
+    assert index.path == Path("module.py")
+    assert index["h"].qualname == "h"
+    assert index.by_qualname["A.B.f.<locals>.g"].end_lineno == 5
+
+
+@pytest.mark.parametrize(
+    "source", ["def f(:\n", "def f():\npass\n", "def f():\n    '''open\n"]
+)
+def test_fallback_to_ast(source):
+    with pytest.raises(SyntaxError):
+        code_parser.parse_source(source, parser="tokenize")
+
+
+def test_analyze_files_with_tokenize(tmp_path, monkeypatch):
+    (tmp_path / "test_a.py").write_text(SOURCES["nested"] + "def test_a():\n    pass\n")
+    calls = []
+    parse_source = token_parser.parse_source
+
+    def counting_parse(source, py_file=None):
+        calls.append(py_file)
+        return parse_source(source, py_file)
+
+    monkeypatch.setattr(token_parser, "parse_source", counting_parse)
+    expected = analyze_files([tmp_path], r"test_\w+")
+    assert not calls
+
+    assert analyze_files([tmp_path], r"test_\w+", parser="tokenize") == expected
+    assert "E300" in expected[0]
+    assert len(calls) == 1
+
+
+def test_cli_parser(tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text("def test_a():\n    pass\n")
+    argv = [str(module), "-p", r"test_\w+", "--no-cache"]
+    outputs = []
+    for parser in ("ast", "tokenize"):
+        stdout = io.StringIO()
+        assert cli_lib.main(argv + ["--parser", parser], stdout) == 1
+        outputs.append(stdout.getvalue())
+
+    assert "E300" in outputs[0]
+    assert outputs[0] == outputs[1]
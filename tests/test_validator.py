@@ -1,11 +1,19 @@
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Dict, Optional, Union
 
 import pytest
 
+from docstring_validator import docstring_validator
 from docstring_validator.code_parser import get_docstring
 from docstring_validator.diff_util import find_func_names
-from docstring_validator.docstring_validator import _analyze_docstring
+from docstring_validator.docstring_model import Docstring
+from docstring_validator.docstring_validator import (
+    _analyze_docstring,
+    analyze_files,
+    iter_errors,
+)
 
 REPO_PATH = Path(__file__).parent.parent.absolute()
 DATA = REPO_PATH / "tests" / "dummy_module.py"
@@ -28,3 +36,149 @@ DOCSTRINGS = docstrings()
 def test_analyze_docstring(docstring):
     errors = _analyze_docstring(docstring["docstring"])
     assert len(errors) == docstring["errors"]
+
+
+def test_analyze_files_parallel(monkeypatch):
+    paths = [DATA, REPO_PATH / "tests" / "testing.py"]
+    serial = analyze_files(paths, r"test_\w+")
+
+    monkeypatch.setattr(docstring_validator, "PARALLEL_MIN_BYTES", 0)
+    parallel = analyze_files(paths, r"test_\w+", jobs=2)
+
+    assert len(serial) == 5
+    assert parallel == serial
+
+
+def test_analyze_files_parallel_window(monkeypatch, tmp_path):
+    content = (REPO_PATH / "tests" / "testing.py").read_text()
+    for i in range(12):
+        # sizes differ, so pool schedule differs from order of files
+        (tmp_path / f"test_{i:02}.py").write_text("#" * (i % 5) * 100 + "\n" + content)
+    serial = analyze_files([tmp_path], r"test_\w+")
+
+    monkeypatch.setattr(docstring_validator, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(docstring_validator, "PARALLEL_WINDOW", 1)
+    parallel = analyze_files([tmp_path], r"test_\w+", jobs=2)
+
+    assert len(serial) == 12 * 2
+    assert parallel == serial
+
+
+def test_validation_memo():
+    memo = docstring_validator._ValidationMemo(maxsize=2)
+    stats = Counter()
+
+    first = memo.validate("Simple docstring.", stats)
+    second = memo.validate("Simple docstring.", stats)
+    memo.validate("Other docstring.", stats)
+    memo.validate("Another docstring.", stats)
+    memo.validate("Simple docstring.", stats)
+
+    assert [error.code for error in first] == [error.code for error in second]
+    assert first is not second
+    assert stats == Counter(memo_hits=1, memo_misses=4)
+
+
+def test_validation_memo_shared_by_threads():
+    memo = docstring_validator._ValidationMemo(maxsize=1)
+    stats = Counter()
+    memo.validate("First.", stats)
+    threads = []
+
+    class Results(OrderedDict):
+        def get(self, key, default=None):
+            result = super().get(key, default)
+            if result is not None:
+                # another analysis tries to evict the entry before it is moved
+                thread = threading.Thread(
+                    target=memo.validate, args=("Second.", Counter())
+                )
+                thread.start()
+                thread.join(timeout=0.1)
+                threads.append(thread)
+            return result
+
+    memo._results = Results(memo._results)
+    memo.validate("First.", stats)
+    threads[0].join()
+
+    assert stats == Counter(memo_hits=1, memo_misses=1)
+    assert list(memo._results) == [(id(Docstring.schema), "Second.")]
+
+
+def test_validation_memo_disabled():
+    memo = docstring_validator._ValidationMemo(maxsize=0)
+    stats = Counter()
+
+    memo.validate("Simple docstring.", stats)
+    memo.validate("Simple docstring.", stats)
+    assert stats == Counter()
+
+
+def test_iter_errors():
+    records = list(iter_errors([REPO_PATH / "tests" / "testing.py"], r"test_\w+"))
+
+    assert [(record.function, record.code) for record in records] == [
+        ("test_c", "E113"),
+        ("test_missing_docstring", "E300"),
+    ]
+    assert records[0].line == 20
+    assert records[0].end_line == 33
+
+
+def make_modules(tmp_path, count):
+    for i in range(count):
+        (tmp_path / f"test_{i}.py").write_text(
+            "def test_a():\n    pass\n\n\ndef test_b():\n    pass\n"
+        )
+    return [tmp_path]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_max_errors_stops_analysis(tmp_path, monkeypatch, jobs):
+    monkeypatch.setattr(docstring_validator, "PARALLEL_MIN_BYTES", 0)
+    stats = Counter()
+    records = list(
+        iter_errors(
+            make_modules(tmp_path, 5), r"test_\w+", jobs, stats=stats, max_errors=3
+        )
+    )
+
+    assert [(record.path.name, record.function) for record in records] == [
+        ("test_0.py", "test_a"),
+        ("test_0.py", "test_b"),
+        ("test_1.py", "test_a"),
+    ]
+    assert stats["error_limit_reached"] == 1
+    assert stats["files_unchecked"] == 3
+
+
+def test_fail_fast_stops_at_first_function():
+    stats = Counter()
+    records = list(iter_errors([DATA], r"test_\w+", stats=stats, max_errors=1))
+
+    assert len(records) == 1
+    assert stats["files_unchecked"] == 0
+
+
+def test_limited_results_are_not_cached(tmp_path):
+    (tmp_path / "src").mkdir()
+    paths = make_modules(tmp_path / "src", 1)
+    cache_dir = tmp_path / "cache"
+    list(iter_errors(paths, r"test_\w+", cache_dir=cache_dir, max_errors=1))
+
+    stats = Counter()
+    records = list(iter_errors(paths, r"test_\w+", cache_dir=cache_dir, stats=stats))
+    assert len(records) == 2
+    assert stats["cache_misses"] == 1
+
+
+def test_limited_validation_is_not_memoized():
+    memo = docstring_validator._ValidationMemo(maxsize=2)
+    stats = Counter()
+    docstring = DOCSTRINGS["test_BUG1701"]["docstring"]
+
+    assert len(memo.validate(docstring, stats, limit=1)) == 1
+    assert len(memo.validate(docstring, stats)) == 3
+    assert len(memo.validate(docstring, stats, limit=2)) == 2
+    assert stats == Counter(memo_hits=1, memo_misses=2)
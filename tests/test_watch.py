@@ -0,0 +1,114 @@
+import io
+
+from docstring_validator import iter_errors, watch
+
+MISSING = "def test_a():\n    pass\n"
+VALID = '''def test_a():
+    """Summary.
+
+    Test steps:
+    1. A
+
+    Pass criteria:
+    - B
+
+    Fail criteria:
+    - C
+    """
+'''
+
+
+def make_watcher(tmp_path):
+    analyzed = []
+
+    def analyze(files):
+        analyzed.append(sorted(path.name for path in files))
+        return iter_errors(files, r"test_\w+")
+
+    return watch.Watcher([tmp_path], analyze), analyzed
+
+
+def test_update_reports_new_and_fixed_errors(tmp_path):
+    (tmp_path / "test_a.py").write_text(MISSING)
+    (tmp_path / "test_b.py").write_text(VALID)
+    watcher, analyzed = make_watcher(tmp_path)
+
+    new, fixed = watcher.update(watcher.scan())
+    assert [(r.path.name, r.code) for r in new] == [("test_a.py", "E300")]
+    assert fixed == []
+
+    (tmp_path / "test_a.py").write_text(VALID)
+    (tmp_path / "test_c.py").write_text(MISSING)
+    new, fixed = watcher.update(watcher.scan())
+    assert [(r.path.name, r.code) for r in new] == [("test_c.py", "E300")]
+    assert [(r.path.name, r.code) for r in fixed] == [("test_a.py", "E300")]
+
+    (tmp_path / "test_c.py").unlink()
+    new, fixed = watcher.update(watcher.scan())
+    assert new == []
+    assert [(r.path.name, r.code) for r in fixed] == [("test_c.py", "E300")]
+    assert watcher.count() == 0
+
+    # unchanged files are not analyzed again
+    assert analyzed == [["test_a.py", "test_b.py"], ["test_a.py", "test_c.py"]]
+
+
+def test_moved_errors_are_not_reported(tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text(MISSING)
+    watcher, _ = make_watcher(tmp_path)
+    watcher.update(watcher.scan())
+
+    module.write_text("\n\n" + MISSING)
+    new, fixed = watcher.update(watcher.scan())
+    assert (new, fixed) == ([], [])
+    assert watcher.errors[module.resolve()][0].line == 3
+
+
+def test_watch_reports_initial_errors(tmp_path):
+    (tmp_path / "test_a.py").write_text(MISSING)
+    watcher, _ = make_watcher(tmp_path)
+    output = io.StringIO()
+
+    watch.watch(watcher, output, interval=0, debounce=0, checks=0)
+    lines = output.getvalue().splitlines()
+    assert lines[0].endswith("1 new, 0 fixed, 1 issue(s) in total")
+    assert lines[1].startswith("+ ") and "E300" in lines[1]
+
+
+def test_files_which_cannot_be_analyzed_keep_errors(tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text(MISSING)
+    (tmp_path / "test_b.py").write_text(MISSING)
+    watcher, analyzed = make_watcher(tmp_path)
+    watcher.update(watcher.scan())
+    stamp = watcher.stamps[module.resolve()]
+
+    module.write_text("def test_a(:\n")
+    (tmp_path / "test_b.py").write_text(VALID)
+    new, fixed = watcher.update(watcher.scan())
+    assert new == []
+    assert [(r.path.name, r.code) for r in fixed] == [("test_b.py", "E300")]
+    assert watcher.stamps[module.resolve()] == stamp
+    assert [r.code for r in watcher.errors[module.resolve()]] == ["E300"]
+    assert watcher.failures[module.resolve()][1].startswith("SyntaxError")
+
+    # broken version is not analyzed again until modified
+    assert watcher.changes(watcher.scan()) == ([], [])
+
+    module.write_text(VALID)
+    new, fixed = watcher.update(watcher.scan())
+    assert [(r.path.name, r.code) for r in fixed] == [("test_a.py", "E300")]
+    assert watcher.failures == {}
+    assert watcher.count() == 0
+
+
+def test_watch_reports_failures(tmp_path):
+    (tmp_path / "test_a.py").write_text("def test_a(:\n")
+    watcher, _ = make_watcher(tmp_path)
+    output = io.StringIO()
+
+    watch.watch(watcher, output, interval=0, debounce=0, checks=0)
+    lines = output.getvalue().splitlines()
+    assert lines[0].endswith("0 new, 0 fixed, 0 issue(s) in total")
+    assert "test_a.py: cannot be analyzed, SyntaxError" in lines[1]
@@ -0,0 +1,122 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from docstring_validator import cli_lib, writers
+from docstring_validator.validation_error import ErrorRecord
+
+RECORDS = [
+    ErrorRecord(Path("a.py"), "test_a", 1, 3, "E300", "Missing/Empty docstring"),
+    ErrorRecord(Path("a.py"), "test_a", 1, 3, "E211", "Pass section is missing"),
+    ErrorRecord(Path("b <&>.py"), "test_b", 5, None, "E300", "Missing/Empty docstring"),
+]
+
+
+def write(name, records=RECORDS, **kwargs):
+    stream = io.StringIO()
+    writer = writers.get_writer(name, stream, **kwargs)
+    writer.start()
+    for record in records:
+        writer.write(record)
+    writer.finish()
+    return stream.getvalue()
+
+
+def test_text_without_terminal_has_no_colors():
+    lines = write("text").splitlines()
+    assert lines[0] == "Issues found in docstrings by Docstring Validator:"
+    assert lines[2] == "a.py:test_a:1: E300 Missing/Empty docstring"
+    assert "\033" not in write("text")
+
+
+def test_text_colors_can_be_forced():
+    assert "\033[31m" in write("text", colors=True)
+
+
+def test_empty_text_report():
+    assert write("text", []) == ""
+
+
+def test_jsonl():
+    lines = [json.loads(line) for line in write("jsonl").splitlines()]
+    assert lines[0] == dict(
+        path="a.py",
+        function="test_a",
+        line=1,
+        end_line=3,
+        code="E300",
+        text="Missing/Empty docstring",
+    )
+    assert lines[2]["end_line"] is None
+
+
+@pytest.mark.parametrize("records", [RECORDS, []])
+def test_sarif(records):
+    log = json.loads(write("sarif", records))
+    assert log["version"] == "2.1.0"
+    run = log["runs"][0]
+    assert len(run["results"]) == len(records)
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == sorted(
+        {record.code for record in records}
+    )
+
+
+def test_sarif_location():
+    result = json.loads(write("sarif"))["runs"][0]["results"][0]
+    location = result["locations"][0]
+    assert result["ruleId"] == "E300"
+    assert location["physicalLocation"]["artifactLocation"]["uri"] == "a.py"
+    assert location["physicalLocation"]["region"] == dict(startLine=1, endLine=3)
+    assert location["logicalLocations"][0]["name"] == "test_a"
+
+
+@pytest.mark.parametrize("records", [RECORDS, []])
+def test_junit(records):
+    root = ET.fromstring(write("junit", records))
+    suites = root.findall("testsuite")
+    assert [suite.get("name") for suite in suites] == sorted(
+        {str(record.path) for record in records}
+    )
+    if records:
+        case = suites[0].find("testcase")
+        assert case.get("name") == "test_a"
+        assert case.find("failure").get("type") == "E300"
+        assert "E211" in case.find("failure").get("message")
+        assert "a.py:1-3: E300 Missing/Empty docstring" in case.find("failure").text
+        last = suites[1].find("testcase").find("failure")
+        assert last.text == "b <&>.py:5: E300 Missing/Empty docstring"
+
+
+def test_junit_escaping():
+    record = ErrorRecord(Path('a"&<\n>.py'), "test_a", 1, 3, "E300", "a\tb\r\n<c>")
+    root = ET.fromstring(write("junit", [record]))
+    case = root.find("testsuite").find("testcase")
+    assert case.get("classname") == 'a"&<\n>.py'
+    assert case.find("failure").get("message") == "E300 a\tb\r\n<c>"
+    assert "<c>" in case.find("failure").text
+
+
+def test_cli_format(tmp_path):
+    module = tmp_path / "test_a.py"
+    module.write_text("def test_a():\n    pass\n")
+    stdout = io.StringIO()
+    argv = [str(module), "-p", r"test_\w+", "--format", "jsonl", "--no-cache"]
+    code = cli_lib.main(argv, stdout)
+    assert code == 1
+    assert json.loads(stdout.getvalue())["code"] == "E300"
+
+
+def test_cli_fail_fast(tmp_path, capsys):
+    for name in ("test_a.py", "test_b.py"):
+        (tmp_path / name).write_text("def test_a():\n    pass\n")
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = cli_lib.main(
+        [str(tmp_path), "-p", r"test_\w+", "--fail-fast", "--no-cache"], stdout, stderr
+    )
+    assert code == 1
+    assert stdout.getvalue().count("E300") == 1
+    assert "Stopped after 1 error(s), 1 file(s) left unchecked" in stderr.getvalue()